@@ -2,14 +2,17 @@
 # -*- coding: utf-8 -*-
 
 import sys
-import pyergast as f1
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-import re
-import time
+
+# pandas, requests, bs4 and pyergast are imported inside the functions that use them, so that each subcommand (and
+# the usage banner) only pays for the dependencies it needs
 
 # Constants
+
+# Request budget for formula1.com when scraping practice results: sustained requests per second and how many may be
+# sent at once (enough for FP1-FP3 together)
+F1_COM_RATE = 0.5
+F1_COM_BURST = 3
+
 flags = {
         "British": "{{GBR}}",
         "Dutch": "{{NED}}",
@@ -63,73 +66,54 @@ statuses = {
 }
 
 # Helpers
-def find_107_time(time):
-    minute = 0
-    seconds = 0.00
-    returnTime = 0.00
-    RTinMinutes = 0
-
-    try:
-        minute += int(time.split(":")[0])
-        seconds += float(time.split(":")[1])
-    except:
-        pass
-    
-    if (minute > 0):
-        returnTime += 60.00
-        minute -= 1
+def session_ranks(q, sessions=("Q1", "Q2", "Q3")):
+    """
+    Compute each driver's position within every qualifying session from their lap times.
     
-    returnTime += seconds
-    returnTime *= 1.07
+    Parameters:
+    - q: DataFrame - Qualifying results as returned by pyergast.get_qualifying_result
+    - sessions: tuple - The session columns to rank
     
-    while returnTime > 60.00:
-        returnTime -= 60.00
-        RTinMinutes += 1
-
-    TimeString = str(RTinMinutes) + ":" + str(round(returnTime,3))
+    Returns:
+    - DataFrame: One rank column per session aligned with q, NaN for drivers without a time in that session
+    """
+    import pandas as pd
+    from pyergast import laptime
 
-    return TimeString
+    return pd.DataFrame({session: laptime.to_millis(q[session]).astype(float).rank(method="first") for session in sessions}, index=q.index)
 
-def convert_time_differential_to_absolute(base_time, differential):
+def absolute_practice_times(session_data):
     """
-    Convert a time differential (e.g., +0.087s) to an absolute time based on a base time.
+    Convert the differentials in a scraped practice session (e.g. "+0.087s") to absolute lap times.
     
     Parameters:
-    - base_time: str - The base time (e.g., "1:09.890")
-    - differential: str - The time differential (e.g., "+0.087s" or "0.087s")
+    - session_data: dict - Scraped results for one session, keyed by driver name, see scrape_f1_practice_data
     
     Returns:
-    - str: The absolute time
+    - dict: A copy of session_data where every differential time is replaced by the absolute time
     """
-    try:
-        # Clean up the differential (remove + and s)
-        diff_str = differential.replace('+', '').replace('s', '')
-        diff_seconds = float(diff_str)
-        
-        # Parse the base time
-        if ':' in base_time:
-            parts = base_time.split(':')
-            base_minutes = int(parts[0])
-            base_seconds = float(parts[1])
-            base_total_seconds = base_minutes * 60 + base_seconds
-        else:
-            base_total_seconds = float(base_time)
-        
-        # Add the differential
-        absolute_total_seconds = base_total_seconds + diff_seconds
-        
-        # Convert back to mm:ss.sss format
-        absolute_minutes = int(absolute_total_seconds // 60)
-        absolute_seconds = absolute_total_seconds % 60
-        
-        if absolute_minutes > 0:
-            return f"{absolute_minutes}:{absolute_seconds:06.3f}"
-        else:
-            return f"{absolute_seconds:.3f}"
-            
-    except (ValueError, IndexError):
-        # If conversion fails, return the original differential
-        return differential
+    import pandas as pd
+    from pyergast import laptime
+
+    names = list(session_data)
+    times = pd.Series([session_data[name].get('time') for name in names], index=names, dtype=object)
+    positions = pd.to_numeric(pd.Series([session_data[name].get('position') for name in names], index=names, dtype=object), errors='coerce')
+    millis = laptime.to_millis(times)
+    
+    # The fastest time is the classified leader's, or the fastest absolute time if no leader was scraped
+    leader = millis[positions == 1].dropna()
+    fastest = leader.iloc[0] if len(leader) else millis.min()
+    if pd.isna(fastest):
+        return session_data
+    
+    gaps = laptime.is_gap(times)
+    absolute = laptime.format_millis(laptime.to_absolute(fastest, times[gaps])).dropna()
+    return {name: dict(data, time=absolute[name]) if name in absolute.index else data for name, data in session_data.items()}
+
+def format_rank(rank):
+    import pandas as pd
+
+    return "" if pd.isna(rank) else str(int(rank))
 
 def getFlag(flag):
     try: 
@@ -137,6 +121,22 @@ def getFlag(flag):
     except:
         return "{{NoFlag}}"
 
+def emit(lines, out=None):
+    """
+    Join the lines of a rendered table and write them to a stream in a single call.
+    
+    Parameters:
+    - lines: list - The lines of wikitext, without trailing newlines
+    - out: text stream - Where to write the table (e.g. sys.stdout or an open file), or None to only return it
+    
+    Returns:
+    - str: The assembled wikitext
+    """
+    text = "\n".join(lines) + "\n"
+    if out is not None:
+        out.write(text)
+    return text
+
 def get_previous_race(year, race):
     """
     Get the previous race number for comparison.
@@ -177,56 +177,136 @@ def validate_f1_url(url):
     
     return True
 
-def calculate_position_change(current_standings, previous_standings, entity_id, is_driver=True):
+def position_deltas(current, previous, key):
     """
-    Calculate position change for a driver or constructor.
+    Calculate how many places every driver or constructor moved since the previous standings, in one pass.
     
     Parameters:
-    - current_standings: DataFrame of current standings
-    - previous_standings: DataFrame of previous standings (can be None)
-    - entity_id: driver ID or constructor ID
-    - is_driver: True if calculating for driver, False for constructor
+    - current: DataFrame - Current standings
+    - previous: DataFrame - Previous standings (can be None)
+    - key: str - The column identifying each entity (e.g. "driverID" or "constructorID")
     
     Returns:
-    - Formatted position change string (e.g., "{{X}}", "{{+}}1", "{{-}}2")
+    - Series: Places gained (positive) or lost (negative) for each row of current, <NA> if the entity has no previous position
     """
-    if previous_standings is None:
-        return "{{X}}"
+    import pandas as pd
+
+    if previous is None:
+        return pd.Series(pd.NA, index=current.index, dtype="Int64")
     
-    # Find current position
-    current_pos = None
-    if is_driver:
-        current_row = current_standings[current_standings['driverID'] == entity_id]
-    else:
-        current_row = current_standings[current_standings['constructorID'] == entity_id]
+    previous_positions = pd.to_numeric(previous.drop_duplicates(key).set_index(key)['position'], errors='coerce')
+    current_positions = pd.to_numeric(current['position'], errors='coerce')
+    return (current[key].map(previous_positions) - current_positions).astype("Int64")
+
+def format_position_change(delta):
+    """
+    Format a position delta from position_deltas for the standings table.
     
-    if len(current_row) > 0:
-        current_pos = int(current_row.iloc[0]['position'])
+    Returns:
+    - Formatted position change string (e.g., "{{X}}", "{{+}}1", "{{-}}2")
+    """
+    import pandas as pd
+
+    if pd.isna(delta) or delta == 0:
+        return "{{X}}"  # Unchanged, new entry or not classified
+    elif delta > 0:
+        # Moved up (better position = lower number)
+        return "{{+}}" + str(delta)
     else:
-        return "{{X}}"  # Retired/not in current standings
+        # Moved down (worse position = higher number)
+        return "{{-}}" + str(-delta)
+
+
+def is_results_table(text):
+    text = text.lower()
+    return 'pos' in text and ('time' in text or 'gap' in text)
+
+def practice_table_rows(content, use_lxml=True):
+    """
+    Extract the cell texts of the first practice results table on an F1.com results page.
     
-    # Find previous position
-    previous_pos = None
-    if is_driver:
-        previous_row = previous_standings[previous_standings['driverID'] == entity_id]
-    else:
-        previous_row = previous_standings[previous_standings['constructorID'] == entity_id]
+    Uses lxml's C parser when it is installed and falls back to BeautifulSoup, restricted to the page's tables,
+    otherwise. Both match the first table whose text mentions "pos" and "time"/"gap", and stop there. Cell texts
+    follow BeautifulSoup's get_text(strip=True): text pieces are stripped and joined without separators.
     
-    if len(previous_row) > 0:
-        previous_pos = int(previous_row.iloc[0]['position'])
-    else:
-        return "{{X}}"  # New entry
+    Parameters:
+    - content: bytes or str - The HTML of the page
+    - use_lxml: bool - Set to False to force the BeautifulSoup path
     
-    # Calculate difference
-    if current_pos == previous_pos:
-        return "{{X}}"
-    elif current_pos < previous_pos:
-        # Moved up (better position = lower number)
-        return "{{+}}" + str(previous_pos - current_pos)
-    else:
-        # Moved down (worse position = higher number)
-        return "{{-}}" + str(current_pos - previous_pos)
+    Returns:
+    - list: One list of cell texts per table row, or None if the page has no results table
+    """
+    try:
+        import lxml.html
+    except ImportError:
+        use_lxml = False
+    
+    if use_lxml:
+        if not content or not content.strip():
+            return None
+        document = lxml.html.fromstring(content)
+        for table in document.iter('table'):
+            if is_results_table(table.text_content()):
+                return [[''.join(piece.strip() for piece in cell.itertext()) for cell in row.iter('td', 'th')]
+                        for row in table.iter('tr')]
+        return None
+    
+    from bs4 import BeautifulSoup, SoupStrainer
+    soup = BeautifulSoup(content, 'html.parser', parse_only=SoupStrainer('table'))
+    for table in soup.find_all('table'):
+        if is_results_table(table.get_text()):
+            return [[cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])]
+                    for row in table.find_all('tr')]
+    return None
 
+def parse_practice_page(content):
+    """
+    Parse the results of one practice session from its F1.com results page.
+    
+    Parameters:
+    - content: bytes or str - The HTML of the page
+    
+    Returns:
+    - dict: Results keyed by driver name, see practice_results, or None if the page has no results table
+    """
+    rows = practice_table_rows(content)
+    return None if rows is None else practice_results(rows)
+
+def practice_results(rows):
+    """
+    Build the results of one practice session from the cell texts of its results table.
+    
+    Parameters:
+    - rows: list - Cell texts per table row, see practice_table_rows
+    
+    Returns:
+    - dict: Results keyed by driver name, each with position, time, number and team
+    """
+    results = {}
+    for cells in rows:
+        if len(cells) < 5:
+            continue
+        # Extract position, driver number, driver name, team, time
+        position, driver_number, driver_name, team_name, time_value = cells[:5]
+        
+        # Clean up driver name (remove team info if present)
+        if ' ' in driver_name:
+            # Take the first part as driver name
+            driver_name = driver_name.split()[0] + ' ' + driver_name.split()[1]
+        
+        # Clean up time (remove + prefix for gaps)
+        if time_value.startswith('+'):
+            time_value = time_value[1:] + 's'
+        elif time_value and not time_value.startswith('1:'):
+            time_value = time_value + 's'
+        
+        results[driver_name] = {
+            'position': position,
+            'time': time_value,
+            'number': driver_number,
+            'team': team_name
+        }
+    return results
 
 def scrape_f1_practice_data(year, race, custom_race_id=None, custom_race_name=None):
     """
@@ -241,6 +321,13 @@ def scrape_f1_practice_data(year, race, custom_race_id=None, custom_race_name=No
     Returns:
     - dict: Dictionary containing FP1, FP2, FP3 data for each driver
     """
+    from concurrent.futures import ThreadPoolExecutor
+    from urllib.parse import urlsplit
+    import requests
+    import pyergast as f1
+    from pyergast import fixtures
+    from pyergast.ratelimit import limiter
+
     print(f"Attempting to scrape practice data for {year} race {race} from F1.com...")
     
     # F1.com URL structure for practice sessions
@@ -341,78 +428,38 @@ def scrape_f1_practice_data(year, race, custom_race_id=None, custom_race_name=No
         'Upgrade-Insecure-Requests': '1',
     }
     
+    # Fetch all sessions concurrently, politeness towards formula1.com comes from the per-host rate limiter
+    limiter.configure(urlsplit(base_url).netloc, rate=F1_COM_RATE, burst=F1_COM_BURST)
+    
+    def fetch(url):
+        try:
+            return limiter.get(url, session=http, headers=headers, timeout=15)
+        except requests.RequestException as e:
+            return e
+    
     for session, url in session_urls.items():
+        print(f"Attempting to scrape {session} data from: {url}")
+    with fixtures.mount(requests.Session()) as http, ThreadPoolExecutor(max_workers=len(session_urls)) as executor:
+        responses = dict(zip(session_urls, executor.map(fetch, session_urls.values())))
+    
+    for session, response in responses.items():
         try:
-            print(f"Attempting to scrape {session} data from: {url}")
-            response = requests.get(url, headers=headers, timeout=15)
+            if isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                results = parse_practice_page(response.content)
                 
-                # Look for the practice results table
-                tables = soup.find_all('table')
-                
-                for table in tables:
-                    # Check if this table contains practice results
-                    table_text = table.get_text().lower()
-                    if 'pos' in table_text and ('time' in table_text or 'gap' in table_text):
-                        print(f"Found potential practice results table for {session}")
-                        
-                        # Find all rows in the table
-                        rows = table.find_all('tr')
-                        
-                        for row in rows:
-                            cells = row.find_all(['td', 'th'])
-                            if len(cells) >= 4:
-                                try:
-                                    # Extract position, driver number, driver name, team, time, and laps
-                                    position = cells[0].get_text(strip=True)
-                                    driver_number = cells[1].get_text(strip=True)
-                                    
-                                    # Driver name and team are in the same cell with images
-                                    driver_cell = cells[2]
-                                    driver_name = driver_cell.get_text(strip=True)
-                                    
-                                    # Clean up driver name (remove team info if present)
-                                    if ' ' in driver_name:
-                                        # Take the first part as driver name
-                                        driver_name = driver_name.split()[0] + ' ' + driver_name.split()[1]
-                                    
-                                    team_cell = cells[3]
-                                    team_name = team_cell.get_text(strip=True)
-                                    
-                                    time_cell = cells[4]
-                                    time_value = time_cell.get_text(strip=True)
-                                    
-                                    # Clean up time (remove + prefix for gaps)
-                                    if time_value.startswith('+'):
-                                        time_value = time_value[1:] + 's'
-                                    elif time_value and not time_value.startswith('1:'):
-                                        time_value = time_value + 's'
-                                    
-                                    practice_data[session][driver_name] = {
-                                        'position': position,
-                                        'time': time_value,
-                                        'number': driver_number,
-                                        'team': team_name
-                                    }
-                                    
-                                    print(f"Found {driver_name}: P{position}, {time_value}")
-                                    
-                                except (IndexError, AttributeError) as e:
-                                    print(f"Error parsing row: {str(e)}")
-                                    continue
-                        
-                        # Found the table, break out of table loop
-                        break
+                if results is not None:
+                    print(f"Found potential practice results table for {session}")
+                    for driver_name, data in results.items():
+                        print(f"Found {driver_name}: P{data['position']}, {data['time']}")
+                    practice_data[session] = results
                 else:
                     print(f"No practice results table found for {session}")
                     
             else:
                 print(f"Failed to fetch {session} data: HTTP {response.status_code}")
-                
-            # Be respectful with requests
-            time.sleep(2)
             
         except Exception as e:
             print(f"Error scraping {session}: {str(e)}")
@@ -494,69 +541,78 @@ def get_practice_data_from_f1_com(year, race):
 
 
 # Grid
+def render_grid(qualifyingResults, out=None):
+    """
+    Render the starting grid for F1 Wiki.
+    
+    Parameters:
+    - qualifyingResults: list - Qualifying results as dicts, see pyergast.records.qualifying_results
+      (use DataFrame.to_dict("records") for a pyergast DataFrame)
+    - out: text stream - Where to write the table, or None to only return it
+    
+    Returns:
+    - str: The assembled wikitext
+    """
+    lines = []
+    lines.append("===Grid===")
+    lines.append('<div class="mw-customtoggle-Grid wds-button wds-is-secondary">Show Grid</div>')
+    lines.append('<div class="mw-collapsible mw-collapsed" id="mw-customcollapsible-Grid">')
+    lines.append("{{Grid/2-2/34r")
+    for col in qualifyingResults:
+        name=col['driver']
+        number=col['number']
+        last_name=name.split(" ").pop()
+
+        driver = '| ' + getFlag(col['nationality']) + ' ' + number + '.' + ' [[' + name + '|' + last_name + ']]' 
+        lines.append(driver)
+    else:
+        lines.append("}}</div>")
+    return emit(lines, out)
+
 def grid(year=None, race=None):
+    # The grid only needs a few fields per driver, so skip pandas entirely
+    from pyergast import records
+
     try:
-        qualifyingResults=f1.get_qualifying_result(year, race)
+        qualifyingResults=records.qualifying_results(year, race)
     except:
         print("No data available.")
         return False
+    if not qualifyingResults:
+        # Qualifying not published yet
+        print("No data available.")
+        return False
 
-    print("===Grid===")
-    print('<div class="mw-customtoggle-Grid wds-button wds-is-secondary">Show Grid</div>')
-    print('<div class="mw-collapsible mw-collapsed" id="mw-customcollapsible-Grid">')
-    print("{{Grid/2-2/34r")
-    for row in range(len(qualifyingResults)):
-        col=qualifyingResults.iloc[row,:]
-        name=col.iloc[3]
-        number=col.iloc[0]
-        last_name=name.split(" ").pop()
-
-        driver = '| ' + getFlag(col.iloc[4]) + ' ' + number + '.' + ' [[' + name + '|' + last_name + ']]' 
-        print(driver)
-    else:
-        print("}}</div>")
+    render_grid(qualifyingResults, out=sys.stdout)
     return
 
 # Qualifying
-def qualifying(year=None, race=None):
-    try:
-        q=f1.get_qualifying_result(year, race)
-    except:
-        print("No data available.")
-        return False
+def render_qualifying(q, out=None):
+    import pandas as pd
+    from pyergast import laptime
 
-    sort_Q1=q.sort_values(by=['Q1'])
-    # Filter out empty/NaN Q2 times before sorting for Q2 ranking
-    q_with_q2 = q[q['Q2'].notna() & (q['Q2'] != '') & (q['Q2'] != 'nan')]
-    sort_Q2=q_with_q2.sort_values(by=['Q2'])
-    fastestQ1 = None
-    
+    lines = []
     total_drivers = len(q)
     q3_count = min(10, total_drivers)
     q2_elim_count = max(0, (total_drivers - q3_count) // 2)
     q1_elim_count = max(0, total_drivers - q3_count - q2_elim_count)
 
+    # Rank every driver within each session once, then look positions up by row
+    ranks = session_ranks(q)
+    q1_ranks = ranks['Q1'].to_numpy()
+    q2_ranks = ranks['Q2'].to_numpy()
+
     # Find driver number with fastest time in Q1 & Q2
     fastestQ1 = None
-    for y in range(len(sort_Q1)):
-        q1 = sort_Q1.iloc[y,:]
-        if pd.notna(q1.iloc[7]) and str(q1.iloc[7]) != "nan" and str(q1.iloc[7]) != "":
-            fastestQ1 = q1.iloc[0]
-            break
+    OneZeroSeven = None
+    if (ranks['Q1'] == 1).any():
+        fastest = q[ranks['Q1'] == 1].iloc[0]
+        fastestQ1 = fastest['number']
+        OneZeroSeven = laptime.format_millis(laptime.percent_of(laptime.to_millis(fastest['Q1']), 107))
 
     fastestQ2 = None
-    for x in range(len(sort_Q2)):
-        q2 = sort_Q2.iloc[x,:]
-        if pd.notna(q2.iloc[8]) and str(q2.iloc[8]) != "nan" and str(q2.iloc[8]) != "":
-            fastestQ2 = q2.iloc[0]
-            break
-
-    OneZeroSeven = None
-    for row in range(total_drivers):
-        col = q.iloc[row,:]
-        if col.iloc[0] == fastestQ1:
-            OneZeroSeven = str(col.iloc[7])
-            break
+    if (ranks['Q2'] == 1).any():
+        fastestQ2 = q[ranks['Q2'] == 1].iloc[0]['number']
 
     # Print table header
     header_str = """===Qualifying Results===
@@ -581,7 +637,7 @@ The full qualifying results for the '''{{PAGENAME}}''' are outlined below:
 ! width=9% | Time
 ! width=4% | <span style="cursor:help" title="Position">Pos.</span>
 ! width=9% | Time""".replace("rowspan=26", f"rowspan={total_drivers + 6}")
-    print(header_str)
+    lines.append(header_str)
 
     for row in range(total_drivers):
         # Get and assign data
@@ -599,96 +655,96 @@ The full qualifying results for the '''{{PAGENAME}}''' are outlined below:
 
         # Print table body
         if (row == q3_count or row == q3_count + q2_elim_count):
-            print('|-\n|colspan=14 style="border-bottom:hidden"|\n|-\n|colspan=14|\n|-')
+            lines.append('|-\n|colspan=14 style="border-bottom:hidden"|\n|-\n|colspan=14|\n|-')
         else:
-            print("|-")
+            lines.append("|-")
 
-        print("! " + pos)
-        print("| align=center | " + number)
-        print("| " + driver)
-        print("| " + team)
+        lines.append("! " + pos)
+        lines.append("| align=center | " + number)
+        lines.append("| " + driver)
+        lines.append("| " + team)
 
         # Q1
         if (row >= q3_count + q2_elim_count): # Q1 position locked
-            print("! " + pos)
-        else: # Calculate position for P15+
-            for y in range(0,len(sort_Q1)):
-                q1=sort_Q1.iloc[y,:]
-                if (q1.iloc[0] == number):
-                    print("! " + str(1+y))
+            lines.append("! " + pos)
+        else: # Position within Q1 for P15+
+            lines.append("! " + format_rank(q1_ranks[row]))
 
         # 107% time
         if (fastestQ1 == number):
-            print("| '''" + str(col.iloc[7]) + "'''")
+            lines.append("| '''" + str(col.iloc[7]) + "'''")
         else:
-            print("| " + str(col.iloc[7]))
+            lines.append("| " + str(col.iloc[7]))
         
         # Q2
         if (row < q3_count + q2_elim_count):
             if (row >= q3_count): # Q2 position locked
-                print("! " + pos)
-            else: # Calculate position for P10+
-                for x in range(0,len(sort_Q2)):
-                    q2=sort_Q2.iloc[x,:]
-                    if (q2.iloc[0] == number):
-                        print("! " + str(1+x))
+                lines.append("! " + pos)
+            else: # Position within Q2 for P10+
+                lines.append("! " + format_rank(q2_ranks[row]))
 
             q2_time = col.iloc[8]
             if (pd.notna(q2_time) and str(q2_time) != "nan" and str(q2_time) != ""):
                 if (fastestQ2 == number):
-                    print("| '''" + str(q2_time) + "'''")
+                    lines.append("| '''" + str(q2_time) + "'''")
                 else:
-                    print("| " + str(q2_time))
+                    lines.append("| " + str(q2_time))
             else:
-                print("| ")
+                lines.append("| ")
         elif (row == q3_count + q2_elim_count):
-            print(f'! rowspan="{q1_elim_count}" |')
-            print(f'| rowspan="{q1_elim_count}" |')
-            print(f'! rowspan="{q1_elim_count}" |')
-            print(f'| rowspan="{q1_elim_count}" |')
+            lines.append(f'! rowspan="{q1_elim_count}" |')
+            lines.append(f'| rowspan="{q1_elim_count}" |')
+            lines.append(f'! rowspan="{q1_elim_count}" |')
+            lines.append(f'| rowspan="{q1_elim_count}" |')
 
         # Q3
         if (row < q3_count):
-            print("! " + pos)
+            lines.append("! " + pos)
             q3_time = col.iloc[9]
             if (pd.notna(q3_time) and str(q3_time) != "nan" and str(q3_time) != ""):
                 if (row == 0):
-                    print("| '''" + str(q3_time) + "'''")
+                    lines.append("| '''" + str(q3_time) + "'''")
                 else:
-                    print("| " + str(q3_time))
+                    lines.append("| " + str(q3_time))
             else:
-                print("| ")
+                lines.append("| ")
         elif (row == q3_count):
-            print(f'! rowspan="{q2_elim_count}" |')
-            print(f'| rowspan="{q2_elim_count}" |')
+            lines.append(f'! rowspan="{q2_elim_count}" |')
+            lines.append(f'| rowspan="{q2_elim_count}" |')
 
         # Grid
-        print("! " + pos)
+        lines.append("! " + pos)
 
-    print("|-")
-    print("! colspan=14 | [[107% Time]]: " + find_107_time(OneZeroSeven))
-    print("|-")
-    print("! colspan=14 | Source:<ref name=QR>[https://www.fia.com/system/files/decision-document/{{lc:{{PAGENAMEE}}}}_-_final_qualifying_classification.pdf {{PAGENAME}} - Final Qualifying Classification] (PDF). Fédération Internationale de l'Automobile.</ref>")
-    print("|}")
-    print("*'''Bold''' indicates the fastest driver's time in each session.")
+    lines.append("|-")
+    lines.append("! colspan=14 | [[107% Time]]: " + str(OneZeroSeven or ""))
+    lines.append("|-")
+    lines.append("! colspan=14 | Source:<ref name=QR>[https://www.fia.com/system/files/decision-document/{{lc:{{PAGENAMEE}}}}_-_final_qualifying_classification.pdf {{PAGENAME}} - Final Qualifying Classification] (PDF). Fédération Internationale de l'Automobile.</ref>")
+    lines.append("|}")
+    lines.append("*'''Bold''' indicates the fastest driver's time in each session.")
 
-    return
+    return emit(lines, out)
+
+def qualifying(year=None, race=None):
+    import pyergast as f1
 
-# Race
-def race(year = None, race = None, sprint = None):
     try:
-        if (sprint):
-            data = f1.get_sprint_result(year, race)
-        else:
-            data = f1.get_race_result(year, race)
+        q=f1.get_qualifying_result(year, race)
     except:
         print("No data available.")
         return False
 
+    render_qualifying(q, out=sys.stdout)
+    return
+
+# Race
+def render_race(data, sprint=None, out=None):
+    import pandas as pd
+
+    lines = []
     if (sprint):
-        print("""===Sprint Results===\nThe full Sprint results for the '''{{PAGENAME}}''' are outlined below:\n{| class="wikitable"\n! <span style="cursor:help;" title=" Position">Pos.</span>\n! <span style="cursor:help;" title=" Car number">No.</span>\n! Driver\n! Constructor\n! <span style="cursor:help;" title=" Laps completed">Laps</span>\n! <span style="cursor:help;" title=" Time for winner, time or number laps behind leader or reason for retirement">Time/Retired</span>\n! <span style="cursor:help;" title=" Grid position">Grid</span>\n! <span style="cursor:help;" title=" Points gained from race">Points</span>""")
+        lines.append("""===Sprint Results===\nThe full Sprint results for the '''{{PAGENAME}}''' are outlined below:\n{| class="wikitable"\n! <span style="cursor:help;" title=" Position">Pos.</span>\n! <span style="cursor:help;" title=" Car number">No.</span>\n! Driver\n! Constructor\n! <span style="cursor:help;" title=" Laps completed">Laps</span>\n! <span style="cursor:help;" title=" Time for winner, time or number laps behind leader or reason for retirement">Time/Retired</span>\n! <span style="cursor:help;" title=" Grid position">Grid</span>\n! <span style="cursor:help;" title=" Points gained from race">Points</span>""")
     else:
-        print("""===Results===\nThe full race results for the '''{{PAGENAME}}''' are outlined below:\n{| class="wikitable"\n! <span style="cursor:help;" title=" Position">Pos.</span>\n! <span style="cursor:help;" title=" Car number">No.</span>\n! Driver\n! Constructor\n! <span style="cursor:help;" title=" Laps completed">Laps</span>\n! <span style="cursor:help;" title=" Time for winner, time or number laps behind leader or reason for retirement">Time/Retired</span>\n! <span style="cursor:help;" title=" Grid position">Grid</span>\n! <span style="cursor:help;" title=" Points gained from race">Points</span>""")
+        lines.append("""===Results===\nThe full race results for the '''{{PAGENAME}}''' are outlined below:\n{| class="wikitable"\n! <span style="cursor:help;" title=" Position">Pos.</span>\n! <span style="cursor:help;" title=" Car number">No.</span>\n! Driver\n! Constructor\n! <span style="cursor:help;" title=" Laps completed">Laps</span>\n! <span style="cursor:help;" title=" Time for winner, time or number laps behind leader or reason for retirement">Time/Retired</span>\n! <span style="cursor:help;" title=" Grid position">Grid</span>\n! <span style="cursor:help;" title=" Points gained from race">Points</span>""")
 
     for x in range(0,len(data)):
         y=data.iloc[x,:]
@@ -714,194 +770,373 @@ def race(year = None, race = None, sprint = None):
         status=y[11]
         time=y[12]
 
-        print("|-")
+        lines.append("|-")
         
         try:
-            print("! " + statuses[pos])
+            lines.append("! " + statuses[pos])
         except KeyError:
-            print("! " + pos)
+            lines.append("! " + pos)
 
-        print("| align=center | " + number)
-        print("| " + driver)
-        print("| " + team)
-        print("| " + laps)
+        lines.append("| align=center | " + number)
+        lines.append("| " + driver)
+        lines.append("| " + team)
+        lines.append("| " + laps)
 
         if (pd.isna(time)):
-            print("| " + status)
+            lines.append("| " + status)
         else:
-            print("| " + time['time'])
+            lines.append("| " + time['time'])
 
-        print("| " + grid)
+        lines.append("| " + grid)
         # fastest lap points
         if (sprint == None):
             if (points != '0'):
                 if (points == '26') or (points == '19') or (points == '16') or (points == '13') or (points == '11') or (points == '9') or (points == '7') or (points == '5') or (points == '3'):
-                    print("! " + points + "<sup>{{abbr|[[Fastest Lap|FL]]|+1 point for achieving the fastest lap}}</sup>")
+                    lines.append("! " + points + "<sup>{{abbr|[[Fastest Lap|FL]]|+1 point for achieving the fastest lap}}</sup>")
                 elif (points == '2') and (pos == '10'):
-                    print("! " + points + "<sup>{{abbr|[[Fastest Lap|FL]]|+1 point for achieving the fastest lap}}</sup>")
+                    lines.append("! " + points + "<sup>{{abbr|[[Fastest Lap|FL]]|+1 point for achieving the fastest lap}}</sup>")
                 else:
-                    print("! " + points)
+                    lines.append("! " + points)
         else:
             if (points != '0'):
-                print("! " + points)
+                lines.append("! " + points)
 
         # add blanks in points column: positions below top-10 (top-8 for Sprint) don't score points
         if (sprint):
             if (x == 8):
-                print(f"! rowspan={len(data) - 8} |")
+                lines.append(f"! rowspan={len(data) - 8} |")
         else:
             if (x == 10):
-                print(f"! rowspan={len(data) - 10} |")
+                lines.append(f"! rowspan={len(data) - 10} |")
 
-    print('|-')
+    lines.append('|-')
     if (sprint):
-        print('''! colspan="8" | Source:<ref name="SR">[https://www.fia.com/system/files/decision-document/{{lc:{{PAGENAMEE}}}}_-_final_sprint_classification.pdf {{PAGENAME}} - Final Sprint Classification] (PDF). Fédération Internationale de l'Automobile.</ref>''')
+        lines.append('''! colspan="8" | Source:<ref name="SR">[https://www.fia.com/system/files/decision-document/{{lc:{{PAGENAMEE}}}}_-_final_sprint_classification.pdf {{PAGENAME}} - Final Sprint Classification] (PDF). Fédération Internationale de l'Automobile.</ref>''')
     else:
-        print('''! colspan="8" | Source:<ref name="RR">[https://www.fia.com/system/files/decision-document/{{lc:{{PAGENAMEE}}}}_-_final_race_classification.pdf {{PAGENAME}} - Final Race Classification] (PDF). Fédération Internationale de l'Automobile.</ref>''')
-    print('|}')
+        lines.append('''! colspan="8" | Source:<ref name="RR">[https://www.fia.com/system/files/decision-document/{{lc:{{PAGENAMEE}}}}_-_final_race_classification.pdf {{PAGENAME}} - Final Race Classification] (PDF). Fédération Internationale de l'Automobile.</ref>''')
+    lines.append('|}')
 
-    return
+    return emit(lines, out)
+
+def race(year = None, race = None, sprint = None):
+    import pyergast as f1
 
-# Standings
-def standings(year=None, race=None):
     try:
-        ds=f1.driver_standings(year, race)
-        cs=f1.constructor_standings(year, race)
+        if (sprint):
+            data = f1.get_sprint_result(year, race)
+        else:
+            data = f1.get_race_result(year, race)
     except:
         print("No data available.")
         return False
 
-    # Get previous race standings for comparison
-    previous_race = get_previous_race(year, race)
-    previous_ds = None
-    previous_cs = None
-    
-    if previous_race is not None:
-        try:
-            previous_ds = f1.driver_standings(year, previous_race)
-            previous_cs = f1.constructor_standings(year, previous_race)
-        except:
-            # If we can't get previous race data, we'll use None (which will show "NEW")
-            pass
+    render_race(data, sprint, out=sys.stdout)
+    return
 
+# Standings
+def render_standings(ds, cs, previous_ds=None, previous_cs=None, out=None):
+    lines = []
     # start table for drivers
-    print("==Standings==\n")
-    print("{{Col-begin}}")
-    print("{{Col-2}}")
-    print('{|class="wikitable" style="width:88%"')
-    print("! colspan=4|Drivers' World Championship")
-    print("|-")
-    print('! <span style="cursor:help" title="Position">Pos.</span>')
-    print("! Driver")
-    print('! <span style="cursor:help" title="Points">Pts.</span>')
-    print("! +/-")
+    lines.append("==Standings==\n")
+    lines.append("{{Col-begin}}")
+    lines.append("{{Col-2}}")
+    lines.append('{|class="wikitable" style="width:88%"')
+    lines.append("! colspan=4|Drivers' World Championship")
+    lines.append("|-")
+    lines.append('! <span style="cursor:help" title="Position">Pos.</span>')
+    lines.append("! Driver")
+    lines.append('! <span style="cursor:help" title="Points">Pts.</span>')
+    lines.append("! +/-")
     
     # display driver standings
+    driver_deltas = position_deltas(ds, previous_ds, 'driverID')
     for x in range(0,len(ds)):
         y=ds.iloc[x,:]
         pos=y[1]
         pts=y[2]
-        driver_id=y[4]  # driverID column
         try:
             driver=flags[y[6]] + ' [[' + y[5] + ']]'
         except KeyError:
             driver='[[' + y[5] + ']]'
         
         # Calculate position change
-        pos_change = calculate_position_change(ds, previous_ds, driver_id, is_driver=True)
+        pos_change = format_position_change(driver_deltas.iloc[x])
         
-        print("|-")
+        lines.append("|-")
         if (pos == '1'):
-            print("| {{1st}}")
-            print("| '''" + driver + "'''")
-            print("| '''" + pts + "'''")
-            print("| " + pos_change)
+            lines.append("| {{1st}}")
+            lines.append("| '''" + driver + "'''")
+            lines.append("| '''" + pts + "'''")
+            lines.append("| " + pos_change)
         elif (pos == '2'):
-            print("| {{2nd}}")
-            print("| " + driver)
-            print("| " + pts)
-            print("| " + pos_change)
+            lines.append("| {{2nd}}")
+            lines.append("| " + driver)
+            lines.append("| " + pts)
+            lines.append("| " + pos_change)
         elif (pos == '3'):
-            print("| {{3rd}}")
-            print("| " + driver)
-            print("| " + pts)
-            print("| " + pos_change)
+            lines.append("| {{3rd}}")
+            lines.append("| " + driver)
+            lines.append("| " + pts)
+            lines.append("| " + pos_change)
         elif (pos == '21'):
-            print("| " + pos + "st")
-            print("| " + driver)
-            print("| " + pts)
-            print("| " + pos_change)
+            lines.append("| " + pos + "st")
+            lines.append("| " + driver)
+            lines.append("| " + pts)
+            lines.append("| " + pos_change)
         elif (pos == '22'):
-            print("| " + pos + "nd")
-            print("| " + driver)
-            print("| " + pts)
-            print("| " + pos_change)
+            lines.append("| " + pos + "nd")
+            lines.append("| " + driver)
+            lines.append("| " + pts)
+            lines.append("| " + pos_change)
         elif (pos == '23'):
-            print("| " + pos + "rd")
-            print("| " + driver)
-            print("| " + pts)
-            print("| " + pos_change)
+            lines.append("| " + pos + "rd")
+            lines.append("| " + driver)
+            lines.append("| " + pts)
+            lines.append("| " + pos_change)
         else:    
-            print("| " + pos + "th")
-            print("| " + driver)
-            print("| " + pts)
-            print("| " + pos_change)
+            lines.append("| " + pos + "th")
+            lines.append("| " + driver)
+            lines.append("| " + pts)
+            lines.append("| " + pos_change)
 
     # end table
-    print("|}")
+    lines.append("|}")
 
     # start table for constructors
-    print("{{Col-2}}")
-    print('{|class="wikitable" style="width:85%"')
-    print("! colspan=4|Constructors' World Championship")
-    print("|-")
-    print('! <span style="cursor:help" title="Position">Pos.</span>')
-    print("! Team")
-    print('! <span style="cursor:help" title="Points">Pts.</span>')
-    print("! +/-")
+    lines.append("{{Col-2}}")
+    lines.append('{|class="wikitable" style="width:85%"')
+    lines.append("! colspan=4|Constructors' World Championship")
+    lines.append("|-")
+    lines.append('! <span style="cursor:help" title="Position">Pos.</span>')
+    lines.append("! Team")
+    lines.append('! <span style="cursor:help" title="Points">Pts.</span>')
+    lines.append("! +/-")
 
     # display constructor standings
+    constructor_deltas = position_deltas(cs, previous_cs, 'constructorID')
     for x in range(0,len(cs)):
         z=cs.iloc[x,:]
         pos=z[1]
         pts=z[2]
-        constructor_id=z[4]  # constructorID column
         try:
             team=constructors[z[4]]
         except KeyError:
             team='{{' + y[5] + '-CON}}'
         
         # Calculate position change
-        pos_change = calculate_position_change(cs, previous_cs, constructor_id, is_driver=False)
+        pos_change = format_position_change(constructor_deltas.iloc[x])
         
-        print("|-")
+        lines.append("|-")
         if (pos == '1'):
-            print("| {{1st}}")
-            print("| '''" + team + "'''")
-            print("| '''" + pts + "'''")
-            print("| " + pos_change)
+            lines.append("| {{1st}}")
+            lines.append("| '''" + team + "'''")
+            lines.append("| '''" + pts + "'''")
+            lines.append("| " + pos_change)
         elif (pos == '2'):
-            print("| {{2nd}}")
-            print("| " + team)
-            print("| " + pts)
-            print("| " + pos_change)
+            lines.append("| {{2nd}}")
+            lines.append("| " + team)
+            lines.append("| " + pts)
+            lines.append("| " + pos_change)
         elif (pos == '3'):
-            print("| {{3rd}}")
-            print("| " + team)
-            print("| " + pts)
-            print("| " + pos_change)
+            lines.append("| {{3rd}}")
+            lines.append("| " + team)
+            lines.append("| " + pts)
+            lines.append("| " + pos_change)
         else:    
-            print("| " + pos + "th")
-            print("| " + team)
-            print("| " + pts)
-            print("| " + pos_change)
+            lines.append("| " + pos + "th")
+            lines.append("| " + team)
+            lines.append("| " + pts)
+            lines.append("| " + pos_change)
 
     # end table
-    print("|}")
-    print("{{Col-end}}")
+    lines.append("|}")
+    lines.append("{{Col-end}}")
+    return emit(lines, out)
+
+def standings(year=None, race=None):
+    from pyergast import aio
+
+    # Fetch current and previous race standings concurrently
+    previous_race = get_previous_race(year, race)
+    queries = [aio.driver_standings(year, race), aio.constructor_standings(year, race)]
+    if previous_race is not None:
+        queries += [aio.driver_standings(year, previous_race), aio.constructor_standings(year, previous_race)]
+    results = aio.run(*queries, return_exceptions=True)
+
+    ds, cs = results[0], results[1]
+    if isinstance(ds, Exception) or isinstance(cs, Exception):
+        print("No data available.")
+        return False
+
+    # If we can't get previous race data, we'll use None (which will show "{{X}}")
+    previous_ds = None
+    previous_cs = None
+    if previous_race is not None:
+        if not isinstance(results[2], Exception):
+            previous_ds = results[2]
+        if not isinstance(results[3], Exception):
+            previous_cs = results[3]
+
+    render_standings(ds, cs, previous_ds, previous_cs, out=sys.stdout)
     return
 
 # Practice
+def render_practice(drivers, quali_results, practice_data, out=None):
+    """
+    Render the practice results table for F1 Wiki.
+    
+    Parameters:
+    - drivers: DataFrame - Drivers entered for the race, sorted by car number
+    - quali_results: DataFrame - Qualifying results used for team information (can be None)
+    - practice_data: dict - Scraped FP1, FP2, FP3 data for each driver, see scrape_f1_practice_data
+    - out: text stream - Where to write the table, or None to only return it
+    
+    Returns:
+    - str: The assembled wikitext
+    """
+    import pandas as pd
+
+    lines = []
+    lines.append("===Practice Results===")
+    lines.append("The full practice results for the '''{{PAGENAME}}''' are outlined below:\n")
+    lines.append('{| class="hidden wikitable sortable" style="width:100%"')
+    lines.append('! rowspan="2" |<span style="cursor:help;" title="Car number">No.</span>!! rowspan="2" class="unsortable" |Driver!! rowspan="2" class="unsortable" |Team!! colspan="2" class="unsortable" |FP1 !! colspan="2" class="unsortable" |FP2 !! colspan="2" class="unsortable" |FP3')
+    lines.append("|-")
+    lines.append("!Time!!Pos!!Time!!Pos!!Time!!Pos")
+
+    # Convert each session's differentials to absolute times against the fastest lap in one pass
+    if practice_data:
+        practice_data = {session: absolute_practice_times(data) if data else data for session, data in practice_data.items()}
+    
+    # Display practice results for each driver
+    for _, driver in drivers.iterrows():
+        driver_number = int(driver['permanentNumber']) if pd.notna(driver['permanentNumber']) else 0
+        driver_name = driver['givenName'] + ' ' + driver['familyName']
+        nationality = driver['nationality']
+        
+        # Get team information from qualifying results if available
+        team = "{{Team-Placeholder}}"
+        if quali_results is not None:
+            # Find the driver in qualifying results
+            driver_quali = quali_results[quali_results['driverID'] == driver['driverId']]
+            if len(driver_quali) > 0:
+                constructor_id = driver_quali.iloc[0]['constructorID']
+                try:
+                    team = constructors[constructor_id]
+                except KeyError:
+                    team = '{{' + constructor_id + '-CON}}'
+        
+        lines.append("|-")
+        lines.append("! " + str(driver_number))
+        lines.append("| " + getFlag(nationality) + " [[" + driver_name + "]]")
+        lines.append("| " + team)
+        
+        # Display practice data if available, otherwise show DNP
+        if practice_data and (practice_data.get('FP1') or practice_data.get('FP2') or practice_data.get('FP3')):
+            # Create a mapping from scraped driver names to API driver names
+            driver_name_mapping = {
+                'LandoNorrisNOR': 'Lando Norris',
+                'OscarPiastriPIA': 'Oscar Piastri', 
+                'CharlesLeclercLEC': 'Charles Leclerc',
+                'IsackHadjarHAD': 'Isack Hadjar',
+                'LewisHamiltonHAM': 'Lewis Hamilton',
+                'OliverBearmanBEA': 'Oliver Bearman',
+                'KimiAntonelliANT': 'Andrea Kimi Antonelli',
+                'GeorgeRussellRUS': 'George Russell',
+                'MaxVerstappenVER': 'Max Verstappen',
+                'LanceStrollSTR': 'Lance Stroll',
+                'AlexanderAlbonALB': 'Alexander Albon',
+                'EstebanOconOCO': 'Esteban Ocon',
+                'PierreGaslyGAS': 'Pierre Gasly',
+                'LiamLawsonLAW': 'Liam Lawson',
+                'CarlosSainzSAI': 'Carlos Sainz',
+                'YukiTsunodaTSU': 'Yuki Tsunoda',
+                'FrancoColapintoCOL': 'Franco Colapinto',
+                'GabrielBortoletoBOR': 'Gabriel Bortoleto',
+                'FernandoAlonsoALO': 'Fernando Alonso',
+                'NicoHulkenbergHUL': 'Nico Hülkenberg'
+            }
+            
+            # Try to find driver data using the mapping
+            fp1_data = None
+            fp2_data = None
+            fp3_data = None
+            
+            # Try exact match first, then try mapping
+            if driver_name in practice_data.get('FP1', {}):
+                fp1_data = practice_data['FP1'][driver_name]
+            elif driver_name.replace(' ', '') in practice_data.get('FP1', {}):
+                fp1_data = practice_data['FP1'][driver_name.replace(' ', '')]
+            else:
+                # Try mapping
+                for scraped_name, api_name in driver_name_mapping.items():
+                    if api_name == driver_name and scraped_name in practice_data.get('FP1', {}):
+                        fp1_data = practice_data['FP1'][scraped_name]
+                        break
+            
+            if driver_name in practice_data.get('FP2', {}):
+                fp2_data = practice_data['FP2'][driver_name]
+            elif driver_name.replace(' ', '') in practice_data.get('FP2', {}):
+                fp2_data = practice_data['FP2'][driver_name.replace(' ', '')]
+            else:
+                # Try mapping
+                for scraped_name, api_name in driver_name_mapping.items():
+                    if api_name == driver_name and scraped_name in practice_data.get('FP2', {}):
+                        fp2_data = practice_data['FP2'][scraped_name]
+                        break
+            
+            if driver_name in practice_data.get('FP3', {}):
+                fp3_data = practice_data['FP3'][driver_name]
+            elif driver_name.replace(' ', '') in practice_data.get('FP3', {}):
+                fp3_data = practice_data['FP3'][driver_name.replace(' ', '')]
+            else:
+                # Try mapping
+                for scraped_name, api_name in driver_name_mapping.items():
+                    if api_name == driver_name and scraped_name in practice_data.get('FP3', {}):
+                        fp3_data = practice_data['FP3'][scraped_name]
+                        break
+            
+            # FP1
+            if fp1_data:
+                time = fp1_data.get('time', 'No Time')
+                pos = fp1_data.get('position', 'N/A')
+                
+                lines.append("| " + time)
+                lines.append("| align=center | " + pos)
+            else:
+                lines.append("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
+            
+            # FP2
+            if fp2_data:
+                time = fp2_data.get('time', 'No Time')
+                pos = fp2_data.get('position', 'N/A')
+                
+                lines.append("| " + time)
+                lines.append("| align=center | " + pos)
+            else:
+                lines.append("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
+            
+            # FP3
+            if fp3_data:
+                time = fp3_data.get('time', 'No Time')
+                pos = fp3_data.get('position', 'N/A')
+                
+                lines.append("| " + time)
+                lines.append("| align=center | " + pos)
+            else:
+                lines.append("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
+        else:
+            # No practice data available, show DNP for all sessions
+            lines.append("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
+            lines.append("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
+            lines.append("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
+    
+    lines.append("|-")
+    lines.append('! colspan="14" style="text-align:center" |\'\'\'Source:\'\'\' <ref name="P1">[https://www.fia.com/system/files/decision-document/{{lc: {{PAGENAMEE}}}}_-_free_practice_1_classification.pdf {{PAGENAME}} - FP1 Classification] (PDF). Fédération Internationale de l\'Automobile.</ref><ref name="P2">[https://www.fia.com/system/files/decision-document/{{lc: {{PAGENAMEE}}}}_-_free_practice_2_classification.pdf {{PAGENAME}} - FP2 Classification] (PDF). Fédération Internationale de l\'Automobile.</ref><ref name="P3">[https://www.fia.com/system/files/decision-document/{{lc: {{PAGENAMEE}}}}_-_free_practice_3_classification.pdf {{PAGENAME}} - FP3 Classification] (PDF). Fédération Internationale de l\'Automobile.</ref>')
+    lines.append("|}")
+
+    return emit(lines, out)
+
 def practice(year=None, race=None):
     """
     Generate practice results table for F1 Wiki.
@@ -914,19 +1149,15 @@ def practice(year=None, race=None):
     4. Attempt to scrape practice data from the confirmed URLs
     5. Generate a practice results table for the F1 Wiki
     """
+    import pyergast as f1
+    import pandas as pd
+
     if year is None or race is None:
         print("Practice function requires both year and race parameters.")
         print("Usage: python f1.py practice <year> <race>")
         print("Example: python f1.py practice 2024 5")
         return False
     
-    print("===Practice Results===")
-    print("The full practice results for the '''{{PAGENAME}}''' are outlined below:\n")
-    print('{| class="hidden wikitable sortable" style="width:100%"')
-    print('! rowspan="2" |<span style="cursor:help;" title="Car number">No.</span>!! rowspan="2" class="unsortable" |Driver!! rowspan="2" class="unsortable" |Team!! colspan="2" class="unsortable" |FP1 !! colspan="2" class="unsortable" |FP2 !! colspan="2" class="unsortable" |FP3')
-    print("|-")
-    print("!Time!!Pos!!Time!!Pos!!Time!!Pos")
-    
     # Get driver list for the race to populate the table
     try:
         drivers = f1.get_drivers(year, race)
@@ -1102,180 +1333,7 @@ def practice(year=None, race=None):
     
     practice_data = scrape_f1_practice_data(year, race, custom_race_id=race_id, custom_race_name=race_name)
     
-    # Find the fastest time for each practice session to use as base for converting differentials
-    fastest_times = {}
-    for session in ['FP1', 'FP2', 'FP3']:
-        if practice_data and practice_data.get(session):
-            fastest_time = None
-            fastest_driver = None
-            
-            # Find the driver with position 1 (fastest time)
-            for driver_name, data in practice_data[session].items():
-                try:
-                    position = int(data.get('position', '999'))
-                    if position == 1:
-                        fastest_time = data.get('time', '')
-                        fastest_driver = driver_name
-                        break
-                except (ValueError, TypeError):
-                    continue
-            
-            # If no position 1 found, find the fastest time by parsing all times
-            if not fastest_time:
-                for driver_name, data in practice_data[session].items():
-                    time_str = data.get('time', '')
-                    if time_str and ':' in time_str and not time_str.startswith('+'):
-                        # This looks like an absolute time, not a differential
-                        if fastest_time is None or time_str < fastest_time:
-                            fastest_time = time_str
-                            fastest_driver = driver_name
-            
-            fastest_times[session] = fastest_time
-    
-    # Display practice results for each driver
-    for _, driver in drivers.iterrows():
-        driver_number = int(driver['permanentNumber']) if pd.notna(driver['permanentNumber']) else 0
-        driver_name = driver['givenName'] + ' ' + driver['familyName']
-        nationality = driver['nationality']
-        
-        # Get team information from qualifying results if available
-        team = "{{Team-Placeholder}}"
-        if quali_results is not None:
-            # Find the driver in qualifying results
-            driver_quali = quali_results[quali_results['driverID'] == driver['driverId']]
-            if len(driver_quali) > 0:
-                constructor_id = driver_quali.iloc[0]['constructorID']
-                try:
-                    team = constructors[constructor_id]
-                except KeyError:
-                    team = '{{' + constructor_id + '-CON}}'
-        
-        print("|-")
-        print("! " + str(driver_number))
-        print("| " + getFlag(nationality) + " [[" + driver_name + "]]")
-        print("| " + team)
-        
-        # Display practice data if available, otherwise show DNP
-        if practice_data and (practice_data.get('FP1') or practice_data.get('FP2') or practice_data.get('FP3')):
-            # Create a mapping from scraped driver names to API driver names
-            driver_name_mapping = {
-                'LandoNorrisNOR': 'Lando Norris',
-                'OscarPiastriPIA': 'Oscar Piastri', 
-                'CharlesLeclercLEC': 'Charles Leclerc',
-                'IsackHadjarHAD': 'Isack Hadjar',
-                'LewisHamiltonHAM': 'Lewis Hamilton',
-                'OliverBearmanBEA': 'Oliver Bearman',
-                'KimiAntonelliANT': 'Andrea Kimi Antonelli',
-                'GeorgeRussellRUS': 'George Russell',
-                'MaxVerstappenVER': 'Max Verstappen',
-                'LanceStrollSTR': 'Lance Stroll',
-                'AlexanderAlbonALB': 'Alexander Albon',
-                'EstebanOconOCO': 'Esteban Ocon',
-                'PierreGaslyGAS': 'Pierre Gasly',
-                'LiamLawsonLAW': 'Liam Lawson',
-                'CarlosSainzSAI': 'Carlos Sainz',
-                'YukiTsunodaTSU': 'Yuki Tsunoda',
-                'FrancoColapintoCOL': 'Franco Colapinto',
-                'GabrielBortoletoBOR': 'Gabriel Bortoleto',
-                'FernandoAlonsoALO': 'Fernando Alonso',
-                'NicoHulkenbergHUL': 'Nico Hülkenberg'
-            }
-            
-            # Try to find driver data using the mapping
-            fp1_data = None
-            fp2_data = None
-            fp3_data = None
-            
-            # Try exact match first, then try mapping
-            if driver_name in practice_data.get('FP1', {}):
-                fp1_data = practice_data['FP1'][driver_name]
-            elif driver_name.replace(' ', '') in practice_data.get('FP1', {}):
-                fp1_data = practice_data['FP1'][driver_name.replace(' ', '')]
-            else:
-                # Try mapping
-                for scraped_name, api_name in driver_name_mapping.items():
-                    if api_name == driver_name and scraped_name in practice_data.get('FP1', {}):
-                        fp1_data = practice_data['FP1'][scraped_name]
-                        break
-            
-            if driver_name in practice_data.get('FP2', {}):
-                fp2_data = practice_data['FP2'][driver_name]
-            elif driver_name.replace(' ', '') in practice_data.get('FP2', {}):
-                fp2_data = practice_data['FP2'][driver_name.replace(' ', '')]
-            else:
-                # Try mapping
-                for scraped_name, api_name in driver_name_mapping.items():
-                    if api_name == driver_name and scraped_name in practice_data.get('FP2', {}):
-                        fp2_data = practice_data['FP2'][scraped_name]
-                        break
-            
-            if driver_name in practice_data.get('FP3', {}):
-                fp3_data = practice_data['FP3'][driver_name]
-            elif driver_name.replace(' ', '') in practice_data.get('FP3', {}):
-                fp3_data = practice_data['FP3'][driver_name.replace(' ', '')]
-            else:
-                # Try mapping
-                for scraped_name, api_name in driver_name_mapping.items():
-                    if api_name == driver_name and scraped_name in practice_data.get('FP3', {}):
-                        fp3_data = practice_data['FP3'][scraped_name]
-                        break
-            
-            # FP1
-            if fp1_data:
-                time = fp1_data.get('time', 'No Time')
-                pos = fp1_data.get('position', 'N/A')
-                
-                # Convert differential to absolute time if needed
-                if time != 'No Time' and fastest_times.get('FP1'):
-                    if time.startswith('+') or (time.endswith('s') and not ':' in time):
-                        # This is a differential, convert to absolute time
-                        time = convert_time_differential_to_absolute(fastest_times['FP1'], time)
-                
-                print("| " + time)
-                print("| align=center | " + pos)
-            else:
-                print("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
-            
-            # FP2
-            if fp2_data:
-                time = fp2_data.get('time', 'No Time')
-                pos = fp2_data.get('position', 'N/A')
-                
-                # Convert differential to absolute time if needed
-                if time != 'No Time' and fastest_times.get('FP2'):
-                    if time.startswith('+') or (time.endswith('s') and not ':' in time):
-                        # This is a differential, convert to absolute time
-                        time = convert_time_differential_to_absolute(fastest_times['FP2'], time)
-                
-                print("| " + time)
-                print("| align=center | " + pos)
-            else:
-                print("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
-            
-            # FP3
-            if fp3_data:
-                time = fp3_data.get('time', 'No Time')
-                pos = fp3_data.get('position', 'N/A')
-                
-                # Convert differential to absolute time if needed
-                if time != 'No Time' and fastest_times.get('FP3'):
-                    if time.startswith('+') or (time.endswith('s') and not ':' in time):
-                        # This is a differential, convert to absolute time
-                        time = convert_time_differential_to_absolute(fastest_times['FP3'], time)
-                
-                print("| " + time)
-                print("| align=center | " + pos)
-            else:
-                print("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
-        else:
-            # No practice data available, show DNP for all sessions
-            print("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
-            print("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
-            print("| colspan=\"2\" align=center | {{abbr|DNP|Did Not Participate}}")
-    
-    print("|-")
-    print('! colspan="14" style="text-align:center" |\'\'\'Source:\'\'\' <ref name="P1">[https://www.fia.com/system/files/decision-document/{{lc: {{PAGENAMEE}}}}_-_free_practice_1_classification.pdf {{PAGENAME}} - FP1 Classification] (PDF). Fédération Internationale de l\'Automobile.</ref><ref name="P2">[https://www.fia.com/system/files/decision-document/{{lc: {{PAGENAMEE}}}}_-_free_practice_2_classification.pdf {{PAGENAME}} - FP2 Classification] (PDF). Fédération Internationale de l\'Automobile.</ref><ref name="P3">[https://www.fia.com/system/files/decision-document/{{lc: {{PAGENAMEE}}}}_-_free_practice_3_classification.pdf {{PAGENAME}} - FP3 Classification] (PDF). Fédération Internationale de l\'Automobile.</ref>')
-    print("|}")
+    render_practice(drivers, quali_results, practice_data, out=sys.stdout)
     
     if not practice_data or not any(practice_data.values()):
         print("\n'''Note:''' Practice session data could not be scraped from F1.com.")
@@ -1300,60 +1358,467 @@ def practice(year=None, race=None):
     
     return
 
-# Main
-if (len(sys.argv) == 2):
-    if (sys.argv[1].lower() == 'race'):
-        race()
-    elif (sys.argv[1].lower() == 'grid'):
-        grid()
-    elif (sys.argv[1].lower() == 'quali'):
-        qualifying()
-    elif (sys.argv[1].lower() == 'standings'):
-        standings()
-    elif (sys.argv[1].lower() == 'sprint'):
-        race(sprint=True)
+# Season
+# Tables rendered by the season command, in the order they appear in a Grand Prix article
+SEASON_TABLES = ["quali", "grid", "sprint", "race", "standings"]
+
+def slugify(name):
+    import re
+
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+def round_rows(frame, race):
+    """
+    Return the rows of one round from a season DataFrame indexed by round, or None if the round is not in it.
+    """
+    if frame is None or race not in frame.index:
+        return None
+    return frame.loc[[race]].reset_index(drop=True)
+
+def render_table(name, data, out=None):
+    """
+    Render one of the SEASON_TABLES from its data.
+    
+    Parameters:
+    - name: str - The table, e.g. "race"
+    - data: DataFrame - Results of the table's pyergast query; for standings a
+      (driver standings, constructor standings, previous driver standings, previous constructor standings) tuple
+    - out: text stream - Where to write the table, or None to only return it
+    
+    Returns:
+    - str: The assembled wikitext
+    """
+    if name == "quali":
+        return render_qualifying(data, out=out)
+    if name == "grid":
+        return render_grid(data.to_dict("records"), out=out)
+    if name == "sprint":
+        return render_race(data, sprint=True, out=out)
+    if name == "race":
+        return render_race(data, out=out)
+    if name == "standings":
+        return render_standings(*data, out=out)
+    raise ValueError("Unknown table: {}".format(name))
+
+def render_round(job):
+    """
+    Render the tables of one round and write them to a single wikitext file. Runs in a worker process of season().
+    
+    Parameters:
+    - job: dict - round, raceName, date, path and tables (table name mapped to its data for render_table,
+      None when the data is not available)
+    
+    Returns:
+    - dict: The manifest entry of the round
+    """
+    import hashlib
+    import os
+
+    sections = []
+    entry = {"round": job["round"], "raceName": job["raceName"], "date": job["date"], "file": None,
+             "tables": [], "missing": [], "errors": {}, "bytes": 0, "sha256": None}
+    for name, data in job["tables"].items():
+        if data is None:
+            entry["missing"].append(name)
+            continue
+        try:
+            sections.append(render_table(name, data))
+        except Exception as e:
+            entry["errors"][name] = "{}: {}".format(type(e).__name__, e)
+        else:
+            entry["tables"].append(name)
+
+    if sections:
+        content = "\n".join(sections).encode("utf-8")
+        with open(job["path"], "wb") as f:
+            f.write(content)
+        entry.update(file=os.path.basename(job["path"]), bytes=len(content),
+                     sha256=hashlib.sha256(content).hexdigest())
+    return entry
+
+def season(year, tables=SEASON_TABLES, out_dir=None, workers=None):
+    """
+    Render tables for every round of a season that has data, one wikitext file per round, and write a manifest.json
+    describing them. The season is fetched in bulk (a few paged requests per table rather than several per round)
+    and the rounds are then rendered across a process pool.
+    
+    Parameters:
+    - year: int - The season
+    - tables: list - Tables to render, from SEASON_TABLES
+    - out_dir: str - Output directory, defaults to season-<year>
+    - workers: int - Rendering processes, defaults to one per CPU; 1 renders in this process
+    
+    Returns:
+    - dict: The manifest, or False if the season has no data
+    """
+    import json
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from pyergast import aio
+
+    tables = [name for name in SEASON_TABLES if name in tables]
+    out_dir = out_dir or "season-{}".format(year)
+
+    # One bulk query per dataset, all of them concurrently
+    queries = {"schedule": aio.get_schedule(year)}
+    if "race" in tables:
+        queries["race"] = aio.get_season_results(year)
+    if "quali" in tables or "grid" in tables:
+        queries["quali"] = aio.get_season_qualifying(year)
+    if "sprint" in tables:
+        queries["sprint"] = aio.get_season_sprints(year)
+    if "standings" in tables:
+        queries["ds"] = aio.get_season_standings(year)
+        queries["cs"] = aio.get_season_standings(year, constructors=True)
+    data = dict(zip(queries, aio.run(*queries.values(), return_exceptions=True)))
+    data = {name: None if isinstance(frame, Exception) else frame for name, frame in data.items()}
+
+    schedule = data.pop("schedule")
+    rounds = sorted(set().union(*(frame.index for frame in data.values() if frame is not None)))
+    if schedule is None or not rounds:
+        print("No data available.")
+        return False
+    schedule = schedule.set_index(schedule["round"].astype(int))
+
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = []
+    for r in rounds:
+        name = schedule.at[r, "raceName"] if r in schedule.index else "Round {}".format(r)
+        quali = round_rows(data.get("quali"), r)
+        ds, cs = round_rows(data.get("ds"), r), round_rows(data.get("cs"), r)
+        standings_data = None
+        if ds is not None and cs is not None:
+            standings_data = (ds, cs, round_rows(data["ds"], r - 1), round_rows(data["cs"], r - 1))
+        available = {
+            "quali": quali,
+            "grid": quali,
+            "sprint": round_rows(data.get("sprint"), r),
+            "race": round_rows(data.get("race"), r),
+            "standings": standings_data,
+        }
+        jobs.append({
+            "round": r,
+            "raceName": name,
+            "date": schedule.at[r, "date"] if r in schedule.index else None,
+            "path": os.path.join(out_dir, "{:02d}-{}.wikitext".format(r, slugify(name))),
+            "tables": {table: available[table] for table in tables},
+        })
+
+    if workers == 1:
+        entries = [render_round(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            entries = list(pool.map(render_round, jobs))
+
+    for entry in entries:
+        if entry["file"]:
+            print("{:>2}. {} ({})".format(entry["round"], entry["file"], ", ".join(entry["tables"])))
+        for table, error in entry["errors"].items():
+            print("{:>2}. {} failed: {}".format(entry["round"], table, error))
+
+    manifest = {"season": year, "tables": tables, "rounds": entries}
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    print("Wrote {} rounds to {}".format(sum(1 for entry in entries if entry["file"]), out_dir))
+    return manifest
+
+def season_command(args):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="f1.py season", description="Render WikiTables for every round of a season")
+    parser.add_argument("year", type=int)
+    parser.add_argument("--tables", default=",".join(SEASON_TABLES),
+                        help="comma-separated tables to render (default: {})".format(",".join(SEASON_TABLES)))
+    parser.add_argument("--out", help="output directory (default: season-<year>)")
+    parser.add_argument("--workers", type=int, help="rendering processes (default: one per CPU)")
+    options = parser.parse_args(args)
+
+    tables = [table.strip().lower() for table in options.tables.split(",") if table.strip()]
+    unknown = [table for table in tables if table not in SEASON_TABLES]
+    if unknown or not tables:
+        parser.error("unknown tables: {} (choose from {})".format(", ".join(unknown) or "none given",
+                                                               ", ".join(SEASON_TABLES)))
+    return season(options.year, tables, options.out, options.workers)
+
+# Watch
+# Polling intervals of the watch command, in seconds: while the results of a session that just ended are due, on the
+# day of a session, and the rest of the time
+WATCH_FAST = 30
+WATCH_WEEKEND = 300
+WATCH_IDLE = 3600
+# How long after the end of a session its results are polled at the fast rate, in seconds
+WATCH_FAST_WINDOW = 4 * 3600
+
+# Schedule column of the session each table comes from (None for the race itself) and its length in hours
+WATCH_SESSIONS = {
+    "race": (None, 2),
+    "sprint": ("Sprint", 1),
+    "quali": ("Qualifying", 1),
+    "grid": ("Qualifying", 1),
+    "standings": (None, 2),
+}
+
+def session_ends(schedule, table):
+    """
+    Return the end time (UTC) of every session of a season that feeds a table, sorted.
+    
+    Parameters:
+    - schedule: DataFrame - Season schedule from pyergast.get_schedule
+    - table: str - One of SEASON_TABLES
+    
+    Returns:
+    - list: pandas Timestamps
+    """
+    import pandas as pd
+
+    column, hours = WATCH_SESSIONS[table]
+    if column is None:
+        dates = schedule["date"]
+        times = schedule["time"] if "time" in schedule else pd.Series(None, index=schedule.index, dtype=object)
+    elif column in schedule:
+        sessions = schedule[column].dropna()
+        dates, times = sessions.str.get("date"), sessions.str.get("time")
     else:
-        print("You must enter an argument (race, quali, sprint, grid, standings)!")
-        print("Note: practice requires year and race parameters: python f1.py practice <year> <race>")
-
-elif (len(sys.argv) == 4):
-    if (sys.argv[1].lower() == 'race'):
-        race(int(sys.argv[2]), int(sys.argv[3]))
-    elif (sys.argv[1].lower() == 'grid'):
-        grid(int(sys.argv[2]), int(sys.argv[3]))
-    elif (sys.argv[1].lower() == 'quali'):
-        qualifying(int(sys.argv[2]), int(sys.argv[3]))
-    elif (sys.argv[1].lower() == 'standings'):
-        standings(int(sys.argv[2]), int(sys.argv[3]))
-    elif (sys.argv[1].lower() == 'sprint'):
-        race(int(sys.argv[2]), int(sys.argv[3]), True)
-    elif (sys.argv[1].lower() == 'practice'):
-        practice(int(sys.argv[2]), int(sys.argv[3]))
+        return []
+    # Old seasons have no start times, assume midday
+    starts = pd.to_datetime(dates + "T" + times.fillna("12:00:00Z"), utc=True, errors="coerce").dropna()
+    return sorted(starts + pd.Timedelta(hours=hours))
+
+def poll_interval(ends, now, settled=None):
+    """
+    Return how many seconds to wait before polling again: WATCH_FAST while the results of a session that just ended
+    are due, WATCH_WEEKEND within a day of a session and WATCH_IDLE otherwise, but never past the end of the next
+    session.
+    
+    Parameters:
+    - ends: list - Session end times, see session_ends
+    - now: Timestamp - Current time (UTC)
+    - settled: Timestamp - When results last changed; sessions that ended before then are already published
+    
+    Returns:
+    - float: Seconds
+    """
+    past = [end for end in ends if end <= now]
+    upcoming = [end for end in ends if end > now]
+    since = (now - past[-1]).total_seconds() if past else None
+    until = (upcoming[0] - now).total_seconds() if upcoming else None
+
+    if since is not None and since < WATCH_FAST_WINDOW and (settled is None or past[-1] > settled):
+        return WATCH_FAST
+    interval = WATCH_IDLE
+    if (since is not None and since < 86400) or (until is not None and until < 86400):
+        interval = WATCH_WEEKEND
+    if until is not None:
+        interval = min(interval, max(WATCH_FAST, until))
+    return interval
+
+def fetch_table(name):
+    """
+    Fetch the data of one of the SEASON_TABLES for the latest round, as render_table takes it.
+    """
+    import pyergast as f1
+    from pyergast import aio
+
+    if name == "race":
+        return f1.get_race_result()
+    if name == "sprint":
+        return f1.get_sprint_result()
+    if name in ("quali", "grid"):
+        return f1.get_qualifying_result()
+    # The live standings stay on the current endpoints, so that unchanged polls cost a 304. The +/- column compares
+    # them with the round before, like the standings command.
+    lists = f1.get_page("http://api.jolpi.ca/ergast/f1/current/driverStandings.json", limit=1)["StandingsTable"]["StandingsLists"]
+    previous_race = get_previous_race(None, int(lists[0]["round"])) if lists else None
+    queries = [aio.driver_standings(), aio.constructor_standings()]
+    if previous_race is not None:
+        year = int(lists[0]["season"])
+        queries += [aio.driver_standings(year, previous_race), aio.constructor_standings(year, previous_race)]
+    results = aio.run(*queries, return_exceptions=True)
+    for result in results[:2]:
+        if isinstance(result, Exception):
+            raise result
+    previous = [None if isinstance(result, Exception) else result for result in results[2:]] or [None, None]
+    return results[0], results[1], previous[0], previous[1]
+
+def changed_rows(previous, current):
+    """
+    Count the rows of a table that differ from its previous version (every row if its shape changed).
+    
+    Parameters:
+    - previous: DataFrame or tuple - Previous data of the table, None on the first poll
+    - current: DataFrame or tuple - Current data, as returned by fetch_table
+    
+    Returns:
+    - int: Number of changed rows
+    """
+    if not isinstance(current, tuple):
+        previous, current = (previous,), (current,)
+    elif previous is None:
+        previous = (None,) * len(current)
+
+    changes = 0
+    for old, new in zip(previous, current):
+        if new is None:
+            continue
+        if old is None or list(old.columns) != list(new.columns) or len(old) != len(new):
+            changes += len(new)
+        else:
+            changes += int((old.astype(str).to_numpy() != new.astype(str).to_numpy()).any(axis=1).sum())
+    return changes
+
+def watch(table, interval=None, out_path=None, polls=None):
+    """
+    Poll the data of a table for the latest round and re-render it whenever it changes, on an adaptive schedule
+    (see poll_interval) unless a fixed interval is given. Live queries are revalidated with conditional requests, so
+    a poll where nothing changed costs a few hundred bytes and no parsing.
+    
+    Parameters:
+    - table: str - One of SEASON_TABLES
+    - interval: float - Fixed number of seconds between polls, instead of the adaptive schedule
+    - out_path: str - File rewritten with the table on every change, instead of printing it
+    - polls: int - Stop after this many polls (default: run until interrupted)
+    """
+    import os
+    import time
+    import pandas as pd
+    import pyergast as f1
+
+    def log(message):
+        print("[{}] {}".format(time.strftime("%H:%M:%S"), message), file=sys.stderr, flush=True)
+
+    previous = None
+    ends, schedule_loaded = [], None
+    settled = None
+    count = 0
+    while True:
+        now = pd.Timestamp.now(tz="UTC")
+        if schedule_loaded is None or time.monotonic() - schedule_loaded > WATCH_IDLE:
+            try:
+                ends = session_ends(f1.get_schedule(), table)
+                schedule_loaded = time.monotonic()
+            except Exception as e:
+                log("Could not load the schedule ({}), polling every {}s".format(e, WATCH_WEEKEND))
+
+        try:
+            current = fetch_table(table)
+        except Exception as e:
+            log("{} not available: {}".format(table, e))
+        else:
+            changes = changed_rows(previous, current)
+            if changes:
+                text = render_table(table, current)
+                if out_path:
+                    with open(out_path + ".tmp", "w", encoding="utf-8") as f:
+                        f.write(text)
+                    os.replace(out_path + ".tmp", out_path)
+                else:
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+                log("{}: {} rows changed, rendered {} bytes{}".format(
+                    table, changes, len(text), " to " + out_path if out_path else ""))
+                # Results published after a session ended: no need to keep polling fast for that session
+                if previous is not None:
+                    settled = now
+                previous = current
+
+        count += 1
+        if polls and count >= polls:
+            return
+        if interval:
+            delay = interval
+        elif ends:
+            delay = poll_interval(ends, now, settled)
+        else:
+            delay = WATCH_WEEKEND
+        time.sleep(delay)
+
+def watch_command(args):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="f1.py watch",
+                                     description="Re-render a table of the latest round whenever its data changes")
+    parser.add_argument("table", choices=SEASON_TABLES)
+    parser.add_argument("--interval", type=float, help="seconds between polls (default: adaptive to the schedule)")
+    parser.add_argument("--out", help="rewrite this file on every change instead of printing the table")
+    parser.add_argument("--polls", type=int, help="stop after this many polls")
+    options = parser.parse_args(args)
+
+    try:
+        watch(options.table, options.interval, options.out, options.polls)
+    except KeyboardInterrupt:
+        print("Stopped watching.", file=sys.stderr)
+
+# Main
+def main(argv):
+    if (len(argv) >= 3 and argv[1].lower() == 'season'):
+        season_command(argv[2:])
+
+    elif (len(argv) >= 3 and argv[1].lower() == 'watch'):
+        watch_command(argv[2:])
+
+    elif (len(argv) == 2):
+        if (argv[1].lower() == 'race'):
+            race()
+        elif (argv[1].lower() == 'grid'):
+            grid()
+        elif (argv[1].lower() == 'quali'):
+            qualifying()
+        elif (argv[1].lower() == 'standings'):
+            standings()
+        elif (argv[1].lower() == 'sprint'):
+            race(sprint=True)
+        else:
+            print("You must enter an argument (race, quali, sprint, grid, standings)!")
+            print("Note: practice requires year and race parameters: python f1.py practice <year> <race>")
+
+    elif (len(argv) == 4):
+        if (argv[1].lower() == 'race'):
+            race(int(argv[2]), int(argv[3]))
+        elif (argv[1].lower() == 'grid'):
+            grid(int(argv[2]), int(argv[3]))
+        elif (argv[1].lower() == 'quali'):
+            qualifying(int(argv[2]), int(argv[3]))
+        elif (argv[1].lower() == 'standings'):
+            standings(int(argv[2]), int(argv[3]))
+        elif (argv[1].lower() == 'sprint'):
+            race(int(argv[2]), int(argv[3]), True)
+        elif (argv[1].lower() == 'practice'):
+            practice(int(argv[2]), int(argv[3]))
+        else:
+            print("You must enter 3 arguments \n arg1: race, quali, grid, standings, practice \n arg2: Formula 1 season number (ex: 2021) \n arg3: Race number (ex. 1 -- first race of the season)")
+
     else:
-        print("You must enter 3 arguments \n arg1: race, quali, grid, standings, practice \n arg2: Formula 1 season number (ex: 2021) \n arg3: Race number (ex. 1 -- first race of the season)")
-
-else:
-    print("\n")
-    print("          ______                         _         __  __          ___ _    _ _______    _     _      ")
-    print("         |  ____|                       | |       /_ | \ \        / (_) |  (_)__   __|  | |   | |     ")
-    print("         | |__ ___  _ __ _ __ ___  _   _| | __ _   | |  \ \  /\  / / _| | ___   | | __ _| |__ | | ___ ")
-    print("         |  __/ _ \| '__| '_ ` _ \| | | | |/ _` |  | |   \ \/  \/ / | | |/ / |  | |/ _` | '_ \| |/ _ \ ")
-    print("         | | | (_) | |  | | | | | | |_| | | (_| |  | |    \  /\  /  | |   <| |  | | (_| | |_) | |  __/")
-    print("         |_|  \___/|_|  |_| |_| |_|\__,_|_|\__,_|  |_|     \/  \/   |_|_|\_\_|  |_|\__,_|_.__/|_|\___|")
+        print("\n")
+        print("          ______                         _         __  __          ___ _    _ _______    _     _      ")
+        print("         |  ____|                       | |       /_ | \ \        / (_) |  (_)__   __|  | |   | |     ")
+        print("         | |__ ___  _ __ _ __ ___  _   _| | __ _   | |  \ \  /\  / / _| | ___   | | __ _| |__ | | ___ ")
+        print("         |  __/ _ \| '__| '_ ` _ \| | | | |/ _` |  | |   \ \/  \/ / | | |/ / |  | |/ _` | '_ \| |/ _ \ ")
+        print("         | | | (_) | |  | | | | | | |_| | | (_| |  | |    \  /\  /  | |   <| |  | | (_| | |_) | |  __/")
+        print("         |_|  \___/|_|  |_| |_| |_|\__,_|_|\__,_|  |_|     \/  \/   |_|_|\_\_|  |_|\__,_|_.__/|_|\___|")
                                                                                               
                                                                                               
-    print("\n\n This python script allows you to generate fully formatted WikiTables, specifically for Grand Prix articles at \n The Formula One Wiki on https://f1.fandom.com \n")
-    print("Usage:\n\n")
-    print("  Grabs data for latest grand prix and outputs a WikiTable that can then be pasted onto Fandom")
-    print("      python3 f1.py race")
-    print("      python3 f1.py sprint")
-    print("      python3 f1.py standings")
-    print("      python3 f1.py grid")
-    print("      python3 f1.py quali\n\n")
-    print("  If you specify a season number and race number,\n  you can retrive the data for any specific GP \n  all the way back to the first GP in 1950.")
-    print("      python3 f1.py race 2020 15")
-    print("      python3 f1.py sprint 2025 6")
-    print("      python3 f1.py grid 2021 19")
-    print("      python3 f1.py quali 2002 8")
-    print("      python3 f1.py standings 2019 21")
-    print("      python3 f1.py practice 2024 5")
\ No newline at end of file
+        print("\n\n This python script allows you to generate fully formatted WikiTables, specifically for Grand Prix articles at \n The Formula One Wiki on https://f1.fandom.com \n")
+        print("Usage:\n\n")
+        print("  Grabs data for latest grand prix and outputs a WikiTable that can then be pasted onto Fandom")
+        print("      python3 f1.py race")
+        print("      python3 f1.py sprint")
+        print("      python3 f1.py standings")
+        print("      python3 f1.py grid")
+        print("      python3 f1.py quali\n\n")
+        print("  If you specify a season number and race number,\n  you can retrive the data for any specific GP \n  all the way back to the first GP in 1950.")
+        print("      python3 f1.py race 2020 15")
+        print("      python3 f1.py sprint 2025 6")
+        print("      python3 f1.py grid 2021 19")
+        print("      python3 f1.py quali 2002 8")
+        print("      python3 f1.py standings 2019 21")
+        print("      python3 f1.py practice 2024 5")
+        print("\n  Render every round of a season into one wikitext file per round (plus a manifest.json)")
+        print("      python3 f1.py season 2021")
+        print("      python3 f1.py season 2021 --tables race,quali --out season-2021 --workers 4")
+        print("\n  Keep running and re-render a table of the latest round whenever its data changes")
+        print("      python3 f1.py watch race")
+        print("      python3 f1.py watch standings --out standings.wikitext")
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,2199 @@
+import contextvars
+import copy
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from pyergast.retry import (CircuitOpen, ClientError, ErgastError, HTTPStatusError, RateLimited, RetryPolicy,
+                            ServerError, raise_for_status)
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported when one of its attributes is first used.
+
+    pandas alone takes several hundred milliseconds to import, so `pyergast` and the `f1.py` CLI bind it through this
+    class: code paths that never build a DataFrame (e.g. `pyergast.records`) never pay for it. Attribute lookups go
+    through `importlib.import_module`, which is thread-safe, so concurrent first uses from `pyergast.aio` workers are
+    fine.
+
+    Parameters
+    ----------
+    name: str
+        The module to import, e.g. 'pandas'
+
+    Example
+    -------
+    >>> pd = LazyModule('pandas')
+    >>> pd.DataFrame({'a': [1]})  # pandas is imported here
+    """
+
+    def __init__(self, name):
+        self.__name = name
+
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self.__name), attr)
+
+    def __repr__(self):
+        return '<lazy module {!r}>'.format(self.__name)
+
+
+pd = LazyModule('pandas')
+
+
+def is_live(url):
+    """
+    Helper function that tells whether `url` is a `current`/`last` endpoint, whose response changes during a season
+    """
+    return '/current' in url or '/last' in url
+
+
+def is_empty(content):
+    """
+    Helper function that tells whether a response body is a page of the API without any rows, e.g. the results of a
+    round that have not been published yet
+    """
+    try:
+        return json.loads(content)['MRData']['total'] == '0'
+    except (ValueError, KeyError, TypeError):
+        return False
+
+
+def conditional_headers(etag, last_modified):
+    """
+    Helper function that builds the headers of a conditional request from a response's validators
+    """
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+class ResponseCache:
+    """
+    Persistent on-disk cache of raw API responses, stored zlib-compressed in a SQLite file and keyed on the request URL.
+
+    Results from finished seasons never change, so they are kept forever. `current`/`last` endpoints, and empty answers
+    for the running season (e.g. a round whose results are not published yet), expire after `live_ttl` seconds, and
+    anything else that can still change (the running season, all-time lists) after `season_ttl` seconds. Once the cache grows past `max_bytes`, the least recently used entries are evicted.
+    Expired entries are kept along with the response's `ETag`/`Last-Modified` validators, so that the client can
+    revalidate them with a conditional request instead of downloading them again.
+
+    Parameters
+    ----------
+    path: str
+        Location of the SQLite file. Defaults to `$PYERGAST_CACHE_DIR/responses.sqlite`, or `~/.cache/pyergast`.
+    max_bytes: int
+        Size cap of the stored (compressed) responses.
+    live_ttl: int
+        Lifetime in seconds of `current`/`last` responses and of empty responses for the running season.
+    season_ttl: int
+        Lifetime in seconds of responses that may still change but are not live.
+    """
+
+    def __init__(self, path=None, max_bytes=256 * 1024 * 1024, live_ttl=300, season_ttl=6 * 60 * 60):
+        if path is None:
+            cache_dir = os.environ.get('PYERGAST_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'pyergast')
+            path = os.path.join(cache_dir, 'responses.sqlite')
+        self.path = path
+        self.max_bytes = max_bytes
+        self.live_ttl = live_ttl
+        self.season_ttl = season_ttl
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        # Opened lazily so that importing the module never touches the disk
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('CREATE TABLE IF NOT EXISTS responses ('
+                               'url TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL, '
+                               'expires REAL, accessed REAL NOT NULL, etag TEXT, last_modified TEXT)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+            # Caches written before validators were stored
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(responses)')}
+            for column in ('etag', 'last_modified'):
+                if column not in columns:
+                    self._conn.execute('ALTER TABLE responses ADD COLUMN {} TEXT'.format(column))
+        return self._conn
+
+    def ttl(self, url, content=None):
+        """
+        Returns the lifetime in seconds of a response for `url`, or None if it never expires. An empty `content` for
+        the running season expires as soon as a live response, since the rows are usually about to be published.
+        """
+        if is_live(url):
+            return self.live_ttl
+        season = re.search(r'/f1/(\d{4})(?:/|\.json)', url)
+        if season is None:
+            return self.season_ttl
+        year = int(season.group(1))
+        if year < date.today().year:
+            return None
+        if year == date.today().year and not (content is not None and is_empty(content)):
+            return self.season_ttl
+        return self.live_ttl
+
+    def get(self, url):
+        """
+        Returns the cached body for `url` as bytes, or None if it is missing or expired.
+        """
+        entry = self.entry(url)
+        if entry is None or not entry[1]:
+            return None
+        return entry[0]
+
+    def entry(self, url):
+        """
+        Returns the cached response for `url` as a (body, fresh, etag, last_modified) tuple, expired or not,
+        or None if it is missing.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute('SELECT body, expires, etag, last_modified FROM responses WHERE url = ?',
+                               (url,)).fetchone()
+            if row is None:
+                return None
+            conn.execute('UPDATE responses SET accessed = ? WHERE url = ?', (now, url))
+            conn.commit()
+        return zlib.decompress(row[0]), row[1] is None or row[1] >= now, row[2], row[3]
+
+    def refresh(self, url):
+        """
+        Starts a new lifetime for the cached response of `url`, after the API confirmed it has not changed.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute('SELECT body FROM responses WHERE url = ?', (url,)).fetchone()
+            ttl = self.ttl(url, None if row is None else zlib.decompress(row[0]))
+            conn.execute('UPDATE responses SET expires = ?, accessed = ? WHERE url = ?',
+                         (None if ttl is None else now + ttl, now, url))
+            conn.commit()
+
+    def put(self, url, content, etag=None, last_modified=None):
+        """
+        Stores the body of a response for `url`, with its validators, and evicts least recently used entries above
+        the size cap.
+        """
+        now = time.time()
+        ttl = self.ttl(url, content)
+        body = zlib.compress(content)
+        with self._lock:
+            conn = self._connect()
+            conn.execute('INSERT OR REPLACE INTO responses (url, body, size, expires, accessed, etag, last_modified) '
+                         'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                         (url, body, len(body), None if ttl is None else now + ttl, now, etag, last_modified))
+            total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+            if total > self.max_bytes:
+                for old_url, size in conn.execute('SELECT url, size FROM responses ORDER BY accessed').fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    conn.execute('DELETE FROM responses WHERE url = ?', (old_url,))
+                    total -= size
+            conn.commit()
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute('DELETE FROM responses')
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ErgastClient:
+    """
+    Thin wrapper around a `requests.Session` that keeps a pool of warm connections to the API.
+    Every query function in this module goes through the module-level `client`, so consecutive
+    queries reuse the same TCP/TLS connection instead of opening a new one per call.
+    Successful responses are stored in `cache` and served from disk while they are fresh. Failed requests are retried
+    and failing hosts suspended according to `retry`.
+
+    The client remembers the validators (`ETag`, `Last-Modified` and a digest of the body) of every response. Expired
+    cache entries are fetched with a conditional request, and `revalidate` lets memoized results of live endpoints
+    check for changes without downloading or parsing anything when the answer is 304 Not Modified.
+
+    Parameters
+    ----------
+    pool_size: int
+        Maximum number of connections kept alive per host.
+    timeout: float or tuple
+        Timeout passed to `requests`, either a single value or a (connect, read) tuple.
+    cache: ResponseCache
+        An optional on-disk response cache. Pass None to always hit the network.
+    retry: RetryPolicy
+        Retry, backoff and circuit breaker settings, see `pyergast.retry`. Pass None to send every request once.
+    """
+
+    def __init__(self, pool_size=10, timeout=(5, 30), cache=None, retry=None):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.cache = cache
+        self.retry = retry
+        self.validators = {}
+        self._changed = {}
+        self._lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+        # Route through recorded fixtures when they are enabled (see `pyergast.fixtures`)
+        from pyergast import fixtures
+        fixtures.mount(self.session)
+
+    def send(self, url, headers=None, **kwargs):
+        """
+        Sends a GET request for `url` to the network, through the retry policy
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        if headers:
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, **headers)
+        if self.retry is None:
+            return self.session.get(url, **kwargs)
+        return self.retry.request(url, lambda: self.session.get(url, **kwargs))
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            changed = self._changed.pop(url, None)
+        if changed is not None:
+            return changed
+
+        entry = None
+        if self.cache is not None:
+            entry = self.cache.entry(url)
+            if entry is not None and entry[1]:
+                with self._lock:
+                    self.validators.setdefault(url, (entry[2], entry[3], digest(entry[0])))
+                return _cached_response(url, entry[0])
+
+        # An expired entry can still be reused if the API confirms it has not changed
+        r = self.send(url, conditional_headers(entry[2], entry[3]) if entry is not None else None, **kwargs)
+        if r.status_code == 304 and entry is not None:
+            self.cache.refresh(url)
+            with self._lock:
+                self.validators[url] = (entry[2], entry[3], digest(entry[0]))
+            return _cached_response(url, entry[0])
+        if r.status_code == 200:
+            self.remember(url, r)
+        return r
+
+    def remember(self, url, r):
+        etag, last_modified = r.headers.get('ETag'), r.headers.get('Last-Modified')
+        with self._lock:
+            self.validators[url] = (etag, last_modified, digest(r.content))
+        if self.cache is not None:
+            self.cache.put(url, r.content, etag, last_modified)
+
+    def revalidate(self, url):
+        """
+        Asks the API whether the response for `url` changed since this client last received it, with a conditional
+        request if the response had validators. Returns True if it did not change. A changed response is kept, and
+        returned by the next `get(url)` instead of being downloaded again.
+        """
+        with self._lock:
+            known = self.validators.get(url)
+        if known is None:
+            return False
+        etag, last_modified, body_digest = known
+        r = self.send(url, conditional_headers(etag, last_modified))
+        if r.status_code == 304:
+            if self.cache is not None:
+                self.cache.refresh(url)
+            return True
+        if r.status_code != 200:
+            return False
+        self.remember(url, r)
+        # Without validators the body has to be downloaded, but an identical one still needs no parsing
+        if digest(r.content) == body_digest:
+            return True
+        with self._lock:
+            self._changed[url] = r
+        return False
+
+    def close(self):
+        self.session.close()
+
+
+def digest(content):
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _cached_response(url, content):
+    r = requests.Response()
+    r.status_code = 200
+    r.url = url
+    r.encoding = 'utf-8'
+    r._content = content
+    return r
+
+
+# Fixtures replace the network entirely, so the on-disk cache would only get in their way
+client = ErgastClient(cache=None if os.environ.get('PYERGAST_CACHE') == '0' or os.environ.get('PYERGAST_FIXTURES')
+                      else ResponseCache(), retry=RetryPolicy())
+
+
+def configure(pool_size=None, timeout=None, cache=None, retry=None):
+    """
+    Replaces the module-level client with one using the given pool size, timeout, cache and/or retry policy.
+    Parameters left as None keep their current value.
+
+    Parameters
+    ----------
+    pool_size: int
+        Maximum number of connections kept alive per host.
+    timeout: float or tuple
+        Timeout passed to `requests`, either a single value or a (connect, read) tuple.
+    cache: ResponseCache or bool
+        A response cache to use, or False to disable caching.
+    retry: RetryPolicy or bool
+        A retry policy to use, or False to send every request once. The circuit breaker state lives in the policy,
+        so a new policy starts with every host closed.
+
+    Returns
+    -------
+    ErgastClient
+
+    Example
+    -------
+    >>> pyergast.configure(pool_size=4, timeout=10, cache=pyergast.ResponseCache(max_bytes=64 * 1024 * 1024))
+    <pyergast.ErgastClient object at 0x...>
+    """
+    global client
+    if cache is None:
+        cache = client.cache
+    elif cache is False:
+        cache = None
+    if retry is None:
+        retry = client.retry
+    elif retry is False:
+        retry = None
+    new_client = ErgastClient(pool_size=pool_size if pool_size is not None else client.pool_size,
+                              timeout=timeout if timeout is not None else client.timeout,
+                              cache=cache, retry=retry)
+    client.close()
+    client = new_client
+    return client
+
+
+# Memoized results by query, each with the set of URLs it was built from
+_memo = {}
+
+# The URLs fetched while computing a memoized result (a set), or None outside of one
+_fetched = contextvars.ContextVar('pyergast_fetched', default=None)
+
+
+def memoize(func):
+    """
+    Decorator that remembers the DataFrame returned by a query function for each set of arguments, so that every
+    logical dataset costs at most one request per process. Callers always receive their own copy, so mutating a
+    result never leaks into later calls.
+
+    Results built from live endpoints (`current`/`last`) are revalidated on every call with conditional requests
+    (see `ErgastClient.revalidate`): while the API answers 304 Not Modified the remembered DataFrame is returned as
+    is, otherwise it is rebuilt from the new response.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__name__,) + tuple(bound.arguments.values())
+        memo = _memo.get(key)
+        if memo is None or not all(client.revalidate(url) for url in memo[1] if is_live(url)):
+            urls = set()
+            token = _fetched.set(urls)
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                _fetched.reset(token)
+            memo = _memo[key] = (result, frozenset(urls))
+        # Nested queries (e.g. qualifying results filling the grid) make the outer result depend on their URLs too
+        outer = _fetched.get()
+        if outer is not None:
+            outer.update(memo[1])
+        return copy_result(memo[0])
+
+    return wrapper
+
+
+def copy_result(result):
+    """
+    Helper function that copies a DataFrame along with the dicts and lists in its cells (e.g. `Time`), which
+    `DataFrame.copy` would share between the copies
+    """
+    result = result.copy()
+    for name, column in result.items():
+        if column.dtype == object and any(isinstance(value, (dict, list)) for value in column):
+            result[name] = column.map(copy.deepcopy)
+    return result
+
+
+def threaded_map(executor, func, items):
+    """
+    Helper function like `executor.map(func, items)`, but running each call in a copy of the caller's context, so that
+    the URLs fetched on worker threads count towards the memoized result being computed
+    """
+    items = list(items)
+    contexts = [contextvars.copy_context() for _ in items]
+    return executor.map(lambda context, item: context.run(func, item), contexts, items)
+
+
+# Compact dtypes used by `to_typed`, by column name. Columns not listed keep their dtype.
+TYPED_COLUMNS = {
+    'season': 'Int16',
+    'round': 'Int16',
+    'number': 'Int16',
+    'permanentNumber': 'Int16',
+    'position': 'Int16',
+    'grid': 'Int16',
+    'laps': 'Int16',
+    'wins': 'Int16',
+    'points': 'float32',
+    'Latitude': 'float64',
+    'Longtitude': 'float64',
+    'date': 'datetime64[ns]',
+    'dateOfBirth': 'datetime64[ns]',
+    'driverId': 'category',
+    'driverID': 'category',
+    'driver': 'category',
+    'code': 'category',
+    'givenName': 'category',
+    'familyName': 'category',
+    'nationality': 'category',
+    'constructorId': 'category',
+    'constructorID': 'category',
+    'constructor': 'category',
+    'name': 'category',
+    'positionText': 'category',
+    'status': 'category',
+    'circuitId': 'category',
+    'circuitID': 'category',
+    'circuitName': 'category',
+    'locality': 'category',
+    'country': 'category',
+    'Locality': 'category',
+    'Country': 'category',
+}
+
+
+def to_typed(result):
+    """
+    Converts a dataframe returned by a query function to compact dtypes: counts and positions become nullable Int16,
+    points float32, dates datetime64, and IDs, names and nationalities categories. The `Time` dict column is split
+    into `Time.millis` (Int64 milliseconds) and `Time.time`.
+
+    Parameters
+    ----------
+    result: pandas.DataFrame
+        A dataframe returned by one of the query functions
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Example
+    -------
+    >>> pyergast.to_typed(pyergast.get_race_result(2020, 15)).dtypes.head(5)
+    number            Int16
+    position          Int16
+    positionText   category
+    grid              Int16
+    points          float32
+    dtype: object
+    """
+    columns = {}
+    for name, column in result.items():
+        dtype = TYPED_COLUMNS.get(name)
+        if name == 'Time':
+            columns['Time.millis'] = pd.to_numeric(column.str.get('millis'), errors='coerce').astype('Int64')
+            columns['Time.time'] = column.str.get('time')
+        elif dtype is None:
+            columns[name] = column
+        elif dtype == 'category':
+            columns[name] = column.astype('category')
+        elif dtype.startswith('datetime'):
+            columns[name] = pd.to_datetime(column, errors='coerce')
+        else:
+            columns[name] = pd.to_numeric(column, errors='coerce').astype(dtype)
+    return pd.DataFrame(columns, index=result.index)
+
+
+def typeable(func):
+    """
+    Decorator that adds a `typed` keyword to a query function. With `typed=True` the result is passed through
+    `to_typed`, otherwise it is returned with the API's string values.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, typed=False, **kwargs):
+        result = func(*args, **kwargs)
+        return to_typed(result) if typed else result
+
+    return wrapper
+
+
+def local_source(func):
+    """
+    Decorator that adds a `source` keyword to a query function. With `source='local'` the query is answered from the
+    synced Parquet store (see `pyergast.store`) instead of the API.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, source='api', **kwargs):
+        if source == 'local':
+            from pyergast import store
+            return store.local.query(func.__name__, *args, **kwargs)
+        if source != 'api':
+            raise ValueError("source must be 'api' or 'local'")
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def sql(query, params=None, typed=False):
+    """
+    Runs a SQL query over the F1 history synced into the local store (see `pyergast.store`), with SQLite.
+
+    The tables are those of the store: `schedule`, `results`, `qualifying`, `sprint`, `driver_standings` and
+    `constructor_standings`, with the columns of the matching query functions plus `season` and `round`. They are
+    indexed on (season, round), (driverID, season, round) and (constructorID, season, round). Positions, points,
+    grid, laps, wins and numbers compare and add up as numbers, and `Time` holds JSON (`json_extract(Time, '$.millis')`).
+
+    Parameters
+    ----------
+    query: str
+        A SELECT statement. The tables cannot be modified.
+    params: tuple or dict
+        Values of the `?` or `:name` placeholders in `query`
+    typed: bool
+        Whether to return numbers and compact dtypes as `to_typed` does
+
+    Returns
+    -------
+    pandas.DataFrame
+        One column per selected column. Columns named like those of the query functions have the same values:
+        strings with NaN for missing values (unless `typed`), and `Time` as dicts. Season and round are integers.
+
+    Example
+    -------
+    >>> pyergast.sql('SELECT constructor, COUNT(*) AS podiums FROM results '
+    ...              'WHERE season >= 2000 AND position <= 3 GROUP BY constructorID ORDER BY podiums DESC')
+    >>> pyergast.sql('SELECT * FROM results WHERE driverID = ? AND position = 1', ('alonso',), typed=True)
+    """
+    from pyergast import store
+    return store.local.sql(query, params, typed)
+
+
+def clear_memo():
+    """
+    Forgets every result memoized by the query functions in this process.
+    """
+    _memo.clear()
+
+
+def get_page(url, limit=100, offset=0):
+    """
+    Helper function that fetches a single page of a query and returns its `MRData` object.
+    Raises a subclass of `ErgastError` if the API does not answer with a page (see `pyergast.retry`).
+    """
+    url = '{}?limit={}&offset={}'.format(url, limit, offset)
+    fetched = _fetched.get()
+    if fetched is not None:
+        fetched.add(url)
+    r = raise_for_status(client.get(url))
+    return r.json()['MRData']
+
+
+def get_pages(url, limit=100):
+    """
+    Helper function that follows the API's paging (`MRData.total`, `offset`, `limit`) and returns every page of a query.
+    The first page tells how many rows there are, the remaining pages are then fetched concurrently.
+
+    Parameters
+    ----------
+    url: str
+        The query URL, without limit and offset parameters
+    limit: int
+        Page size. The API serves at most 100 rows per page.
+
+    Returns
+    -------
+    list
+        The `MRData` object of every page, in order
+    """
+    first = get_page(url, limit, 0)
+    # The API may cap the page size below the requested limit
+    limit = int(first.get('limit', limit)) or limit
+    offsets = range(limit, int(first['total']), limit)
+    if not offsets:
+        return [first]
+
+    with ThreadPoolExecutor(max_workers=min(client.pool_size, len(offsets))) as executor:
+        rest = list(threaded_map(executor, lambda offset: get_page(url, limit, offset), offsets))
+    return [first] + rest
+
+
+def get_table(url, table, key):
+    """
+    Helper function that returns the concatenated `table[key]` lists of every page of a query
+
+    Example
+    -------
+    >>> pyergast.get_table('http://api.jolpi.ca/ergast/f1/drivers.json', 'DriverTable', 'Drivers')[:1]
+    [{'driverId': 'abate', 'url': 'http://en.wikipedia.org/wiki/Carlo_Mario_Abate', 'givenName': 'Carlo', ...}]
+    """
+    return [item for page in get_pages(url) for item in page[table][key]]
+
+
+# Column specs for `normalize`, mapping each output column to its source in the flattened API records.
+# A tuple joins several fields with spaces, a dict rebuilds a nested dict column, and `List.0.field` reads a field of
+# the first element of a list.
+RESULT_COLUMNS = {
+    'number': 'number',
+    'position': 'position',
+    'positionText': 'positionText',
+    'grid': 'grid',
+    'points': 'points',
+    'driverID': 'Driver.driverId',
+    'driver': ('Driver.givenName', 'Driver.familyName'),
+    'nationality': 'Driver.nationality',
+    'constructorID': 'Constructor.constructorId',
+    'constructor': 'Constructor.name',
+    'laps': 'laps',
+    'status': 'status',
+    'Time': {'millis': 'Time.millis', 'time': 'Time.time'},
+}
+
+QUALIFYING_COLUMNS = {
+    'number': 'number',
+    'position': 'position',
+    'driverID': 'Driver.driverId',
+    'driver': ('Driver.givenName', 'Driver.familyName'),
+    'nationality': 'Driver.nationality',
+    'constructorID': 'Constructor.constructorId',
+    'constructor': 'Constructor.name',
+    'Q1': 'Q1',
+    'Q2': 'Q2',
+    'Q3': 'Q3',
+}
+
+DRIVER_STANDINGS_COLUMNS = {
+    'position': 'position',
+    'positionText': 'positionText',
+    'points': 'points',
+    'wins': 'wins',
+    'driverID': 'Driver.driverId',
+    'driver': ('Driver.givenName', 'Driver.familyName'),
+    'nationality': 'Driver.nationality',
+    'constructorID': 'Constructors.0.constructorId',
+    'constructor': 'Constructors.0.name',
+}
+
+CONSTRUCTOR_STANDINGS_COLUMNS = {
+    'position': 'position',
+    'positionText': 'positionText',
+    'points': 'points',
+    'wins': 'wins',
+    'constructorID': 'Constructor.constructorId',
+    'name': 'Constructor.name',
+    'nationality': 'Constructor.nationality',
+}
+
+DRIVER_CAREER_COLUMNS = {
+    'season': 'season',
+    'round': 'round',
+    'position': 'position',
+    'positionText': 'positionText',
+    'points': 'points',
+    'wins': 'wins',
+    'driver': ('Driver.givenName', 'Driver.familyName'),
+    'nationality': 'Driver.nationality',
+    'constructorID': 'Constructors.0.constructorId',
+    'constructor': 'Constructors.0.name',
+}
+
+CONSTRUCTOR_CAREER_COLUMNS = {
+    'season': 'season',
+    'round': 'round',
+    'position': 'position',
+    'positionText': 'positionText',
+    'points': 'points',
+    'wins': 'wins',
+    'constructorID': 'Constructor.constructorId',
+    'constructor': 'Constructor.name',
+    'nationality': 'Constructor.nationality',
+}
+
+CIRCUIT_COLUMNS = {
+    'circuitId': 'circuitId',
+    'url': 'url',
+    'circuitName': 'circuitName',
+    'Latitude': 'Location.lat',
+    'Longtitude': 'Location.long',
+    'Locality': 'Location.locality',
+    'Country': 'Location.country',
+}
+
+
+def normalize(records, spec, record_path=None, meta=None):
+    """
+    Flattens a list of API records in one vectorized pass with `pandas.json_normalize` (producing columns such as
+    `Driver.driverId`, `Constructor.name` or `Time.millis`) and builds the output columns described by `spec`.
+    Fields missing from every record come out as NaN.
+
+    Parameters
+    ----------
+    records: list
+        A list of dicts as returned by the API
+    spec: dict
+        Output column name mapped to its source, see `RESULT_COLUMNS`
+    record_path: str
+        Passed to `pandas.json_normalize`, to flatten a list nested in each record
+    meta: list
+        Passed to `pandas.json_normalize`, fields of the outer records repeated on each nested row
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Example
+    -------
+    >>> pyergast.normalize([{'Driver': {'driverId': 'alonso', 'givenName': 'Fernando', 'familyName': 'Alonso'}}],
+    ...                    {'driverID': 'Driver.driverId', 'driver': ('Driver.givenName', 'Driver.familyName')})
+      driverID           driver
+    0   alonso  Fernando Alonso
+    """
+    flat = pd.json_normalize(records, record_path=record_path, meta=meta, max_level=1)
+    columns = {}
+    for name, source in spec.items():
+        if isinstance(source, tuple):
+            columns[name] = normalized_column(flat, source[0]).str.cat(
+                [normalized_column(flat, part) for part in source[1:]], sep=' ')
+        elif isinstance(source, dict):
+            columns[name] = nested_column(flat, source)
+        else:
+            columns[name] = normalized_column(flat, source)
+    return pd.DataFrame(columns, index=flat.index)
+
+
+def normalized_column(flat, source):
+    """
+    Helper function that returns the column `source` of a flattened dataframe, reading `List.0.field` sources from the
+    first element of a list column
+    """
+    if source in flat.columns:
+        return flat[source]
+    if '.0.' in source:
+        column, field = source.split('.0.', 1)
+        if column in flat.columns:
+            return flat[column].str[0].str.get(field)
+    return pd.Series(float('nan'), index=flat.index, dtype=object)
+
+
+def nested_column(flat, fields):
+    """
+    Helper function that packs several flattened columns back into a dict column (e.g. `Time`),
+    NaN where all of them are missing
+    """
+    parts = pd.DataFrame({key: normalized_column(flat, source) for key, source in fields.items()}, index=flat.index)
+    present = parts.notna().any(axis=1)
+    column = pd.Series(float('nan'), index=flat.index, dtype=object)
+    column[present] = pd.Series(parts[present].to_dict('records'), index=parts.index[present], dtype=object)
+    return column
+
+
+def fill_grid(result, load_qualifying, keys=('driverID',), year=None):
+    """
+    Helper function that fills null grid positions with the qualifying position of the same driver, matched on
+    `keys`. `load_qualifying` is only called when a grid position is actually missing, and never for a `year` before
+    1996, which has no qualifying data.
+    """
+    missing = result['grid'].isna() | (result['grid'] == 'null')
+    if not missing.any() or (year and year < 1996):
+        return result
+    try:
+        quali = load_qualifying()
+    except (requests.RequestException, KeyError):
+        # Qualifying is unavailable (offline, not published yet or an unexpected answer): keep the grid as it is
+        return result
+    if quali.empty:
+        return result
+
+    keys = list(keys)
+    positions = result[keys].merge(quali[keys + ['position']].drop_duplicates(keys), on=keys, how='left')['position']
+    positions.index = result.index
+    fill = missing & positions.notna()
+    result.loc[fill, 'grid'] = positions[fill].astype(str)
+    return result
+
+
+def season_frame(year, endpoint, results_key, spec):
+    """
+    Helper function that fetches a season-wide RaceTable endpoint (results, qualifying) across all its pages and
+    returns the flattened rows of every round in one dataframe indexed by round
+    """
+    races = get_table('http://api.jolpi.ca/ergast/f1/{}/{}.json'.format(year, endpoint), 'RaceTable', 'Races')
+    if not races:
+        # e.g. sprints before 2021: keep the columns so that callers can still slice and concatenate
+        return pd.DataFrame(columns=list(spec), index=pd.Index([], dtype=int, name='round'))
+    # A round can be split across two pages, which is harmless since rows are flattened per driver
+    result = normalize(races, dict(round='round', **spec), record_path=results_key, meta=['round'])
+    result['round'] = result['round'].astype(int)
+    return result.set_index('round')
+
+
+def season_slice(name, year, race, *args):
+    """
+    Helper function that returns the rows of one round from a season dataframe that has already been loaded in this
+    process by the season function `name`, or None if that season has not been loaded
+    """
+    if not (year and race):
+        return None
+    memo = _memo.get((name, year) + args)
+    if memo is None or race not in memo[0].index:
+        return None
+    season = memo[0]
+    return season.loc[[race]].reset_index(drop=True)
+
+
+@typeable
+@memoize
+def get_drivers(year=None, race=None):
+    """
+    Queries the API to obtain the list of drivers in a pandas dataframe format.
+    By default, this function returns the list of all drivers who have ever driven in F1.
+    If the year parameter is specified, this function returns the list of all drivers who drove in F1 in that year.
+    If the year and race parameters are specified, this function returns the list of all drivers who drove in F1 for a particular race.
+
+    Parameters
+    ----------
+    year: int
+        An optional parameter that specifies the year to be queried.
+    race: int
+        An optional parameter that specifies the round of a year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        driverId: str
+        permanentNumber: int
+        code: str
+        url: str
+        givenName: str
+        familyName: str
+        dateOfBirth: str
+        nationality: str
+
+    Example
+    -------
+    >>> pyergast.get_drivers(2016)
+               driverId permanentNumber code  ...  familyName dateOfBirth nationality
+    0            alonso              14  ALO  ...      Alonso  1981-07-29     Spanish
+    1            bottas              77  BOT  ...      Bottas  1989-08-28     Finnish
+    2            button              22  BUT  ...      Button  1980-01-19     British
+    3          ericsson               9  ERI  ...    Ericsson  1990-09-02     Swedish
+    4          grosjean               8  GRO  ...    Grosjean  1986-04-17      French
+    5         gutierrez              21  GUT  ...   Gutiérrez  1991-08-05     Mexican
+    6          hamilton              44  HAM  ...    Hamilton  1985-01-07     British
+    7          haryanto              88  HAR  ...    Haryanto  1993-01-22  Indonesian
+    8        hulkenberg              27  HUL  ...  Hülkenberg  1987-08-19      German
+    9             kvyat              26  KVY  ...       Kvyat  1994-04-26     Russian
+    10  kevin_magnussen              20  MAG  ...   Magnussen  1992-10-05      Danish
+    11            massa              19  MAS  ...       Massa  1981-04-25   Brazilian
+    12             nasr              12  NAS  ...        Nasr  1992-08-21   Brazilian
+    13             ocon              31  OCO  ...        Ocon  1996-09-17      French
+    14    jolyon_palmer              30  PAL  ...      Palmer  1991-01-20     British
+    15            perez              11  PER  ...       Pérez  1990-01-26     Mexican
+    16        raikkonen               7  RAI  ...   Räikkönen  1979-10-17     Finnish
+    17        ricciardo               3  RIC  ...   Ricciardo  1989-07-01  Australian
+    18          rosberg               6  ROS  ...     Rosberg  1985-06-27      German
+    19            sainz              55  SAI  ...       Sainz  1994-09-01     Spanish
+    20        vandoorne               2  VAN  ...   Vandoorne  1992-03-26     Belgian
+    21   max_verstappen              33  VER  ...  Verstappen  1997-09-30       Dutch
+    22           vettel               5  VET  ...      Vettel  1987-07-03      German
+    23         wehrlein              94  WEH  ...    Wehrlein  1994-10-18      German
+
+    [24 rows x 8 columns]
+    """
+    if year and race:
+        url = 'http://api.jolpi.ca/ergast/f1/{}/drivers.json'.format(year, race)
+    elif year:
+        url = 'http://api.jolpi.ca/ergast/f1/{}/drivers.json'.format(year, race)
+    else:
+        url = 'http://api.jolpi.ca/ergast/f1/drivers.json'
+    drivers = get_table(url, 'DriverTable', 'Drivers')
+    result = pd.DataFrame(drivers)
+
+    return result
+
+
+@typeable
+@memoize
+def get_constructors(year=None, race=None):
+    """
+    Queries the API to obtain the list of constructors in a pandas dataframe format.
+    By default, this function returns the list of all constructors who have ever driven in F1.
+    If the year parameter is specified, this function returns the list of all constructors who participated F1 in that year.
+    If the year and race parameters are specified, this function returns the list of all constructors for a particular race.
+
+    Parameters
+    ----------
+    year: int
+        An optional parameter that specifies the year to be queried.
+    race: int
+        An optional parameter that specifies the round of a year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        constructorId: str
+        url: str
+        name: str
+        nationality: str
+
+    Example
+    -------
+    >>> pyergast.get_constructors(year=2003, race=10)
+      constructorId                                                url      name nationality
+    0           bar  http://en.wikipedia.org/wiki/British_American_...       BAR     British
+    1       ferrari      http://en.wikipedia.org/wiki/Scuderia_Ferrari   Ferrari     Italian
+    2        jaguar         http://en.wikipedia.org/wiki/Jaguar_Racing    Jaguar     British
+    3        jordan     http://en.wikipedia.org/wiki/Jordan_Grand_Prix    Jordan       Irish
+    4       mclaren               http://en.wikipedia.org/wiki/McLaren   McLaren     British
+    5       minardi               http://en.wikipedia.org/wiki/Minardi   Minardi     Italian
+    6       renault  http://en.wikipedia.org/wiki/Renault_in_Formul...   Renault      French
+    7        sauber                http://en.wikipedia.org/wiki/Sauber    Sauber       Swiss
+    8        toyota         http://en.wikipedia.org/wiki/Toyota_Racing    Toyota    Japanese
+    9      williams  http://en.wikipedia.org/wiki/Williams_Grand_Pr...  Williams     British
+    """
+    if year and race:
+        url = 'http://api.jolpi.ca/ergast/f1/{}/constructors.json'.format(year, race)
+    elif year:
+        url = 'http://api.jolpi.ca/ergast/f1/{}/constructors.json'.format(year, race)
+    else:
+        url = 'http://api.jolpi.ca/ergast/f1/constructors.json'
+
+    constructors = get_table(url, 'ConstructorTable', 'Constructors')
+    result = pd.DataFrame(constructors)
+
+    return result
+
+
+@typeable
+@memoize
+def get_circuits(year=None, race=None):
+    """
+    Queries the API to obtain the list of circuits in a pandas dataframe format.
+    By default, this function returns the list of all circuits ever used in F1.
+    If the year parameter is specified, this function returns the list of all circuits used in F1 in that year.
+    If the year and race parameters are specified, this function returns the information of the circuit that hosted the specified race in specified year.
+
+    Parameters
+    ----------
+    year: int
+        An optional parameter that specifies the year to be queried.
+    race: int
+        An optional parameter that specifies the round of a year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        circuitId: str
+        url: str
+        circuitName: str
+        Latitude: int
+        Longtitude: int
+        Locality: str
+        Country: str
+
+    Example
+    -------
+    >>> pyergast.get_circuits(year=1985, race=3)
+             circuitId                                                url  ...        Locality       Country
+    0         adelaide  http://en.wikipedia.org/wiki/Adelaide_Street_C...  ...        Adelaide     Australia
+    1     brands_hatch          http://en.wikipedia.org/wiki/Brands_Hatch  ...            Kent            UK
+    2          detroit  http://en.wikipedia.org/wiki/Detroit_street_ci...  ...         Detroit           USA
+    3          estoril  http://en.wikipedia.org/wiki/Aut%C3%B3dromo_do...  ...         Estoril      Portugal
+    4            imola  http://en.wikipedia.org/wiki/Autodromo_Enzo_e_...  ...           Imola         Italy
+    5      jacarepagua  http://en.wikipedia.org/wiki/Aut%C3%B3dromo_In...  ...  Rio de Janeiro        Brazil
+    6          kyalami               http://en.wikipedia.org/wiki/Kyalami  ...         Midrand  South Africa
+    7           monaco     http://en.wikipedia.org/wiki/Circuit_de_Monaco  ...     Monte-Carlo        Monaco
+    8            monza  http://en.wikipedia.org/wiki/Autodromo_Naziona...  ...           Monza         Italy
+    9      nurburgring      http://en.wikipedia.org/wiki/N%C3%BCrburgring  ...         Nürburg       Germany
+    10  osterreichring               http://en.wikipedia.org/wiki/A1-Ring  ...       Spielburg       Austria
+    11          ricard   http://en.wikipedia.org/wiki/Paul_Ricard_Circuit  ...    Le Castellet        France
+    12     silverstone   http://en.wikipedia.org/wiki/Silverstone_Circuit  ...     Silverstone            UK
+    13             spa  http://en.wikipedia.org/wiki/Circuit_de_Spa-Fr...  ...             Spa       Belgium
+    14      villeneuve  http://en.wikipedia.org/wiki/Circuit_Gilles_Vi...  ...        Montreal        Canada
+    15       zandvoort     http://en.wikipedia.org/wiki/Circuit_Zandvoort  ...       Zandvoort   Netherlands
+
+    [16 rows x 7 columns]
+    """
+    if year and race:
+        url = 'http://api.jolpi.ca/ergast/f1/{}/circuits.json'.format(year, race)
+    elif year:
+        url = 'http://api.jolpi.ca/ergast/f1/{}/circuits.json'.format(year, race)
+    else:
+        url = 'http://api.jolpi.ca/ergast/f1/circuits.json'
+
+    circuits = get_table(url, 'CircuitTable', 'Circuits')
+    result = normalize(circuits, CIRCUIT_COLUMNS)
+    return result
+
+
+# Per kind of reference index: the ID field and the fields searched by `ReferenceIndex.search`, each a tuple of columns
+# joined with spaces. The ID always comes first.
+REFERENCE_FIELDS = {
+    'drivers': ('driverId', [('driverId',), ('givenName', 'familyName')]),
+    'constructors': ('constructorId', [('constructorId',), ('name',)]),
+    'circuits': ('circuitId', [('circuitId',), ('circuitName',), ('Locality',), ('Country',)]),
+}
+
+
+def fold(text):
+    """
+    Helper function that lowercases text and strips its accents
+
+    Example
+    -------
+    >>> pyergast.fold('Hülkenberg')
+    'hulkenberg'
+    """
+    return unicodedata.normalize('NFKD', str(text)).encode('ascii', 'ignore').decode('ascii').lower()
+
+
+class ReferenceIndex:
+    """
+    Locally persisted index of every driver, constructor or circuit, used by the `find_*` functions instead of
+    downloading the whole all-time list on each call.
+
+    The list is downloaded once and stored as JSON next to the response cache. When it is older than
+    `refresh_after` seconds, only the current season's list is fetched and new entries are appended. Lookups by ID
+    go through a dict, and searches go through a trigram index over accent-folded names, so neither scans the list.
+
+    Parameters
+    ----------
+    kind: str
+        One of 'drivers', 'constructors' or 'circuits'.
+    path: str
+        Location of the JSON file. If None, the index is kept in memory only.
+    refresh_after: int
+        Age in seconds after which the index is refreshed with the current season.
+    """
+
+    def __init__(self, kind, path=None, refresh_after=7 * 24 * 60 * 60):
+        self.kind = kind
+        self.path = path
+        self.refresh_after = refresh_after
+        self.id_field, self.fields = REFERENCE_FIELDS[kind]
+        self.records = []
+        self.refreshed = 0
+        self.frame = None
+        self.by_id = {}
+        self.keys = []
+        self.trigrams = defaultdict(set)
+
+    def load(self):
+        if self.path and os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.records = data['records']
+            self.refreshed = data['refreshed']
+            if time.time() - self.refreshed > self.refresh_after:
+                self.refresh()
+        else:
+            self.records = frame_records(self.fetch())
+            self.refreshed = time.time()
+            self.save()
+        self.build()
+        return self
+
+    def fetch(self, year=None):
+        query = {'drivers': get_drivers, 'constructors': get_constructors, 'circuits': get_circuits}[self.kind]
+        return query(year)
+
+    def refresh(self):
+        """
+        Appends the entries of the current season that are not in the index yet.
+        If the season cannot be fetched, the index is kept as it is.
+        """
+        known = {record[self.id_field] for record in self.records}
+        try:
+            season = frame_records(self.fetch(date.today().year))
+        except (requests.RequestException, KeyError):
+            return
+        self.records += [record for record in season if record[self.id_field] not in known]
+        self.refreshed = time.time()
+        self.save()
+        self.build()
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'refreshed': self.refreshed, 'records': self.records}, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def build(self):
+        self.frame = pd.DataFrame(self.records)
+        self.by_id = {record[self.id_field]: i for i, record in enumerate(self.records)}
+        # One folded search key per record, fields separated by a character no query contains
+        self.keys = ['\0'.join(fold(' '.join(str(record.get(column, '')) for column in field))
+                               for field in self.fields)
+                     for record in self.records]
+        self.trigrams = defaultdict(set)
+        for i, key in enumerate(self.keys):
+            for j in range(len(key) - 2):
+                self.trigrams[key[j:j + 3]].add(i)
+
+    def get(self, entity_id):
+        """
+        Returns the row of `entity_id` as a pandas Series, or None if it is unknown.
+        """
+        i = self.by_id.get(entity_id)
+        return None if i is None else self.frame.iloc[i]
+
+    def search(self, query, fields=None):
+        """
+        Returns the positions of the rows with a search field containing `query`, ignoring case and accents.
+        `fields` restricts the search to some of the fields, given by position (0 is the ID), all of them by default.
+        """
+        query = fold(query)
+
+        def matches(key):
+            if fields is None:
+                return query in key
+            parts = key.split('\0')
+            return any(query in parts[field] for field in fields)
+
+        if len(query) < 3:
+            return [i for i, key in enumerate(self.keys) if matches(key)]
+
+        candidates = None
+        for j in range(len(query) - 2):
+            rows = self.trigrams.get(query[j:j + 3], set())
+            candidates = rows if candidates is None else candidates & rows
+            if not candidates:
+                return []
+        return sorted(i for i in candidates if matches(self.keys[i]))
+
+    def similar(self, query, limit=5):
+        """
+        Returns the `limit` rows sharing the most trigrams with `query`, for misspelt names.
+
+        Example
+        -------
+        >>> pyergast.reference_index('drivers').similar('hamiltn', limit=1)
+             driverId                                          url givenName  ... nationality permanentNumber code
+        356  hamilton  http://en.wikipedia.org/wiki/Lewis_Hamilton     Lewis  ...     British              44  HAM
+        """
+        query = fold(query)
+        scores = defaultdict(int)
+        for j in range(len(query) - 2):
+            for i in self.trigrams.get(query[j:j + 3], ()):
+                scores[i] += 1
+        best = sorted(scores, key=lambda i: (-scores[i], i))[:limit]
+        return self.frame.iloc[best]
+
+
+_reference_indexes = {}
+
+
+def reference_index(kind):
+    """
+    Returns the local `ReferenceIndex` of 'drivers', 'constructors' or 'circuits', building it on first use.
+    The index is persisted next to the response cache, or kept in memory if the cache is disabled.
+
+    Example
+    -------
+    >>> pyergast.reference_index('constructors').get('ferrari')['name']
+    'Ferrari'
+    """
+    if kind not in _reference_indexes:
+        path = None
+        if client.cache is not None:
+            path = os.path.join(os.path.dirname(os.path.abspath(client.cache.path)), 'reference', kind + '.json')
+        _reference_indexes[kind] = ReferenceIndex(kind, path).load()
+    return _reference_indexes[kind]
+
+
+def frame_records(result):
+    """
+    Helper function that converts a dataframe to a list of dicts, leaving out missing values
+    """
+    return [{key: value for key, value in record.items() if pd.notna(value)} for record in result.to_dict('records')]
+
+
+def find_driverid(firstname, lastname):
+    """
+    Searches the list of all drivers to find ones that are the same or similar to the input.
+    Driver IDs containing either name are found through the local `reference_index`, ignoring case and accents.
+
+    Parameters
+    ----------
+    firstname: str
+        The first name of the driver
+    lastname: str
+        The last name of the driver
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        driverId: str
+        permanentNumber: int
+        code: str
+        url: str
+        givenName: str
+        familyName: str
+        dateOfBirth: str
+        nationality: str
+
+    Example
+    -------
+    >>> pyergast.find_driverid('peter', 'collins')
+             driverId                                                url givenName  ... nationality permanentNumber code
+    167       collins  http://en.wikipedia.org/wiki/Peter_Collins_(ra...     Peter  ...     British             NaN  NaN
+    595        peters  http://en.wikipedia.org/wiki/Josef_Peters_(dri...     Josef  ...      German             NaN  NaN
+    596      peterson       http://en.wikipedia.org/wiki/Ronnie_Peterson    Ronnie  ...     Swedish             NaN  NaN
+    809  peter_walker  http://en.wikipedia.org/wiki/Peter_Walker_(dri...     Peter  ...     British             NaN  NaN
+
+    [4 rows x 8 columns]
+    """
+    index = reference_index('drivers')
+    rows = sorted(set(index.search(firstname, fields=[0])) | set(index.search(lastname, fields=[0])))
+    result = index.frame.loc[rows]
+    return result
+
+
+def find_constructorid(name):
+    """
+    Searches the list of all constructors to find ones that are the same or similar to the input.
+    Constructor IDs containing the name are found through the local `reference_index`, ignoring case and accents.
+
+    Parameters
+    ----------
+    name: str
+        The name of the constructor
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        constructorId: str
+        url: str
+        name: str
+        nationality: str
+
+    Example
+    -------
+    >>> pyergast.find_constructorid('lotus')
+          constructorId                                        url                       name nationality
+    111    lotus_racing  http://en.wikipedia.org/wiki/Lotus_Racing                      Lotus   Malaysian
+    112        lotus_f1      http://en.wikipedia.org/wiki/Lotus_F1                   Lotus F1     British
+    113  lotus-borgward    http://en.wikipedia.org/wiki/Team_Lotus             Lotus-Borgward     British
+    114       lotus-brm    http://en.wikipedia.org/wiki/Team_Lotus                  Lotus-BRM     British
+    115    lotus-climax    http://en.wikipedia.org/wiki/Team_Lotus               Lotus-Climax     British
+    116      lotus-ford    http://en.wikipedia.org/wiki/Team_Lotus                 Lotus-Ford     British
+    117  lotus-maserati    http://en.wikipedia.org/wiki/Team_Lotus             Lotus-Maserati     British
+    118        lotus-pw    http://en.wikipedia.org/wiki/Team_Lotus  Lotus-Pratt &amp; Whitney     British
+    191      team_lotus    http://en.wikipedia.org/wiki/Team_Lotus                 Team Lotus     British
+    """
+    index = reference_index('constructors')
+    result = index.frame.loc[index.search(name, fields=[0])]
+    return result
+
+
+def find_circuitid(circuit):
+    """
+    Searches the list of all the circuits that are similar to the input.
+    Matches go through the local `reference_index`, ignoring case and accents.
+
+    Parameters
+    ----------
+    circuit: str
+        The name of the circuit. Actual circuit name, locality, or country are all accepted.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        circuitId: str
+        url: str
+        circuitName: str
+        Latitude: int
+        Longtitude: int
+        Locality: str
+        Country: str
+
+    Example
+    -------
+    >>> pyergast.find_circuitid('brazil')
+          circuitId                                                url  ...        Locality Country
+    29   interlagos  http://en.wikipedia.org/wiki/Aut%C3%B3dromo_Jo...  ...       São Paulo  Brazil
+    31  jacarepagua  http://en.wikipedia.org/wiki/Aut%C3%B3dromo_In...  ...  Rio de Janeiro  Brazil
+
+    [2 rows x 7 columns]
+    """
+    index = reference_index('circuits')
+    result = index.frame.loc[index.search(circuit)]
+    return result
+
+
+@typeable
+@local_source
+@memoize
+def get_race_result(year=None, race=None):
+    """
+    Queries the API to return race results in a pandas dataframe format.
+    By default this method returns the most recent result
+
+    Parameters
+    ----------
+    year: int
+        An optional parameter that specifies the year to be queried.
+    race: int
+        An optional parameter that specifies the round of a year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        number: int
+        position: int
+        positionText: str
+        grid: int
+        points: int
+        driverID: str
+        driver: str
+        nationality: str
+        constructorID: str
+        constructor: str
+        laps: int
+        status: str
+        Time: dict
+
+    Example
+    -------
+    >>> pyergast.get_race_result()
+       number position positionText grid  ...   constructor laps        status                                          Time
+    0      33        1            1    1  ...      Red Bull   55      Finished  {'millis': '5788645', 'time': '1:36:28.645'}
+    1      77        2            2    2  ...      Mercedes   55      Finished      {'millis': '5804621', 'time': '+15.976'}
+    2      44        3            3    3  ...      Mercedes   55      Finished      {'millis': '5807060', 'time': '+18.415'}
+    3      23        4            4    5  ...      Red Bull   55      Finished      {'millis': '5808632', 'time': '+19.987'}
+    4       4        5            5    4  ...       McLaren   55      Finished    {'millis': '5849374', 'time': '+1:00.729'}
+    5      55        6            6    6  ...       McLaren   55      Finished    {'millis': '5854307', 'time': '+1:05.662'}
+    6       3        7            7   11  ...       Renault   55      Finished    {'millis': '5862393', 'time': '+1:13.748'}
+    7      10        8            8    9  ...    AlphaTauri   55      Finished    {'millis': '5878363', 'time': '+1:29.718'}
+    8      31        9            9   10  ...       Renault   55      Finished      {'millis': '5799996', 'time': '+11.351'}
+    9      18       10           10    8  ...  Racing Point   55      Finished       {'millis': '5790314', 'time': '+1.669'}
+    10     26       11           11    7  ...    AlphaTauri   54        +1 Lap                                           NaN
+    11      7       12           12   15  ...    Alfa Romeo   54        +1 Lap                                           NaN
+    12     16       13           13   12  ...       Ferrari   54        +1 Lap                                           NaN
+    13      5       14           14   13  ...       Ferrari   54        +1 Lap                                           NaN
+    14     63       15           15   16  ...      Williams   54        +1 Lap                                           NaN
+    15     99       16           16   14  ...    Alfa Romeo   54        +1 Lap                                           NaN
+    16      6       17           17   18  ...      Williams   54        +1 Lap                                           NaN
+    17     20       18           18   20  ...  Haas F1 Team   54        +1 Lap                                           NaN
+    18     51       19           19   17  ...  Haas F1 Team   53       +2 Laps                                           NaN
+    19     11       20            R   19  ...  Racing Point    8  Transmission                                           NaN
+
+    [20 rows x 13 columns]
+    """
+    if year or race:
+        assert year and race, 'You must specify both a year and a race'
+        season = season_slice('get_season_results', year, race)
+        if season is not None:
+            return season
+        url = 'http://api.jolpi.ca/ergast/f1/{}/{}/results.json'.format(year, race)
+    else:
+        url = 'http://api.jolpi.ca/ergast/f1/current/last/results.json'
+
+    # Results of one race can be split across pages, each page repeating the race
+    races = get_table(url, 'RaceTable', 'Races')
+    result_dict = [driver for race in races for driver in race['Results']]
+    result = normalize(result_dict, RESULT_COLUMNS)
+
+    # Fallback to qualifying results if grid values are null/None
+    return fill_grid(result, lambda: get_qualifying_result(year, race), year=year)
+
+
+@typeable
+@local_source
+@memoize
+def get_qualifying_result(year=None, race=None):
+    """
+    Queries the API to return qualifying results in a pandas dataframe format.
+    By default this method returns the most recent result
+
+    Parameters
+    ----------
+    year: int
+        An optional parameter that specifies the year to be queried.
+    race: int
+        An optional parameter that specifies the round of a year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        number: int
+        position: int
+        driverID: str
+        driver: str
+        nationality: str
+        constructorID: str
+        constructor: str
+        Q1: str
+        Q2: str
+        Q3: str
+
+    Example
+    -------
+    >>> pyergast.get_qualifying_result()
+       number position           driverID              driver  ...   constructor        Q1        Q2        Q3
+    0      33        1     max_verstappen      Max Verstappen  ...      Red Bull  1:35.993  1:35.641  1:35.246
+    1      77        2             bottas     Valtteri Bottas  ...      Mercedes  1:35.699  1:35.527  1:35.271
+    2      44        3           hamilton      Lewis Hamilton  ...      Mercedes  1:35.528  1:35.466  1:35.332
+    3       4        4             norris        Lando Norris  ...       McLaren  1:36.016  1:35.849  1:35.497
+    4      23        5              albon     Alexander Albon  ...      Red Bull  1:36.106  1:35.654  1:35.571
+    5      55        6              sainz        Carlos Sainz  ...       McLaren  1:36.517  1:36.192  1:35.815
+    6      26        7              kvyat        Daniil Kvyat  ...    AlphaTauri  1:36.459  1:36.214  1:35.963
+    7      18        8             stroll        Lance Stroll  ...  Racing Point  1:36.502  1:36.143  1:36.046
+    8      16        9            leclerc     Charles Leclerc  ...       Ferrari  1:35.881  1:35.932  1:36.065
+    9      10       10              gasly        Pierre Gasly  ...    AlphaTauri  1:36.545  1:36.282  1:36.242
+    10     31       11               ocon        Esteban Ocon  ...       Renault  1:36.783  1:36.359       NaN
+    11      3       12          ricciardo    Daniel Ricciardo  ...       Renault  1:36.704  1:36.406       NaN
+    12      5       13             vettel    Sebastian Vettel  ...       Ferrari  1:36.655  1:36.631       NaN
+    13     99       14         giovinazzi  Antonio Giovinazzi  ...    Alfa Romeo  1:37.075  1:38.248       NaN
+    14     11       15              perez        Sergio Pérez  ...  Racing Point  1:36.034       NaN       NaN
+    15      7       16          raikkonen      Kimi Räikkönen  ...    Alfa Romeo  1:37.555       NaN       NaN
+    16     20       17    kevin_magnussen     Kevin Magnussen  ...  Haas F1 Team  1:37.863       NaN       NaN
+    17     63       18            russell      George Russell  ...      Williams  1:38.045       NaN       NaN
+    18     51       19  pietro_fittipaldi   Pietro Fittipaldi  ...  Haas F1 Team  1:38.173       NaN       NaN
+    19      6       20             latifi     Nicholas Latifi  ...      Williams  1:38.443       NaN       NaN
+
+    [20 rows x 10 columns]
+    """
+    if year and race:
+        assert year >= 1996, 'Qualifying data only available starting from 1996'
+        season = season_slice('get_season_qualifying', year, race)
+        if season is not None:
+            # Drop the sessions that did not exist in this round's qualifying format
+            return season.drop(columns=[q for q in ('Q2', 'Q3') if season[q].isna().all()])
+        url = 'http://api.jolpi.ca/ergast/f1/{}/{}/qualifying.json'.format(year, race)
+    else:
+        url = 'http://api.jolpi.ca/ergast/f1/current/last/qualifying.json'
+
+    # Results of one race can be split across pages, each page repeating the race
+    races = get_table(url, 'RaceTable', 'Races')
+    result_dict = [driver for race in races for driver in race['QualifyingResults']]
+    result = normalize(result_dict, QUALIFYING_COLUMNS)
+    if not result_dict:
+        # Not published yet
+        return result
+
+    # Drop the sessions that did not exist in this qualifying format
+    return result.drop(columns=[q for q in ('Q2', 'Q3') if q not in result_dict[0]])
+
+
+@typeable
+@local_source
+@memoize
+def get_schedule(year=None):
+    """
+    Queries the API to return the schedule of a specified season. Defaults to most recent season.
+
+    Parameters
+    ----------
+    year: int
+        An optional parameter that specifies the year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        season: int
+        round: int
+        url: str
+        raceName: str
+        date: str
+        circuitId: str
+        circuitName: str
+        locality: str
+        country: str
+
+    Example
+    -------
+    >>> pyergast.get_schedule(1957)
+      season round  ...      locality    country
+    0   1957     1  ...  Buenos Aires  Argentina
+    1   1957     2  ...   Monte-Carlo     Monaco
+    2   1957     3  ...  Indianapolis        USA
+    3   1957     4  ...         Rouen     France
+    4   1957     5  ...     Liverpool         UK
+    5   1957     6  ...       Nürburg    Germany
+    6   1957     7  ...       Pescara      Italy
+    7   1957     8  ...         Monza      Italy
+
+    [8 rows x 9 columns]
+    """
+    if year:
+        url = 'http://api.jolpi.ca/ergast/f1/{}.json'.format(year)
+    else:
+        url = 'http://api.jolpi.ca/ergast/f1/current.json'
+
+    schedule = get_table(url, 'RaceTable', 'Races')
+
+    # Unpack the lists of dicts in result_dict and reformat the result
+    for race in schedule:
+        circuit = unpack_lists(race)[0]
+        race['circuitID'] = circuit['circuitId']
+        race['circuitName'] = circuit['circuitName']
+        race['locality'] = circuit['Location']['locality']
+        race['country'] = circuit['Location']['country']
+        del race['Circuit']
+
+    return pd.DataFrame(schedule)
+
+
+@typeable
+@local_source
+@memoize
+def driver_standings(year=None, race=None):
+    """
+    Fetch the driver standings after a specific race in a specific year. Defaults to latest standings
+
+    Parameters
+    ----------
+    year: int
+        An optional parameter that specifies the year to be queried.
+    race: int
+        An optional parameter that specifies the round of a year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        position: int
+        positionText: str
+        points: int
+        wins: int
+        driverID: str
+        driver: str
+        nationality: str
+        constructorID: str
+        constructor: str
+
+    Example
+    -------
+    >>> pyergast.driver_standings(1974)
+       position positionText points wins            driverID              driver    nationality constructorID constructor
+    0         1            1     55    3  emerson_fittipaldi  Emerson Fittipaldi      Brazilian       mclaren     McLaren
+    1         2            2     52    1           regazzoni      Clay Regazzoni          Swiss       ferrari     Ferrari
+    2         3            3     45    2           scheckter      Jody Scheckter  South African       tyrrell     Tyrrell
+    3         4            4     38    2               lauda          Niki Lauda       Austrian       ferrari     Ferrari
+    4         5            5     35    3            peterson     Ronnie Peterson        Swedish    team_lotus  Team Lotus
+    ..      ...          ...    ...  ...                 ...                 ...            ...           ...         ...
+    57       58           58      0    0              purley        David Purley        British         token       Token
+    58       59           59      0    0             facetti       Carlo Facetti        Italian       brabham     Brabham
+    59       60           60      0    0            lombardi      Lella Lombardi        Italian       brabham     Brabham
+    60       61           61      0    0             perkins       Larry Perkins     Australian          amon        Amon
+    61       62           62      0    0           nicholson      John Nicholson  New Zealander        lyncar      Lyncar
+
+    [62 rows x 9 columns]
+    """
+    if year and race:
+        season = season_slice('get_season_standings', year, race, False)
+        if season is not None:
+            return season
+        url = 'http://api.jolpi.ca/ergast/f1/{}/{}/driverStandings.json'.format(year, race)
+    elif year:
+        url = 'http://api.jolpi.ca/ergast/f1/{}/driverStandings.json'.format(year, race)
+    else:
+        url = 'http://api.jolpi.ca/ergast/f1/current/driverStandings.json'
+
+    standings_lists = get_table(url, 'StandingsTable', 'StandingsLists')
+    return normalize(standings_lists, DRIVER_STANDINGS_COLUMNS, record_path='DriverStandings')
+
+
+@typeable
+@local_source
+@memoize
+def constructor_standings(year=None, race=None):
+    """
+    Fetch the constructor standings after a specific race in a specific year. Defaults to latest standings
+
+    Parameters
+    ----------
+    year: int
+        An optional parameter that specifies the year to be queried.
+    race: int
+        An optional parameter that specifies the round of a year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        position: int
+        positionText: str
+        points: int
+        wins: int
+        constructorID: str
+        constructor: str
+        nationality: str
+
+    Example
+    -------
+    >>> pyergast.constructor_standings(1965)
+       position positionText points wins    constructorID             name    nationality
+    0         1            1     54    6     lotus-climax     Lotus-Climax        British
+    1         2            2     45    3              brm              BRM        British
+    2         3            3     27    0   brabham-climax   Brabham-Climax        British
+    3         4            4     26    0          ferrari          Ferrari        Italian
+    4         5            5     14    0    cooper-climax    Cooper-Climax        British
+    5         6            6     11    1            honda            Honda       Japanese
+    6         7            7      5    0      brabham-brm      Brabham-BRM        British
+    7         8            8      2    0        lotus-brm        Lotus-BRM        British
+    8         9            9      0    0     brabham-ford     Brabham-Ford        British
+    9        10           10      0    0             alfa       Alfa Romeo        Italian
+    10       11           11      0    0   lds-alfa_romeo   LDS-Alfa Romeo  South African
+    11       12           12      0    0      cooper-ford      Cooper-Ford        British
+    12       13           13      0    0       lds-climax       LDS-Climax  South African
+    13       14           14      0    0       lotus-ford       Lotus-Ford        British
+    14       15           15      0    0               re               RE      Rhodesian
+    15       16           16      0    0  cooper-maserati  Cooper-Maserati        British
+    """
+    if year and race:
+        assert year >= 1958, 'Constructor standings only available starting 1958'
+        season = season_slice('get_season_standings', year, race, True)
+        if season is not None:
+            return season
+        url = 'http://api.jolpi.ca/ergast/f1/{}/{}/constructorStandings.json'.format(year, race)
+    elif year:
+        assert year >= 1958, 'Constructor standings only available starting 1958'
+        url = 'http://api.jolpi.ca/ergast/f1/{}/constructorStandings.json'.format(year, race)
+    else:
+        url = 'http://api.jolpi.ca/ergast/f1/current/constructorStandings.json'
+
+    standings_lists = get_table(url, 'StandingsTable', 'StandingsLists')
+    return normalize(standings_lists, CONSTRUCTOR_STANDINGS_COLUMNS, record_path='ConstructorStandings')
+
+
+@typeable
+@local_source
+@memoize
+def query_driver(driverid):
+    """
+    Fetches the driver's historical driver standings position
+
+    Parameters
+    ----------
+    driverid: str
+        A string representing the driver id of the driver. Use `find_driverid` method to obtain constructorid
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        season: int
+        round: int
+        position: int
+        positionText: str
+        points: int
+        wins: int
+        driver: str
+        nationality: str
+        constructorID: str
+        constructor: str
+
+    Example
+    -------
+    >>> pyergast.query_driver('raikkonen')
+       season round position positionText points wins          driver nationality constructorID constructor
+    0    2001    17       10           10      9    0  Kimi Räikkönen     Finnish        sauber      Sauber
+    1    2002    17        6            6     24    0  Kimi Räikkönen     Finnish       mclaren     McLaren
+    2    2003    16        2            2     91    1  Kimi Räikkönen     Finnish       mclaren     McLaren
+    3    2004    18        7            7     45    1  Kimi Räikkönen     Finnish       mclaren     McLaren
+    4    2005    19        2            2    112    7  Kimi Räikkönen     Finnish       mclaren     McLaren
+    5    2006    18        5            5     65    0  Kimi Räikkönen     Finnish       mclaren     McLaren
+    6    2007    17        1            1    110    6  Kimi Räikkönen     Finnish       ferrari     Ferrari
+    7    2008    18        3            3     75    2  Kimi Räikkönen     Finnish       ferrari     Ferrari
+    8    2009    17        6            6     48    1  Kimi Räikkönen     Finnish       ferrari     Ferrari
+    9    2012    20        3            3    207    1  Kimi Räikkönen     Finnish      lotus_f1    Lotus F1
+    10   2013    19        5            5    183    1  Kimi Räikkönen     Finnish      lotus_f1    Lotus F1
+    11   2014    19       12           12     55    0  Kimi Räikkönen     Finnish       ferrari     Ferrari
+    12   2015    19        4            4    150    0  Kimi Räikkönen     Finnish       ferrari     Ferrari
+    13   2016    21        6            6    186    0  Kimi Räikkönen     Finnish       ferrari     Ferrari
+    14   2017    20        4            4    205    0  Kimi Räikkönen     Finnish       ferrari     Ferrari
+    15   2018    21        3            3    251    1  Kimi Räikkönen     Finnish       ferrari     Ferrari
+    16   2019    21       12           12     43    0  Kimi Räikkönen     Finnish          alfa  Alfa Romeo
+    17   2020    17       16           16      4    0  Kimi Räikkönen     Finnish          alfa  Alfa Romeo
+    """
+    url = 'http://api.jolpi.ca/ergast/f1/drivers/{}/driverStandings.json'.format(driverid)
+    seasons = get_table(url, 'StandingsTable', 'StandingsLists')
+
+    return normalize(seasons, DRIVER_CAREER_COLUMNS, record_path='DriverStandings', meta=['season', 'round'])
+
+
+@typeable
+@local_source
+@memoize
+def query_constructor(constructorid):
+    """
+    Fetches the consturctor's historical constructor standings position
+
+    Parameters
+    ----------
+    constructorid: str
+        A string representing the constructor id of the constructor. Use `find_constructorid` function to obtain constructorid
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        season: int
+        round: int
+        position: int
+        positionText: str
+        points: int
+        wins: int
+        constructorID: str
+        constructor: str
+        nationality: str
+
+    Example
+    -------
+    >>> pyergast.query_constructor('alfa')
+       season round position positionText points wins constructorID constructor nationality
+    0    1963    10       16           16      0    0          alfa  Alfa Romeo     Italian
+    1    1965    10       10           10      0    0          alfa  Alfa Romeo     Italian
+    2    1979    15       16           16      0    0          alfa  Alfa Romeo     Italian
+    3    1980    14       11           11      4    0          alfa  Alfa Romeo     Italian
+    4    1981    15        9            9     10    0          alfa  Alfa Romeo     Italian
+    5    1982    16        9            9      7    0          alfa  Alfa Romeo     Italian
+    6    1983    15        6            6     18    0          alfa  Alfa Romeo     Italian
+    7    1984    16        8            8     11    0          alfa  Alfa Romeo     Italian
+    8    1985    16       12           12      0    0          alfa  Alfa Romeo     Italian
+    9    2019    21        8            8     57    0          alfa  Alfa Romeo     Italian
+    10   2020    17        8            8      8    0          alfa  Alfa Romeo     Italian
+    """
+    url = 'http://api.jolpi.ca/ergast/f1/constructors/{}/constructorStandings.json'.format(constructorid)
+    seasons = get_table(url, 'StandingsTable', 'StandingsLists')
+
+    return normalize(seasons, CONSTRUCTOR_CAREER_COLUMNS, record_path='ConstructorStandings', meta=['season', 'round'])
+
+
+def unpack_lists(driver):
+    """
+    Helper function that unpacks dictionaries in a dataframe and packs them into a new list of dicts
+
+    Parameters
+    ----------
+    df_input: dict
+        A dictionary of dictionaries
+
+    Returns
+    -------
+    list
+
+    Examples
+    --------
+    >>> pyErgast.unpack_lists({'a': {'a1': 1}, 'b': 1})
+    [{'a1': 1}]
+    """
+    result = []
+    for key in driver.keys():
+        if isinstance(driver[key], dict):
+            result.append(driver[key])
+    return result
+
+
+@typeable
+@local_source
+@memoize
+def get_sprint_result(year=None, race=None):
+    """
+    Queries the API to return sprint results in a pandas dataframe format.
+    By default this method returns the most recent sprint result
+
+    Parameters
+    ----------
+    year: int
+        An optional parameter that specifies the year to be queried.
+    race: int
+        An optional parameter that specifies the round of a year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        RangeIndex
+
+    Columns:
+        number: int
+        position: int
+        positionText: str
+        grid: int
+        points: int
+        driverID: str
+        driver: str
+        nationality: str
+        constructorID: str
+        constructor: str
+        laps: int
+        status: str
+        Time: dict
+
+    Example
+    -------
+    >>> pyergast.get_sprint_result()
+       number position positionText grid  ...   constructor laps        status                                          Time
+    0      33        1            1    1  ...      Red Bull   55      Finished  {'millis': '5788645', 'time': '1:36:28.645'}
+    1      77        2            2    2  ...      Mercedes   55      Finished      {'millis': '5804621', 'time': '+15.976'}
+    2      44        3            3    3  ...      Mercedes   55      Finished      {'millis': '5807060', 'time': '+18.415'}
+    3      23        4            4    5  ...      Red Bull   55      Finished      {'millis': '5808632', 'time': '+19.987'}
+    4       4        5            5    4  ...       McLaren   55      Finished    {'millis': '5849374', 'time': '+1:00.729'}
+    5      55        6            6    6  ...       McLaren   55      Finished    {'millis': '5854307', 'time': '+1:05.662'}
+    6       3        7            7   11  ...       Renault   55      Finished    {'millis': '5862393', 'time': '+1:13.748'}
+    7      10        8            8    9  ...    AlphaTauri   55      Finished    {'millis': '5878363', 'time': '+1:29.718'}
+    8      31        9            9   10  ...       Renault   55      Finished      {'millis': '5799996', 'time': '+11.351'}
+    9      18       10           10    8  ...  Racing Point   55      Finished       {'millis': '5790314', 'time': '+1.669'}
+    10     26       11           11    7  ...    AlphaTauri   54        +1 Lap                                           NaN
+    11      7       12           12   15  ...    Alfa Romeo   54        +1 Lap                                           NaN
+    12     16       13           13   12  ...       Ferrari   54        +1 Lap                                           NaN
+    13      5       14           14   13  ...       Ferrari   54        +1 Lap                                           NaN
+    14     63       15           15   16  ...      Williams   54        +1 Lap                                           NaN
+    15     99       16           16   14  ...    Alfa Romeo   54        +1 Lap                                           NaN
+    16      6       17           17   18  ...      Williams   54        +1 Lap                                           NaN
+    17     20       18           18   20  ...  Haas F1 Team   54        +1 Lap                                           NaN
+    18     51       19           19   17  ...  Haas F1 Team   53       +2 Laps                                           NaN
+    19     11       20            R   19  ...  Racing Point    8  Transmission                                           NaN
+
+    [20 rows x 13 columns]
+    """
+    if year or race:
+        assert year and race, 'You must specify both a year and a race'
+        season = season_slice('get_season_sprints', year, race)
+        if season is not None:
+            return season
+        url = 'http://api.jolpi.ca/ergast/f1/{}/{}/sprint.json'.format(year, race)
+    else:
+        url = 'http://api.jolpi.ca/ergast/f1/current/last/sprint.json'
+
+    # Results of one race can be split across pages, each page repeating the race
+    races = get_table(url, 'RaceTable', 'Races')
+    result_dict = [driver for race in races for driver in race['SprintResults']]
+    result = normalize(result_dict, RESULT_COLUMNS)
+
+    # Fallback to qualifying results if grid values are null/None
+    return fill_grid(result, lambda: get_qualifying_result(year, race), year=year)
+
+
+@typeable
+@local_source
+@memoize
+def get_season_results(year):
+    """
+    Queries the API to return the race results of every round of a season in a single pandas dataframe.
+    The season is fetched through the season-wide results endpoint in a few paged requests instead of one request
+    per round. Once loaded, `get_race_result(year, race)` slices its result from this dataframe.
+
+    Parameters
+    ----------
+    year: int
+        The year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        round: int
+
+    Columns:
+        Same as `get_race_result`
+
+    Example
+    -------
+    >>> pyergast.get_season_results(2020).loc[[15]]
+          number position positionText grid  ...   constructor laps        status                                          Time
+    round
+    15        44        1            1    1  ...      Mercedes   87      Finished  {'millis': '5472578', 'time': '1:31:12.578'}
+    15        33        2            2    2  ...      Red Bull   87      Finished      {'millis': '5485197', 'time': '+12.619'}
+    ...
+    """
+    result = season_frame(year, 'results', 'Results', RESULT_COLUMNS)
+
+    # Fallback to qualifying results if grid values are null/None
+    result = fill_grid(result.reset_index(), lambda: get_season_qualifying(year).reset_index(), ['round', 'driverID'],
+                       year=year)
+    return result.set_index('round')
+
+
+@typeable
+@local_source
+@memoize
+def get_season_qualifying(year):
+    """
+    Queries the API to return the qualifying results of every round of a season in a single pandas dataframe.
+    Once loaded, `get_qualifying_result(year, race)` slices its result from this dataframe.
+
+    Parameters
+    ----------
+    year: int
+        The year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        round: int
+
+    Columns:
+        Same as `get_qualifying_result`. Q2 and Q3 are NaN for drivers eliminated earlier.
+
+    Example
+    -------
+    >>> pyergast.get_season_qualifying(2020).loc[[15]]
+          number position     driverID           driver  ...   constructor        Q1        Q2        Q3
+    round
+    15        44        1     hamilton   Lewis Hamilton  ...      Mercedes  1:29.297  1:28.706  1:27.264
+    ...
+    """
+    assert year >= 1996, 'Qualifying data only available starting from 1996'
+    return season_frame(year, 'qualifying', 'QualifyingResults', QUALIFYING_COLUMNS)
+
+
+@typeable
+@local_source
+@memoize
+def get_season_sprints(year):
+    """
+    Queries the API to return the sprint results of every sprint weekend of a season in a single pandas dataframe.
+    Seasons without sprints return an empty dataframe. Once loaded, `get_sprint_result(year, race)` slices its
+    result from this dataframe.
+
+    Parameters
+    ----------
+    year: int
+        The year to be queried.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        round: int
+
+    Columns:
+        Same as `get_sprint_result`
+
+    Example
+    -------
+    >>> pyergast.get_season_sprints(2021).index.unique()
+    Index([10, 14, 19], dtype='int64', name='round')
+    """
+    result = season_frame(year, 'sprint', 'SprintResults', RESULT_COLUMNS)
+    if result.empty:
+        return result
+
+    # Fallback to qualifying results if grid values are null/None
+    result = fill_grid(result.reset_index(), lambda: get_season_qualifying(year).reset_index(), ['round', 'driverID'],
+                       year=year)
+    return result.set_index('round')
+
+
+@typeable
+@local_source
+@memoize
+def get_season_standings(year, constructors=False):
+    """
+    Fetches the driver (or constructor) standings after every round of a season in a single pandas dataframe.
+    The API has no season-wide endpoint for round-by-round standings, so the rounds are fetched concurrently
+    over the pooled client. Once loaded, `driver_standings(year, race)` and `constructor_standings(year, race)`
+    slice their result from this dataframe.
+
+    Parameters
+    ----------
+    year: int
+        The year to be queried.
+    constructors: bool
+        Return constructor standings instead of driver standings.
+    typed: bool
+        Return compact numeric and categorical dtypes instead of strings, see `to_typed`.
+    source: str
+        'api' (default) to query the API, or 'local' to answer from the synced store, see `pyergast.store`.
+
+    Returns
+    -------
+    pandas.DataFrame
+
+    Index:
+        round: int
+
+    Columns:
+        Same as `driver_standings`, or `constructor_standings` if constructors is True
+
+    Example
+    -------
+    >>> pyergast.get_season_standings(2020).loc[[1]].head(3)
+          position positionText points wins  driverID           driver nationality constructorID constructor
+    round
+    1            1            1     25    1    bottas  Valtteri Bottas     Finnish      mercedes    Mercedes
+    1            2            2     18    0   leclerc  Charles Leclerc  Monegasque       ferrari     Ferrari
+    1            3            3     16    0    norris     Lando Norris     British       mclaren     McLaren
+    """
+    table = 'constructorStandings' if constructors else 'driverStandings'
+    page = get_page('http://api.jolpi.ca/ergast/f1/{}/{}.json'.format(year, table), limit=1)
+    lists = page['StandingsTable']['StandingsLists']
+    if not lists:
+        # e.g. the current season before its first round, or a future one
+        spec = CONSTRUCTOR_STANDINGS_COLUMNS if constructors else DRIVER_STANDINGS_COLUMNS
+        return pd.DataFrame(columns=list(spec), index=pd.Index([], dtype=int, name='round'))
+    last_round = int(lists[0]['round'])
+
+    standings = constructor_standings if constructors else driver_standings
+    rounds = list(range(1, last_round + 1))
+    with ThreadPoolExecutor(max_workers=client.pool_size) as executor:
+        frames = list(threaded_map(executor, lambda race: standings(year, race), rounds))
+
+    result = pd.concat(frames, keys=rounds, names=['round', None]).droplevel(1)
+    return result
@@ -0,0 +1,111 @@
+"""
+Asyncio variants of the pyergast query functions.
+
+Every coroutine here runs its synchronous counterpart on a worker thread, so all of them share the pooled
+keep-alive client, the on-disk response cache and the in-process memo of the `pyergast` module. Awaiting several
+of them together overlaps their network round trips, so fetching every table for a Grand Prix costs roughly one
+round trip instead of the sum of all of them.
+
+Example
+-------
+>>> from pyergast import aio
+>>> results, quali = aio.run(aio.get_race_result(2021, 10), aio.get_qualifying_result(2021, 10))
+"""
+import asyncio
+import functools
+
+import pyergast
+
+
+def _threaded(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
+
+
+get_drivers = _threaded(pyergast.get_drivers)
+get_constructors = _threaded(pyergast.get_constructors)
+get_circuits = _threaded(pyergast.get_circuits)
+find_driverid = _threaded(pyergast.find_driverid)
+find_constructorid = _threaded(pyergast.find_constructorid)
+find_circuitid = _threaded(pyergast.find_circuitid)
+get_race_result = _threaded(pyergast.get_race_result)
+get_qualifying_result = _threaded(pyergast.get_qualifying_result)
+get_sprint_result = _threaded(pyergast.get_sprint_result)
+get_schedule = _threaded(pyergast.get_schedule)
+driver_standings = _threaded(pyergast.driver_standings)
+constructor_standings = _threaded(pyergast.constructor_standings)
+query_driver = _threaded(pyergast.query_driver)
+query_constructor = _threaded(pyergast.query_constructor)
+get_season_results = _threaded(pyergast.get_season_results)
+get_season_qualifying = _threaded(pyergast.get_season_qualifying)
+get_season_sprints = _threaded(pyergast.get_season_sprints)
+get_season_standings = _threaded(pyergast.get_season_standings)
+
+
+async def gather(*aws, return_exceptions=False):
+    """
+    Awaits the given queries concurrently and returns their results in the order they were passed.
+
+    Parameters
+    ----------
+    aws: coroutine
+        Coroutines returned by the query functions of this module.
+    return_exceptions: bool
+        If True, a failing query returns its exception in place of a result instead of cancelling the others.
+
+    Returns
+    -------
+    list
+    """
+    return await asyncio.gather(*aws, return_exceptions=return_exceptions)
+
+
+def run(*aws, return_exceptions=False):
+    """
+    Synchronous entry point around `gather`, for callers that are not running an event loop.
+
+    Example
+    -------
+    >>> ds, cs = aio.run(aio.driver_standings(2021, 10), aio.constructor_standings(2021, 10))
+    """
+    return asyncio.run(gather(*aws, return_exceptions=return_exceptions))
+
+
+async def get_round(year=None, race=None, sprint=False):
+    """
+    Fetches every table needed for a Grand Prix article concurrently.
+    Tables that are not available (e.g. qualifying before 1996) are returned as None.
+
+    Parameters
+    ----------
+    year: int
+        An optional parameter that specifies the year to be queried.
+    race: int
+        An optional parameter that specifies the round of a year to be queried.
+    sprint: bool
+        Whether to also fetch the sprint result.
+
+    Returns
+    -------
+    dict
+        Keys: results, qualifying, sprint, driver_standings, constructor_standings
+
+    Example
+    -------
+    >>> tables = aio.run(aio.get_round(2021, 10, sprint=True))[0]
+    >>> tables['sprint'].head(3)
+    """
+    names = ['results', 'qualifying', 'driver_standings', 'constructor_standings']
+    queries = [get_race_result(year, race), get_qualifying_result(year, race),
+               driver_standings(year, race), constructor_standings(year, race)]
+    if sprint:
+        names.append('sprint')
+        queries.append(get_sprint_result(year, race))
+    results = await gather(*queries, return_exceptions=True)
+    tables = {'sprint': None}
+    for name, result in zip(names, results):
+        tables[name] = None if isinstance(result, Exception) else result
+    return tables
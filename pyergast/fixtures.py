@@ -0,0 +1,224 @@
+"""
+Record/replay HTTP fixtures for pyergast and the f1.py practice scraper.
+
+In `record` mode, requests go to the network as usual and every response is appended to a fixture archive. In
+`replay` mode, nothing touches the network: responses are served from the archive, optionally after an injected
+latency, so renderers can be benchmarked and regression-tested offline. A request missing from the archive raises
+`FixtureMissing`, a `requests.ConnectionError`, which callers already handle like being offline.
+
+The archive is a gzip-compressed JSON-lines file with one response per line (method, URL, status, a few headers and
+the body). Recording appends a gzip member per response, and when a URL appears twice the later entry wins.
+
+Fixtures are enabled for the whole process through the environment:
+
+- `PYERGAST_FIXTURES`: path of the archive
+- `PYERGAST_FIXTURES_MODE`: `replay` (default) or `record`
+- `PYERGAST_FIXTURES_LATENCY`: seconds added to every replayed response (default 0)
+- `PYERGAST_FIXTURES_JITTER`: up to this many extra seconds per response, fixed per URL (default 0)
+
+Example
+-------
+$ PYERGAST_FIXTURES=round.jsonl.gz PYERGAST_FIXTURES_MODE=record python3 f1.py race 2021 10
+$ PYERGAST_FIXTURES=round.jsonl.gz PYERGAST_FIXTURES_LATENCY=0.05 python3 f1.py race 2021 10
+
+or from Python:
+
+>>> from pyergast import fixtures
+>>> fixtures.use('round.jsonl.gz', latency=0.05, jitter=0.02)
+"""
+import base64
+import gzip
+import json
+import os
+import random
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Response headers worth keeping. The body is stored decoded, so transfer headers are dropped.
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control', 'Retry-After', 'Location')
+
+
+class FixtureMissing(requests.ConnectionError):
+    """
+    Raised when replaying a request that is not in the fixture archive
+    """
+
+
+def fixture_key(method, url):
+    """
+    Helper function that identifies a request by method and URL, with its query parameters sorted
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return '{} {}'.format(method.upper(), urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, query, '')))
+
+
+class FixtureArchive:
+    """
+    The responses of a fixture file, loaded in memory and keyed by `fixture_key`.
+
+    Parameters
+    ----------
+    path: str
+        Location of the gzip-compressed JSON-lines file. It does not need to exist before recording.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.entries[fixture_key(entry['method'], entry['url'])] = entry
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, method, url):
+        return self.entries.get(fixture_key(method, url))
+
+    def add(self, method, url, response):
+        """
+        Stores a response and appends it to the file
+        """
+        entry = {'method': method.upper(), 'url': url, 'status': response.status_code, 'reason': response.reason,
+                 'headers': {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers}}
+        try:
+            entry['text'] = response.content.decode('utf-8')
+        except UnicodeDecodeError:
+            entry['base64'] = base64.b64encode(response.content).decode('ascii')
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n'
+        with self._lock:
+            self.entries[fixture_key(method, url)] = entry
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with gzip.open(self.path, 'at', encoding='utf-8') as f:
+                f.write(line)
+
+
+class FixtureAdapter(BaseAdapter):
+    """
+    A `requests` transport adapter that records responses into, or replays them from, a `FixtureArchive`.
+
+    Parameters
+    ----------
+    archive: FixtureArchive or str
+        The archive, or the path of its file.
+    mode: str
+        'replay' to serve responses from the archive, 'record' to fetch them from the network and store them.
+    latency: float
+        Seconds to wait before returning each replayed response.
+    jitter: float
+        Maximum extra seconds added to `latency`. The amount is derived from `seed` and the URL, so it is the same on
+        every run.
+    seed: int
+        Seed of the jitter.
+    """
+
+    def __init__(self, archive, mode='replay', latency=0.0, jitter=0.0, seed=0):
+        super().__init__()
+        if mode not in ('replay', 'record'):
+            raise ValueError("mode must be 'replay' or 'record'")
+        self.archive = archive if isinstance(archive, FixtureArchive) else FixtureArchive(archive)
+        self.mode = mode
+        self.latency = latency
+        self.jitter = jitter
+        self.seed = seed
+        self.network = HTTPAdapter() if mode == 'record' else None
+
+    def delay(self, key):
+        if not self.jitter:
+            return self.latency
+        return self.latency + random.Random('{}|{}'.format(self.seed, key)).uniform(0, self.jitter)
+
+    def send(self, request, **kwargs):
+        if self.mode == 'record':
+            response = self.network.send(request, **kwargs)
+            self.archive.add(request.method, request.url, response)
+            return response
+
+        entry = self.archive.get(request.method, request.url)
+        if entry is None:
+            raise FixtureMissing('No fixture for {} {} in {}'.format(request.method, request.url, self.archive.path),
+                                 request=request)
+        delay = self.delay(fixture_key(request.method, request.url))
+        if delay > 0:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = entry.get('reason')
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry['text'].encode('utf-8') if 'text' in entry else base64.b64decode(entry['base64'])
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        if self.network is not None:
+            self.network.close()
+
+
+def mount(session):
+    """
+    Routes a `requests.Session` through the active fixtures, if any. Returns the session.
+    """
+    if active is not None:
+        session.mount('http://', active)
+        session.mount('https://', active)
+    return session
+
+
+def use(path, mode='replay', latency=0.0, jitter=0.0, seed=0):
+    """
+    Enables fixtures for the rest of the process. The pyergast client is rebuilt without its on-disk response cache,
+    so that every request reaches the archive (and replayed latency applies to every request).
+
+    Parameters
+    ----------
+    path: str
+        Location of the archive.
+    mode: str
+        'replay' or 'record'.
+    latency: float
+        Seconds added to every replayed response.
+    jitter: float
+        Maximum extra seconds per replayed response, fixed per URL.
+    seed: int
+        Seed of the jitter.
+
+    Returns
+    -------
+    FixtureAdapter
+    """
+    global active
+    import pyergast
+    active = FixtureAdapter(path, mode=mode, latency=latency, jitter=jitter, seed=seed)
+    pyergast.configure(cache=False)
+    return active
+
+
+def from_environment():
+    """
+    Helper function that builds the adapter described by the `PYERGAST_FIXTURES*` environment variables, or None
+    """
+    path = os.environ.get('PYERGAST_FIXTURES')
+    if not path:
+        return None
+    return FixtureAdapter(path, mode=os.environ.get('PYERGAST_FIXTURES_MODE', 'replay'),
+                          latency=float(os.environ.get('PYERGAST_FIXTURES_LATENCY', 0)),
+                          jitter=float(os.environ.get('PYERGAST_FIXTURES_JITTER', 0)))
+
+
+# The adapter every session in this process mounts, or None when fixtures are not in use
+active = from_environment()
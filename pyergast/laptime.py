@@ -0,0 +1,161 @@
+"""
+Vectorized lap time arithmetic.
+
+Lap times and gaps arrive as strings such as '1:09.890', '59.123', '1:32:10.123' or '+0.087s'. The functions here
+convert whole Series of them to integer milliseconds in a single pass and format them back, so tables can be
+sorted, compared and offset as integers instead of as strings.
+
+Example
+-------
+>>> from pyergast import laptime
+>>> fastest = laptime.to_millis(quali['Q1']).min()
+>>> laptime.format_millis(laptime.percent_of(fastest, 107))
+'1:36.300'
+"""
+from pyergast import LazyModule
+
+np = LazyModule('numpy')
+pd = LazyModule('pandas')
+
+TIME_PATTERN = r'^(?:(?:(?P<hours>\d+):)?(?P<minutes>\d+):)?(?P<seconds>\d+(?:\.\d+)?)$'
+GAP_PATTERN = r'^\+?\s*(?:(?:(?P<hours>\d+):)?(?P<minutes>\d+):)?(?P<seconds>\d+(?:\.\d+)?)\s*(?:s|sec)?$'
+
+
+def as_series(values):
+    if isinstance(values, pd.Series):
+        return values
+    return pd.Series(values if np.ndim(values) else [values], dtype=object)
+
+
+def unwrap(result, values):
+    return result if np.ndim(values) else result.iloc[0]
+
+
+def parse(values, pattern):
+    parts = as_series(values).astype('string').str.strip().str.extract(pattern)
+    hours = parts['hours'].astype(float).fillna(0).to_numpy()
+    minutes = parts['minutes'].astype(float).fillna(0).to_numpy()
+    seconds = parts['seconds'].astype(float).to_numpy()
+    millis = np.round(((hours * 60 + minutes) * 60 + seconds) * 1000)
+    result = pd.Series(millis, index=parts.index).astype('Int64')
+    return unwrap(result, values)
+
+
+def to_millis(times):
+    """
+    Converts lap or race times to milliseconds.
+
+    Parameters
+    ----------
+    times: Series, list or str
+        Times formatted as 'h:mm:ss.sss', 'm:ss.sss' or 'ss.sss'. Missing or malformed entries (including gaps such
+        as '+0.087s') become <NA>.
+
+    Returns
+    -------
+    Series of Int64 (or a single value when given a single time)
+    """
+    return parse(times, TIME_PATTERN)
+
+
+def gap_to_millis(gaps):
+    """
+    Converts gaps to the leader to milliseconds.
+
+    Parameters
+    ----------
+    gaps: Series, list or str
+        Gaps formatted as '+0.087s', '+0.087', '0.087s' or '+1:02.345'. Lapped gaps such as '+1 Lap' become <NA>.
+
+    Returns
+    -------
+    Series of Int64 (or a single value when given a single gap)
+    """
+    return parse(gaps, GAP_PATTERN)
+
+
+def is_gap(values):
+    """
+    Tells which entries are gaps to the leader rather than absolute times.
+
+    Parameters
+    ----------
+    values: Series or list
+        Time or gap strings.
+
+    Returns
+    -------
+    Series of bool
+    """
+    text = as_series(values).astype('string').str.strip()
+    return (text.str.startswith('+') | (text.str.endswith('s') & ~text.str.contains(':', regex=False))).fillna(False)
+
+
+def to_absolute(base, gaps):
+    """
+    Adds gaps to the leader's time, e.g. '1:09.890' and '+0.087s' give 69977 milliseconds.
+
+    Parameters
+    ----------
+    base: int or str
+        The leader's time, in milliseconds or as a time string.
+    gaps: Series, list or str
+        Gaps accepted by `gap_to_millis`.
+
+    Returns
+    -------
+    Series of Int64 (or a single value when given a single gap)
+    """
+    if isinstance(base, str):
+        base = to_millis(base)
+    return gap_to_millis(gaps) + base
+
+
+def percent_of(millis, percent):
+    """
+    Scales times by a percentage and rounds to the millisecond, e.g. the 107% qualifying cutoff.
+
+    Parameters
+    ----------
+    millis: Series or int
+        Times in milliseconds.
+    percent: float
+        The percentage to scale by.
+
+    Returns
+    -------
+    Series of Int64 (or a single value when given a single time)
+    """
+    if np.ndim(millis) == 0 and pd.isna(millis):
+        return pd.NA
+    result = (as_series(millis).astype('Float64') * percent / 100).round().astype('Int64')
+    return unwrap(result, millis)
+
+
+def format_millis(millis, sign=False):
+    """
+    Formats milliseconds as 'h:mm:ss.sss', 'm:ss.sss' or, below one minute, 'ss.sss'.
+
+    Parameters
+    ----------
+    millis: Series or int
+        Times in milliseconds. Missing entries stay <NA>.
+    sign: bool
+        Whether to prefix a '+', as for gaps to the leader.
+
+    Returns
+    -------
+    Series of str (or a single value when given a single time)
+    """
+    values = as_series(millis).astype('Int64')
+    hours = (values // 3600000).astype('string')
+    minutes = (values // 60000 % 60).astype('string')
+    seconds = (values // 1000 % 60).astype('string')
+    fraction = '.' + (values % 1000).astype('string').str.zfill(3)
+
+    result = seconds + fraction
+    result = result.mask(values >= 60000, minutes + ':' + seconds.str.zfill(2) + fraction)
+    result = result.mask(values >= 3600000, hours + ':' + minutes.str.zfill(2) + ':' + seconds.str.zfill(2) + fraction)
+    if sign:
+        result = '+' + result
+    return unwrap(result, millis)
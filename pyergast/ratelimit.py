@@ -0,0 +1,188 @@
+"""
+Per-host token-bucket rate limiting for HTTP requests.
+
+Each host gets a bucket that refills at `rate` tokens per second up to `burst` tokens, and every request takes one
+token, waiting for it if the bucket is empty. A burst of concurrent requests therefore goes out immediately while the
+sustained request rate to a host stays bounded. When a host answers 429 or 503 with a `Retry-After` header, its
+bucket is paused for that long and the request is retried.
+
+Example
+-------
+>>> from pyergast.ratelimit import limiter
+>>> limiter.configure('www.formula1.com', rate=0.5, burst=3)
+>>> response = limiter.get('https://www.formula1.com/en/results/2024/races/1229/bahrain/practice/1', timeout=15)
+"""
+import email.utils
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Parameters
+    ----------
+    rate: float
+        Tokens added per second, i.e. the sustained number of requests per second.
+    burst: int
+        Capacity of the bucket, i.e. how many requests may go out back to back.
+    """
+
+    def __init__(self, rate, burst):
+        if rate <= 0 or burst < 1:
+            raise ValueError('rate must be positive and burst at least 1')
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        # Takes a token if one is available, otherwise returns how long to wait for the next one
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """
+        Blocks until a token is available and takes it. Returns the number of seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            delay = self._reserve()
+            if not delay:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds):
+        """
+        Holds back every request for `seconds`, e.g. as instructed by a `Retry-After` header. Afterwards a single
+        request may go out immediately and the rest resume at the sustained rate rather than as a burst.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 1.0
+            self._updated = self._paused_until
+
+
+def retry_after(response, default=None):
+    """
+    Returns the delay in seconds requested by a response's `Retry-After` header (delta-seconds or HTTP date),
+    or `default` if there is none or it cannot be parsed
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return default
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(0.0, when.timestamp() - time.time())
+
+
+class HostRateLimiter:
+    """
+    Keeps one `TokenBucket` per host and sends requests through them.
+
+    Parameters
+    ----------
+    rate: float
+        Default sustained requests per second for hosts without their own settings.
+    burst: int
+        Default burst size for hosts without their own settings.
+    retries: int
+        How many times a request answered with 429 or 503 is retried after waiting.
+    max_retry_after: float
+        Upper bound in seconds on a single `Retry-After` wait. A server asking for longer fails the request instead.
+    """
+
+    def __init__(self, rate=1.0, burst=3, retries=2, max_retry_after=60):
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.max_retry_after = max_retry_after
+        self._settings = {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host, rate=None, burst=None):
+        """
+        Sets the rate and burst of one host. The host's bucket is only rebuilt if the settings actually change, so
+        calling this before every batch of requests is cheap.
+        """
+        host = host.lower()
+        settings = (rate or self.rate, burst or self.burst)
+        with self._lock:
+            if self._settings.get(host) != settings:
+                self._settings[host] = settings
+                self._buckets.pop(host, None)
+
+    def bucket(self, url):
+        """
+        Returns the bucket of the host of `url`, creating it on first use
+        """
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._buckets:
+                rate, burst = self._settings.get(host, (self.rate, self.burst))
+                self._buckets[host] = TokenBucket(rate, burst)
+            return self._buckets[host]
+
+    def request(self, method, url, session=requests, **kwargs):
+        """
+        Sends a request once the host's bucket allows it. Responses with status 429 or 503 pause the host for their
+        `Retry-After` delay (or one token interval without the header) and are retried up to `retries` times.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method, e.g. 'GET'
+        url: str
+            The URL to request
+        session: requests.Session
+            Session used to send the request, defaults to the `requests` module itself
+        kwargs:
+            Passed on to `session.request`
+
+        Returns
+        -------
+        requests.Response
+            The last response received
+        """
+        bucket = self.bucket(url)
+        for attempt in range(self.retries + 1):
+            bucket.acquire()
+            response = session.request(method, url, **kwargs)
+            if response.status_code not in (429, 503) or attempt == self.retries:
+                return response
+            delay = retry_after(response, default=1 / bucket.rate)
+            if delay > self.max_retry_after:
+                return response
+            bucket.pause(delay)
+        return response
+
+    def get(self, url, session=requests, **kwargs):
+        """
+        Shortcut for `request('GET', url, ...)`
+        """
+        return self.request('GET', url, session=session, **kwargs)
+
+
+# Shared by everything in the process, so separate callers scraping the same host draw from the same budget
+limiter = HostRateLimiter()
@@ -0,0 +1,130 @@
+"""
+Pandas-free variants of the most common pyergast queries.
+
+Each function returns a list of plain dicts with the same keys as the columns of its DataFrame counterpart in
+`pyergast` (see the `*_COLUMNS` specs), built without importing pandas. Scripts and CLI paths that only need a
+handful of values therefore skip the pandas import entirely, while still sharing the pooled client and the on-disk
+response cache of `pyergast`.
+
+Example
+-------
+>>> from pyergast import records
+>>> [row['driver'] for row in records.qualifying_results(2021, 10)][:3]
+['Lewis Hamilton', 'Max Verstappen', 'Valtteri Bottas']
+"""
+import pyergast
+
+
+def field(record, source):
+    """
+    Helper function that reads a dotted `source` such as `Driver.driverId` or `Constructors.0.name` from an API
+    record, returning None if any part of it is missing
+    """
+    value = record
+    for part in source.split('.'):
+        if isinstance(value, list):
+            value = value[int(part)] if part.isdigit() and int(part) < len(value) else None
+        elif isinstance(value, dict):
+            value = value.get(part)
+        else:
+            return None
+    return value
+
+
+def flatten(record, spec):
+    """
+    Builds one output row from an API record following a column spec of `pyergast`, e.g. `RESULT_COLUMNS`.
+    A tuple source joins several fields with spaces and a dict source builds a nested dict, as in `pyergast.normalize`.
+    Missing fields come out as None.
+
+    Parameters
+    ----------
+    record: dict
+        A record as returned by the API
+    spec: dict
+        Output key mapped to its source
+
+    Returns
+    -------
+    dict
+
+    Example
+    -------
+    >>> records.flatten({'Driver': {'givenName': 'Fernando', 'familyName': 'Alonso'}},
+    ...                 {'driver': ('Driver.givenName', 'Driver.familyName')})
+    {'driver': 'Fernando Alonso'}
+    """
+    row = {}
+    for name, source in spec.items():
+        if isinstance(source, tuple):
+            parts = [field(record, part) for part in source]
+            row[name] = None if None in parts else ' '.join(parts)
+        elif isinstance(source, dict):
+            nested = {key: field(record, part) for key, part in source.items()}
+            row[name] = nested if any(value is not None for value in nested.values()) else None
+        else:
+            row[name] = field(record, source)
+    return row
+
+
+def race_table(path, results_key, spec):
+    """
+    Helper function that returns the flattened `results_key` rows of every race of a RaceTable query
+    """
+    races = pyergast.get_table('http://api.jolpi.ca/ergast/f1/{}.json'.format(path), 'RaceTable', 'Races')
+    return [flatten(row, spec) for race in races for row in race[results_key]]
+
+
+def standings_table(path, key, spec):
+    """
+    Helper function that returns the flattened rows of the first standings list of a StandingsTable query
+    """
+    lists = pyergast.get_table('http://api.jolpi.ca/ergast/f1/{}.json'.format(path), 'StandingsTable', 'StandingsLists')
+    return [flatten(row, spec) for row in lists[0][key]] if lists else []
+
+
+def round_path(year, race, endpoint):
+    if year and race:
+        return '{}/{}/{}'.format(year, race, endpoint)
+    return 'current/last/{}'.format(endpoint)
+
+
+def race_results(year=None, race=None):
+    """
+    Race results as a list of dicts, see `pyergast.get_race_result`. Defaults to the most recent race.
+    Unlike `get_race_result`, null grid positions are not filled from qualifying.
+    """
+    return race_table(round_path(year, race, 'results'), 'Results', pyergast.RESULT_COLUMNS)
+
+
+def sprint_results(year=None, race=None):
+    """
+    Sprint results as a list of dicts, see `pyergast.get_sprint_result`. Defaults to the most recent race.
+    """
+    return race_table(round_path(year, race, 'sprint'), 'SprintResults', pyergast.RESULT_COLUMNS)
+
+
+def qualifying_results(year=None, race=None):
+    """
+    Qualifying results as a list of dicts, see `pyergast.get_qualifying_result`. Defaults to the most recent race.
+    Sessions that did not exist in a qualifying format (Q2, Q3) are None.
+    """
+    if year and race:
+        assert year >= 1996, 'Qualifying data only available starting from 1996'
+    return race_table(round_path(year, race, 'qualifying'), 'QualifyingResults', pyergast.QUALIFYING_COLUMNS)
+
+
+def driver_standings(year=None, race=None):
+    """
+    Driver standings as a list of dicts, see `pyergast.driver_standings`. Defaults to the latest standings.
+    """
+    path = round_path(year, race, 'driverStandings') if race else '{}/driverStandings'.format(year or 'current')
+    return standings_table(path, 'DriverStandings', pyergast.DRIVER_STANDINGS_COLUMNS)
+
+
+def constructor_standings(year=None, race=None):
+    """
+    Constructor standings as a list of dicts, see `pyergast.constructor_standings`. Defaults to the latest standings.
+    """
+    path = round_path(year, race, 'constructorStandings') if race else '{}/constructorStandings'.format(year or 'current')
+    return standings_table(path, 'ConstructorStandings', pyergast.CONSTRUCTOR_STANDINGS_COLUMNS)
@@ -0,0 +1,300 @@
+"""
+Retries, backoff and circuit breaking for requests to the API.
+
+A request that fails with a connection error, a timeout, or a 429/5xx status is retried after a jittered exponential
+backoff: a random delay between 0 and `backoff * 2 ** attempt` seconds, capped at `max_backoff` ("full jitter", so
+that concurrent workers that failed together do not retry together). When the response carries a `Retry-After`
+header with a positive delay, that delay is used instead, and it holds back every other request to the same host as
+well.
+
+Each host also has a circuit breaker. After `threshold` consecutive failed attempts (connection errors, timeouts and
+5xx, but not rate limiting, nor errors that say nothing about the host such as an invalid URL) it opens, and requests
+to the host fail immediately with `CircuitOpen` for `cooldown` seconds. The next request is then let through as a
+trial: success closes the breaker, failure opens it again.
+
+Responses that are still unsuccessful after the retries are turned into typed exceptions by `raise_for_status`.
+They all derive from `ErgastError`, itself a `requests.RequestException`, so existing handlers keep working.
+
+Example
+-------
+>>> import pyergast
+>>> from pyergast.retry import RetryPolicy
+>>> pyergast.configure(retry=RetryPolicy(retries=6, backoff=1.0, threshold=10))
+>>> try:
+...     pyergast.get_race_result(2021, 10)
+... except pyergast.RateLimited as e:
+...     print('try again in', e.retry_after)
+"""
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from pyergast.fixtures import FixtureMissing
+from pyergast.ratelimit import retry_after
+
+
+class ErgastError(requests.RequestException):
+    """
+    Base class of the errors raised when the API cannot answer a query
+    """
+
+
+class HTTPStatusError(ErgastError, requests.HTTPError):
+    """
+    The API answered with an unsuccessful status code. `status_code` and `response` hold the details.
+    """
+
+    def __init__(self, response, message=None):
+        self.status_code = response.status_code
+        reason = ' {}'.format(response.reason) if response.reason else ''
+        super().__init__(message or 'HTTP {}{} for {}'.format(response.status_code, reason, response.url),
+                         response=response)
+
+
+class ClientError(HTTPStatusError):
+    """
+    The API rejected the query (4xx), e.g. a season or round that does not exist. Retrying will not help.
+    """
+
+
+class RateLimited(HTTPStatusError):
+    """
+    The API kept answering 429 Too Many Requests. `retry_after` is the delay it asked for in seconds, or None.
+    """
+
+    def __init__(self, response, message=None):
+        self.retry_after = retry_after(response)
+        super().__init__(response, message)
+
+
+class ServerError(HTTPStatusError):
+    """
+    The API kept failing with a 5xx status
+    """
+
+
+class CircuitOpen(ErgastError):
+    """
+    Requests to `host` are suspended after repeated failures. `retry_in` is the number of seconds left before a
+    trial request is allowed.
+    """
+
+    def __init__(self, host, retry_in):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__('Requests to {} are suspended for {:.1f}s after repeated failures'.format(host, retry_in))
+
+
+def raise_for_status(response):
+    """
+    Returns `response` if its status is 200, otherwise raises the matching `HTTPStatusError` subclass
+    """
+    status = response.status_code
+    if status == 200:
+        return response
+    if status == 429:
+        raise RateLimited(response)
+    if status >= 500:
+        raise ServerError(response)
+    if 400 <= status < 500:
+        raise ClientError(response, 'HTTP {} for {}. Check your inputs.'.format(status, response.url))
+    raise HTTPStatusError(response)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker of one host.
+
+    Parameters
+    ----------
+    host: str
+        The host, used in error messages.
+    threshold: int
+        Consecutive failed attempts after which the breaker opens.
+    cooldown: float
+        Seconds the breaker stays open before a trial request is let through.
+    """
+
+    def __init__(self, host, threshold=5, cooldown=30.0):
+        self.host = host
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+        self._hold_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if self._trial or time.monotonic() < self._opened_at + self.cooldown:
+                return 'open'
+            return 'half-open'
+
+    def before(self):
+        """
+        Called before each attempt. Raises `CircuitOpen` if the host is suspended, otherwise returns how many seconds
+        to wait first because of a `Retry-After` hold (usually 0).
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._opened_at is not None:
+                remaining = self._opened_at + self.cooldown - now
+                if remaining > 0 or self._trial:
+                    raise CircuitOpen(self.host, max(0.0, remaining))
+                # Half-open: this attempt is the trial, everyone else keeps failing fast until it completes
+                self._trial = True
+            return max(0.0, self._hold_until - now)
+
+    def success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+                self._trial = False
+
+    def release(self):
+        """
+        Called when an attempt ended with an error that says nothing about the host. Nothing is counted, but if the
+        attempt was the half-open trial, the next request becomes the trial instead.
+        """
+        with self._lock:
+            self._trial = False
+
+    def hold(self, seconds):
+        """
+        Holds back every request to the host for `seconds`, as asked by a `Retry-After` header
+        """
+        with self._lock:
+            self._hold_until = max(self._hold_until, time.monotonic() + seconds)
+
+
+class RetryPolicy:
+    """
+    Retries failed requests with jittered exponential backoff and keeps a `CircuitBreaker` per host.
+
+    Parameters
+    ----------
+    retries: int
+        Retries after the first attempt.
+    backoff: float
+        Base of the backoff in seconds: retry n waits a random delay of up to `backoff * 2 ** n`.
+    max_backoff: float
+        Cap of a single backoff delay.
+    max_retry_after: float
+        Longest `Retry-After` delay that is waited for. Asked for more, the request fails with the response instead.
+    statuses: tuple
+        Status codes that are retried.
+    threshold: int
+        Consecutive failed attempts to a host that open its circuit breaker.
+    cooldown: float
+        Seconds a host's circuit breaker stays open.
+    seed: int
+        Seed of the jitter, for reproducible delays. None seeds from the system.
+    """
+
+    def __init__(self, retries=4, backoff=0.5, max_backoff=30.0, max_retry_after=120.0,
+                 statuses=(429, 500, 502, 503, 504), threshold=5, cooldown=30.0, seed=None):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = statuses
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._random = random.Random(seed)
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, url):
+        """
+        Returns the circuit breaker of the host of `url`, creating it on first use
+        """
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(host, self.threshold, self.cooldown)
+            return self._breakers[host]
+
+    def delay(self, attempt):
+        """
+        Returns the backoff in seconds before retry number `attempt` (0 for the first retry)
+        """
+        with self._lock:
+            return self._random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def request(self, url, send):
+        """
+        Performs a request through `send` until it succeeds or the retries run out.
+
+        Parameters
+        ----------
+        url: str
+            The URL requested, which selects the circuit breaker
+        send: callable
+            Called without arguments for every attempt, returns a `requests.Response`
+
+        Returns
+        -------
+        requests.Response
+            The first response with a status that is not retried, or the last one received
+
+        Raises
+        ------
+        CircuitOpen
+            If the host's circuit breaker is open
+        requests.ConnectionError, requests.Timeout
+            The error of the last attempt, if none of them got a response
+        """
+        breaker = self.breaker(url)
+        for attempt in range(self.retries + 1):
+            wait = breaker.before()
+            if wait:
+                time.sleep(wait)
+            try:
+                response = send()
+            except FixtureMissing:
+                # Replaying fixtures: the response will not show up on a second try, and the host is not to blame
+                breaker.release()
+                raise
+            except (requests.ConnectionError, requests.Timeout):
+                breaker.failure()
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.delay(attempt))
+                continue
+            except Exception:
+                # Not a sign of an unhealthy host (e.g. an invalid URL or bad arguments), so it is not counted
+                breaker.release()
+                raise
+
+            if response.status_code not in self.statuses:
+                breaker.success()
+                return response
+            # Rate limiting means the host is up, so only real failures count towards the breaker
+            if response.status_code != 429:
+                breaker.failure()
+            if attempt == self.retries:
+                return response
+            delay = retry_after(response)
+            if delay is None or delay <= 0:
+                # Without a usable Retry-After (missing, 0 or a date in the past), back off as usual
+                time.sleep(self.delay(attempt))
+            elif delay <= self.max_retry_after:
+                # Waited for in `breaker.before()`, along with every other request to the host
+                breaker.hold(delay)
+            else:
+                return response
+        return response
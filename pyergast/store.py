@@ -0,0 +1,604 @@
+"""
+Local columnar store of the F1 history served by the API, for offline and analytical queries.
+
+`Store.sync` mirrors schedules, race, qualifying and sprint results and round-by-round driver and constructor
+standings into Parquet files partitioned by table and season (`<root>/<table>/season=<year>/part-0.parquet`). The rows
+are the DataFrames returned by the matching pyergast query functions, plus their round. The first sync of a season
+goes through the season-wide endpoints; after that only rounds that are not stored yet are fetched, and finished
+seasons are never fetched again. Progress is kept in `<root>/manifest.json`.
+
+The query functions of pyergast take `source='local'` to answer from the store instead of the API. The season, round,
+driver or constructor asked for is pushed down to the Parquet reader, which only opens the matching season
+partitions and skips row groups whose statistics rule them out.
+
+`Store.sql` (or `pyergast.sql`) runs SQL over the whole history. The partitions are copied into a SQLite database
+next to them (`<root>/history.sqlite`), one table per store table with a season column and indexes on season and
+round, driver and constructor, so that aggregations over decades are a single indexed query. The copy is refreshed
+before each query from the partitions that changed since, which after a sync is only the seasons it wrote.
+
+The store needs pyarrow (`pip install pyarrow`), which the rest of pyergast does not depend on. It is kept in
+`$PYERGAST_STORE_DIR`, or `~/.local/share/pyergast/store` by default.
+
+Example
+-------
+>>> import pyergast
+>>> from pyergast import store
+>>> store.local.sync(range(2000, 2026))
+>>> pyergast.query_driver('raikkonen', source='local')
+>>> pyergast.get_race_result(2021, 10, source='local')
+>>> pyergast.sql('SELECT constructor, COUNT(*) AS podiums FROM results WHERE season >= 2000 AND position <= 3 '
+...              'GROUP BY constructorID ORDER BY podiums DESC')
+"""
+import datetime
+import glob
+import inspect
+import json
+import os
+import sqlite3
+import threading
+
+import pyergast
+
+TABLES = ('schedule', 'results', 'qualifying', 'sprint', 'driver_standings', 'constructor_standings')
+
+# Where each table comes from: the season-wide query function and its keyword arguments, the per-round query function
+# (None to always use the season-wide one) and the first season with data
+SOURCES = {
+    'results': ('get_season_results', {}, 'get_race_result', 1950),
+    'qualifying': ('get_season_qualifying', {}, 'get_qualifying_result', 1996),
+    'sprint': ('get_season_sprints', {}, None, 2021),
+    'driver_standings': ('get_season_standings', {}, 'driver_standings', 1950),
+    'constructor_standings': ('get_season_standings', {'constructors': True}, 'constructor_standings', 1958),
+}
+
+# Columns stored as integers. Everything else is stored as strings, like the API returns it.
+INT_COLUMNS = ('season', 'round')
+
+# Columns declared NUMERIC in the SQL tables, so that SQLite stores '3' as 3 and '0.5' as 0.5 and they compare and
+# add up as numbers
+NUMERIC_COLUMNS = tuple(name for name, dtype in pyergast.TYPED_COLUMNS.items()
+                        if dtype.startswith(('Int', 'float')) and name not in INT_COLUMNS)
+
+# Indexes created on every SQL table that has their columns
+SQL_INDEXES = {
+    'round': ('season', 'round'),
+    'driver': ('driverID', 'season', 'round'),
+    'constructor': ('constructorID', 'season', 'round'),
+}
+
+
+class NotSynced(LookupError):
+    """
+    Raised when a local query asks for a season or round that has not been synced into the store
+    """
+
+
+def arrow():
+    """
+    Helper function that imports pyarrow, which only the store needs
+    """
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError('pyergast.store needs pyarrow: pip install pyarrow') from e
+    return pyarrow, pyarrow.parquet, pyarrow.dataset
+
+
+def is_missing(value):
+    return value is None or value != value
+
+
+def encode(frame):
+    """
+    Helper function that converts a DataFrame to an Arrow table: season and round as integers, dict and list values
+    (e.g. `Time`) as JSON and every other value as a string. Returns the table and the names of the JSON columns.
+    """
+    pa = arrow()[0]
+    columns, json_columns = {}, []
+    for name in frame.columns:
+        if name in INT_COLUMNS:
+            columns[name] = pa.array(frame[name].astype('int64'), type=pa.int16())
+            continue
+        values = frame[name].tolist()
+        if any(isinstance(value, (dict, list)) for value in values):
+            json_columns.append(name)
+            values = [json.dumps(value) if isinstance(value, (dict, list)) else None for value in values]
+        else:
+            values = [None if is_missing(value) else str(value) for value in values]
+        columns[name] = pa.array(values, type=pa.string())
+    return pa.table(columns), json_columns
+
+
+def decode(table, json_columns=()):
+    """
+    Helper function that converts an Arrow table written by `encode` back to a DataFrame shaped like the API's:
+    strings with NaN for missing values, JSON columns as dicts, season first
+    """
+    frame = table.to_pandas()
+    for name in frame.columns:
+        if name in INT_COLUMNS:
+            frame[name] = frame[name].astype(int)
+            continue
+        column = frame[name].astype(object)
+        if name in json_columns:
+            column = column.map(json.loads, na_action='ignore')
+        frame[name] = column.where(column.notna(), float('nan'))
+    if 'season' in frame.columns:
+        frame = frame[['season'] + [name for name in frame.columns if name != 'season']]
+    return frame
+
+
+def quote(name):
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def sql_type(name):
+    if name in INT_COLUMNS:
+        return 'INTEGER'
+    return 'NUMERIC' if name in NUMERIC_COLUMNS else 'TEXT'
+
+
+def api_value(value):
+    """
+    Helper function that turns a value read from SQLite back into the API's string form, NaN if missing
+    """
+    if is_missing(value):
+        return float('nan')
+    return value if isinstance(value, str) else str(value)
+
+
+def with_round(frame, race):
+    frame = frame.copy()
+    frame.insert(0, 'round', race)
+    return frame
+
+
+class Store:
+    """
+    A local mirror of the API in Parquet files.
+
+    Parameters
+    ----------
+    path: str
+        Root directory of the store. Defaults to `$PYERGAST_STORE_DIR`, or `~/.local/share/pyergast/store`.
+    """
+
+    def __init__(self, path=None):
+        if path is None:
+            path = os.environ.get('PYERGAST_STORE_DIR') or os.path.join(os.path.expanduser('~'), '.local', 'share',
+                                                                        'pyergast', 'store')
+        self.path = path
+        self._manifest = None
+        self._schemas = {}
+        self._lock = threading.Lock()
+        self._db = None
+        self._db_lock = threading.Lock()
+
+    @property
+    def manifest(self):
+        """
+        The sync state: for each season the rounds stored and whether the season is complete, and the JSON columns
+        of each table
+        """
+        if self._manifest is None:
+            path = os.path.join(self.path, 'manifest.json')
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as f:
+                    self._manifest = json.load(f)
+            else:
+                self._manifest = {'seasons': {}, 'json_columns': {}}
+        return self._manifest
+
+    def save_manifest(self):
+        os.makedirs(self.path, exist_ok=True)
+        path = os.path.join(self.path, 'manifest.json')
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(path + '.tmp', path)
+
+    def partition(self, table, year):
+        return os.path.join(self.path, table, 'season={}'.format(year), 'part-0.parquet')
+
+    def write(self, table, year, frame, replace=False):
+        """
+        Stores the rows of one season of a table. Rows already stored for the same rounds are replaced, other rounds
+        are kept unless `replace` is True.
+        """
+        pa, pq, _ = arrow()
+        path = self.partition(table, year)
+        frame = frame.drop(columns=['season'], errors='ignore')
+        if not replace and os.path.exists(path):
+            existing = decode(pq.read_table(path), self.manifest['json_columns'].get(table, ()))
+            existing = existing[~existing['round'].isin(frame['round'])]
+            frame = pyergast.pd.concat([existing, frame], ignore_index=True)
+
+        arrow_table, json_columns = encode(frame)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pq.write_table(arrow_table, path + '.tmp')
+        os.replace(path + '.tmp', path)
+        known = self.manifest['json_columns'].setdefault(table, [])
+        known.extend(name for name in json_columns if name not in known)
+
+    def read(self, table, filters=None, columns=None):
+        """
+        Reads the rows of a table that match `filters`.
+
+        Parameters
+        ----------
+        table: str
+            One of `TABLES`
+        filters: dict
+            Column name mapped to a value or a list of values. A season filter selects the partitions to open, the
+            other filters are evaluated by the Parquet reader.
+        columns: list
+            Columns to read, all of them by default.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        pa, pq, ds = arrow()
+        filters = dict(filters or {})
+        seasons = filters.pop('season', None)
+        if seasons is None:
+            files = sorted(glob.glob(os.path.join(self.path, table, 'season=*', 'part-0.parquet')))
+        else:
+            seasons = seasons if isinstance(seasons, (list, tuple, set, range)) else [seasons]
+            files = [self.partition(table, year) for year in sorted(seasons)]
+            files = [path for path in files if os.path.exists(path)]
+        if not files:
+            return pyergast.pd.DataFrame(columns=columns or [])
+
+        # Partitions written at different times may not have the same columns (e.g. schedules)
+        schema = pa.unify_schemas([self.schema(path) for path in files] + [pa.schema([('season', pa.int16())])])
+        dataset = ds.dataset(files, schema=schema, format='parquet', partition_base_dir=os.path.join(self.path, table),
+                             partitioning=ds.partitioning(pa.schema([('season', pa.int16())]), flavor='hive'))
+        expression = None
+        for name, value in filters.items():
+            if isinstance(value, (list, tuple, set, range)):
+                condition = ds.field(name).isin(list(value))
+            else:
+                condition = ds.field(name) == value
+            expression = condition if expression is None else expression & condition
+        result = dataset.to_table(filter=expression, columns=columns)
+        frame = decode(result, self.manifest['json_columns'].get(table, ()))
+        if 'round' in frame.columns:
+            frame = frame.sort_values(['season', 'round'] if 'season' in frame.columns else ['round'], kind='stable')
+        return frame.reset_index(drop=True)
+
+    def schema(self, path):
+        """
+        Returns the Arrow schema of a partition file, read once per version of the file
+        """
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._schemas.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = self._schemas[path] = (mtime, arrow()[1].read_schema(path))
+        return cached[1]
+
+    def rounds(self, year):
+        """
+        Returns the rounds of a season stored so far, raising `NotSynced` if the season has not been synced
+        """
+        state = self.manifest['seasons'].get(str(year))
+        if not state or not state['rounds']:
+            raise NotSynced('Season {} is not in the local store at {}, sync it first'.format(year, self.path))
+        return state['rounds']
+
+    def latest_season(self):
+        seasons = [int(year) for year, state in self.manifest['seasons'].items() if state['rounds']]
+        if not seasons:
+            raise NotSynced('The local store at {} is empty, sync it first'.format(self.path))
+        return max(seasons)
+
+    def sync(self, seasons=None, tables=TABLES, progress=None):
+        """
+        Brings the store up to date with the API.
+
+        Parameters
+        ----------
+        seasons: iterable
+            Seasons to sync, 1950 to the current one by default.
+        tables: iterable
+            Tables to sync, from `TABLES`.
+        progress: callable
+            Called as `progress(year, rows)` after each season that got new rows, `rows` being the number of rows
+            written per table.
+
+        Returns
+        -------
+        dict
+            Rows written per season and table
+        """
+        today = datetime.date.today()
+        seasons = seasons or range(1950, today.year + 1)
+        summary = {}
+        with self._lock:
+            for year in seasons:
+                written = self.sync_season(year, [table for table in TABLES if table in tables], today)
+                if written:
+                    summary[year] = written
+                    if progress is not None:
+                        progress(year, written)
+        return summary
+
+    def sync_season(self, year, tables, today):
+        """
+        Fetches the rounds of one season that are not stored yet, and every round for tables not synced before, then
+        writes them and updates the manifest. Nothing is written unless every table was fetched, so an interrupted
+        sync simply resumes.
+        """
+        state = self.manifest['seasons'].get(str(year), {'rounds': [], 'tables': []})
+        added = [table for table in tables if table not in state['tables']]
+        if state.get('complete') and not added:
+            return {}
+        schedule = pyergast.get_schedule(year)
+        if schedule.empty:
+            return {}
+        stored = set(state['rounds'])
+        held = [int(race) for race, day in zip(schedule['round'], schedule['date']) if day <= today.isoformat()]
+        new = [race for race in held if race not in stored]
+
+        # Rounds are synced once their race results are out, and then every table gets the same rounds
+        if not new:
+            results = None
+        elif not stored:
+            results = pyergast.get_season_results(year).reset_index()
+            results = results[results['round'].isin(new)]
+        else:
+            parts = []
+            for race in new:
+                result = pyergast.get_race_result(year, race)
+                if result.empty:
+                    break
+                parts.append(with_round(result, race))
+            results = pyergast.pd.concat(parts, ignore_index=True) if parts else None
+        done = [] if results is None else sorted(set(results['round']))
+        rounds = sorted(stored | set(done))
+
+        frames = {}
+        for table in tables:
+            wanted = rounds if table in added else done
+            if table == 'schedule' or not wanted or year < SOURCES[table][3]:
+                continue
+            if table == 'results' and set(wanted) <= set(done):
+                frames[table] = results
+            else:
+                frames[table] = self.fetch(table, year, wanted, bulk=table in added or not stored)
+
+        written = {}
+        if 'schedule' in tables and (done or 'schedule' in added):
+            schedule = schedule.copy()
+            schedule['season'] = schedule['season'].astype(int)
+            schedule['round'] = schedule['round'].astype(int)
+            self.write('schedule', year, schedule, replace=True)
+            written['schedule'] = len(schedule)
+        for table, frame in frames.items():
+            self.write(table, year, frame)
+            written[table] = len(frame)
+
+        state['rounds'] = rounds
+        state['tables'] = sorted(set(state['tables']) | set(tables))
+        state['scheduled'] = len(schedule)
+        state['complete'] = year < today.year and len(rounds) >= len(schedule)
+        state['synced'] = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+        self.manifest['seasons'][str(year)] = state
+        self.save_manifest()
+        return written
+
+    @staticmethod
+    def fetch(table, year, rounds, bulk):
+        """
+        Helper that fetches the given rounds of a table, through its season-wide query if `bulk` (or if it has no
+        per-round query) and round by round otherwise
+        """
+        season_query, season_kwargs, round_query, _ = SOURCES[table]
+        if bulk or round_query is None:
+            frame = getattr(pyergast, season_query)(year, **season_kwargs).reset_index()
+            return frame[frame['round'].isin(rounds)]
+        query = getattr(pyergast, round_query)
+        return pyergast.pd.concat([with_round(query(year, race), race) for race in rounds], ignore_index=True)
+
+    def partitions(self):
+        """
+        Returns the partition files of every table as a dict of (table, season) to (path, modification time)
+        """
+        found = {}
+        for table in TABLES:
+            for path in glob.glob(os.path.join(self.path, table, 'season=*', 'part-0.parquet')):
+                year = int(os.path.basename(os.path.dirname(path)).partition('=')[2])
+                found[(table, year)] = (path, os.stat(path).st_mtime_ns)
+        return found
+
+    def database(self):
+        """
+        Returns the connection to the SQLite copy of the store, after copying the partitions that changed since the
+        last call. Must be called with `_db_lock` held.
+        """
+        if self._db is None:
+            os.makedirs(self.path, exist_ok=True)
+            self._db = sqlite3.connect(os.path.join(self.path, 'history.sqlite'), check_same_thread=False)
+            self._db.execute('CREATE TABLE IF NOT EXISTS partitions ('
+                             'name TEXT NOT NULL, season INTEGER NOT NULL, mtime INTEGER NOT NULL, '
+                             'PRIMARY KEY (name, season))')
+        conn = self._db
+        conn.execute('PRAGMA query_only = OFF')
+        copied = {(name, year): mtime for name, year, mtime in conn.execute('SELECT name, season, mtime FROM partitions')}
+        found = self.partitions()
+        changed = sorted(key for key, (_, mtime) in found.items() if copied.get(key) != mtime)
+        removed = sorted(key for key in copied if key not in found)
+        if changed or removed:
+            pq = arrow()[1]
+            with conn:
+                for table, year in removed + changed:
+                    if self.sql_columns(table):
+                        conn.execute('DELETE FROM {} WHERE season = ?'.format(quote(table)), (year,))
+                    conn.execute('DELETE FROM partitions WHERE name = ? AND season = ?', (table, year))
+                for table, year in changed:
+                    path, mtime = found[(table, year)]
+                    self.copy(table, year, pq.read_table(path))
+                    conn.execute('INSERT INTO partitions (name, season, mtime) VALUES (?, ?, ?)', (table, year, mtime))
+        # Queries cannot modify the copy
+        conn.execute('PRAGMA query_only = ON')
+        return conn
+
+    def sql_columns(self, table):
+        return [row[1] for row in self._db.execute('PRAGMA table_info({})'.format(quote(table)))]
+
+    def copy(self, table, year, arrow_table):
+        """
+        Helper that inserts the rows of one partition into the SQL table, creating the table, its new columns and its
+        indexes as needed
+        """
+        names = ['season'] + [name for name in arrow_table.column_names if name != 'season']
+        existing = self.sql_columns(table)
+        if not existing:
+            self._db.execute('CREATE TABLE {} ({})'.format(
+                quote(table), ', '.join('{} {}'.format(quote(name), sql_type(name)) for name in names)))
+        else:
+            # Partitions written at different times may not have the same columns
+            for name in names:
+                if name not in existing:
+                    self._db.execute('ALTER TABLE {} ADD COLUMN {} {}'.format(quote(table), quote(name), sql_type(name)))
+        columns = set(existing) | set(names)
+        for index, indexed in SQL_INDEXES.items():
+            if set(indexed) <= columns:
+                self._db.execute('CREATE INDEX IF NOT EXISTS {} ON {} ({})'.format(
+                    quote('{}_{}'.format(table, index)), quote(table), ', '.join(map(quote, indexed))))
+
+        values = [[year] * arrow_table.num_rows] + [arrow_table.column(name).to_pylist() for name in names[1:]]
+        self._db.executemany('INSERT INTO {} ({}) VALUES ({})'.format(
+            quote(table), ', '.join(map(quote, names)), ', '.join('?' * len(names))), zip(*values))
+
+    def sql(self, query, params=None, typed=False):
+        """
+        Runs a SQL query over the store, see `pyergast.sql`
+        """
+        with self._db_lock:
+            cursor = self.database().execute(query, params or ())
+            if cursor.description is None:
+                return pyergast.pd.DataFrame()
+            names = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+
+        pd = pyergast.pd
+        json_columns = {name for columns in self.manifest['json_columns'].values() for name in columns}
+        shaped = []
+        for name, values in zip(names, zip(*rows) if rows else [()] * len(names)):
+            if name in json_columns:
+                column = pd.Series(values, dtype=object).map(
+                    lambda value: json.loads(value) if isinstance(value, str) else float('nan'))
+            elif name in NUMERIC_COLUMNS and not typed:
+                column = pd.Series(values, dtype=object).map(api_value)
+            else:
+                column = pd.Series(values, dtype=None if values else object)
+                if column.dtype == object:
+                    column = column.where(column.notna(), float('nan'))
+            shaped.append(column)
+        frame = pd.concat(shaped, axis=1)
+        frame.columns = names
+        return pyergast.to_typed(frame) if typed else frame
+
+    # Local counterparts of the pyergast query functions, see `query`
+
+    def round_rows(self, table, year, race):
+        if year or race:
+            assert year and race, 'You must specify both a year and a race'
+            if race not in self.rounds(year):
+                raise NotSynced('Round {} of {} is not in the local store at {}'.format(race, year, self.path))
+        else:
+            # Like the API's current/last: the latest round stored
+            year = self.latest_season()
+            race = max(self.rounds(year))
+        return self.read(table, {'season': year, 'round': race}).drop(columns=['season', 'round'])
+
+    def season_rows(self, table, year):
+        self.rounds(year)
+        return self.read(table, {'season': year}).drop(columns=['season']).set_index('round')
+
+    def get_race_result(self, year=None, race=None):
+        return self.round_rows('results', year, race)
+
+    def get_qualifying_result(self, year=None, race=None):
+        result = self.round_rows('qualifying', year, race)
+        # Drop the sessions that did not exist in this round's qualifying format, like the API version
+        return result.drop(columns=[q for q in ('Q2', 'Q3') if q in result.columns and result[q].isna().all()])
+
+    def get_sprint_result(self, year=None, race=None):
+        if year or race:
+            return self.round_rows('sprint', year, race)
+        sprints = self.read('sprint', {'season': self.latest_season()})
+        return sprints[sprints['round'] == sprints['round'].max()].drop(columns=['season', 'round'])
+
+    def get_season_results(self, year):
+        return self.season_rows('results', year)
+
+    def get_season_qualifying(self, year):
+        return self.season_rows('qualifying', year)
+
+    def get_season_sprints(self, year):
+        return self.season_rows('sprint', year)
+
+    def get_season_standings(self, year, constructors=False):
+        return self.season_rows('constructor_standings' if constructors else 'driver_standings', year)
+
+    def standings(self, table, year, race):
+        if year and not race:
+            race = max(self.rounds(year))
+        return self.round_rows(table, year, race)
+
+    def driver_standings(self, year=None, race=None):
+        return self.standings('driver_standings', year, race)
+
+    def constructor_standings(self, year=None, race=None):
+        return self.standings('constructor_standings', year, race)
+
+    def get_schedule(self, year=None):
+        year = year or self.latest_season()
+        self.rounds(year)
+        schedule = self.read('schedule', {'season': year})
+        schedule['season'] = schedule['season'].astype(str)
+        schedule['round'] = schedule['round'].astype(str)
+        return schedule
+
+    def career(self, table, filters, spec, renames=None):
+        # Standings after the last round stored of each season, as the API's drivers/<id>/driverStandings
+        renames = renames or {}
+        sources = {target: source for source, target in renames.items()}
+        rows = self.read(table, filters, columns=[sources.get(name, name) for name in spec]).rename(columns=renames)
+        last = {int(year): max(state['rounds']) for year, state in self.manifest['seasons'].items() if state['rounds']}
+        rows = rows[rows['round'] == rows['season'].map(last)]
+        rows['season'] = rows['season'].astype(str)
+        rows['round'] = rows['round'].astype(str)
+        return rows[list(spec)].reset_index(drop=True)
+
+    def query_driver(self, driverid):
+        return self.career('driver_standings', {'driverID': driverid}, pyergast.DRIVER_CAREER_COLUMNS)
+
+    def query_constructor(self, constructorid):
+        return self.career('constructor_standings', {'constructorID': constructorid},
+                           pyergast.CONSTRUCTOR_CAREER_COLUMNS, renames={'name': 'constructor'})
+
+    def query(self, name, *args, **kwargs):
+        """
+        Answers the pyergast query function `name` from the store, with the same arguments and the same DataFrame
+        layout as the API version
+        """
+        bound = inspect.signature(getattr(pyergast, name)).bind(*args, **kwargs)
+        bound.apply_defaults()
+        return getattr(self, name)(**bound.arguments)
+
+
+def use(path):
+    """
+    Makes `source='local'` queries use the store at `path` for the rest of the process. Returns the `Store`.
+    """
+    global local
+    local = Store(path)
+    return local
+
+
+# The store answering `source='local'` queries
+local = Store()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the practice results page parsing in f1.py.
+
+Three parsers run on the same pages:
+- soup: the previous approach, a full BeautifulSoup html.parser tree with get_text() sniffing of every table
+- strainer: f1.practice_table_rows without lxml (BeautifulSoup restricted to tables)
+- lxml: f1.practice_table_rows with lxml's C parser (skipped if lxml is not installed)
+Every parser must produce the same results as soup, otherwise the benchmark fails.
+
+Pass saved F1.com results pages to benchmark them. Without arguments, synthetic pages shaped like F1.com's markup are
+used (a large script/navigation payload around one results table).
+
+Run: python3 scripts/bench-practice-parse.py [page.html ...] [--number 20]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import f1  # noqa: E402
+
+DRIVERS = [
+    ('1', 'Max', 'Verstappen', 'VER', 'Red Bull Racing Honda RBPT'),
+    ('44', 'Lewis', 'Hamilton', 'HAM', 'Ferrari'),
+    ('16', 'Charles', 'Leclerc', 'LEC', 'Ferrari'),
+    ('4', 'Lando', 'Norris', 'NOR', 'McLaren Mercedes'),
+    ('81', 'Oscar', 'Piastri', 'PIA', 'McLaren Mercedes'),
+    ('63', 'George', 'Russell', 'RUS', 'Mercedes'),
+    ('14', 'Fernando', 'Alonso', 'ALO', 'Aston Martin Aramco Mercedes'),
+    ('18', 'Lance', 'Stroll', 'STR', 'Aston Martin Aramco Mercedes'),
+    ('10', 'Pierre', 'Gasly', 'GAS', 'Alpine Renault'),
+    ('31', 'Esteban', 'Ocon', 'OCO', 'Haas Ferrari'),
+    ('23', 'Alexander', 'Albon', 'ALB', 'Williams Mercedes'),
+    ('55', 'Carlos', 'Sainz', 'SAI', 'Williams Mercedes'),
+    ('22', 'Yuki', 'Tsunoda', 'TSU', 'Racing Bulls Honda RBPT'),
+    ('30', 'Liam', 'Lawson', 'LAW', 'Racing Bulls Honda RBPT'),
+    ('27', 'Nico', 'Hulkenberg', 'HUL', 'Kick Sauber Ferrari'),
+    ('5', 'Gabriel', 'Bortoleto', 'BOR', 'Kick Sauber Ferrari'),
+    ('87', 'Oliver', 'Bearman', 'BEA', 'Haas Ferrari'),
+    ('43', 'Franco', 'Colapinto', 'COL', 'Alpine Renault'),
+    ('12', 'Kimi', 'Antonelli', 'ANT', 'Mercedes'),
+    ('6', 'Isack', 'Hadjar', 'HAD', 'Racing Bulls Honda RBPT'),
+]
+
+
+def synthetic_page(padding_kb=400, seed=0):
+    """
+    Returns an HTML page shaped like an F1.com practice results page: a large inline script payload and navigation,
+    an unrelated table, then the results table with the driver cells split into name/abbreviation spans
+    """
+    head = '<script id="__NEXT_DATA__" type="application/json">{}</script>'.format('{"k":"v"},' * (padding_kb * 100))
+    nav = ''.join('<li><a href="/en/racing/{0}">Grand Prix {0}</a></li>'.format(i) for i in range(300))
+    schedule = '<table class="schedule"><tr><th>Round</th><th>Date</th></tr>' + ''.join(
+        '<tr><td>{0}</td><td>2026-03-{0:02}</td></tr>'.format(i) for i in range(1, 25)) + '</table>'
+    rows = []
+    for position, (number, first, last, code, team) in enumerate(DRIVERS, 1):
+        time = '1:{:06.3f}'.format(30 + seed + position * 0.137) if position == 1 else '+{:.3f}'.format(position * 0.137)
+        rows.append('<tr><td><p>{}</p></td><td><p>{}</p></td><td><p><span><img src="/{}.png" alt=""/>'
+                    '<span class="max-lg:hidden">{}</span> <span class="max-md:hidden">{}</span>'
+                    '<span class="md:hidden">{}</span></span></p></td><td><p>{}</p></td><td><p>{}</p></td>'
+                    '<td><p>{}</p></td></tr>'.format(position, number, code.lower(), first, last, code, team, time,
+                                                     20 + position))
+    results = ('<table class="f1-table"><thead><tr><th><p>Pos.</p></th><th><p>No.</p></th><th><p>Driver</p></th>'
+               '<th><p>Team</p></th><th><p>Time / Gap</p></th><th><p>Laps</p></th></tr></thead><tbody>'
+               + ''.join(rows) + '</tbody></table>')
+    footer = '<footer>' + '<p>Formula 1</p>' * 500 + '</footer>'
+    return ('<!DOCTYPE html><html><head><title>Practice 1</title>{}</head><body><nav><ul>{}</ul></nav><main>{}{}</main>'
+            '{}</body></html>').format(head, nav, schedule, results, footer).encode('utf-8')
+
+
+def soup_table_rows(content):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, 'html.parser')
+    for table in soup.find_all('table'):
+        table_text = table.get_text().lower()
+        if 'pos' in table_text and ('time' in table_text or 'gap' in table_text):
+            return [[cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])] for row in table.find_all('tr')]
+    return None
+
+
+def parsers():
+    result = {
+        'soup': soup_table_rows,
+        'strainer': lambda content: f1.practice_table_rows(content, use_lxml=False),
+    }
+    try:
+        import lxml.html  # noqa: F401
+        result['lxml'] = f1.practice_table_rows
+    except ImportError:
+        print('lxml is not installed, skipping the lxml parser')
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('pages', nargs='*', help='saved F1.com practice results pages')
+    parser.add_argument('--number', type=int, default=10, help='parses per timing, the best of 3 timings is kept')
+    options = parser.parse_args()
+
+    if options.pages:
+        pages = {}
+        for path in options.pages:
+            with open(path, 'rb') as f:
+                pages[os.path.basename(path)] = f.read()
+    else:
+        pages = {'synthetic-{}kb'.format(kb): synthetic_page(kb) for kb in (50, 400)}
+
+    candidates = parsers()
+    print('{:<24} {:>8} {:>10} {:>9}'.format('page', 'parser', 'ms/page', 'speedup'))
+    failed = False
+    for name, content in pages.items():
+        expected = soup_table_rows(content)
+        expected = None if expected is None else f1.practice_results(expected)
+        baseline = None
+        for label, extract in candidates.items():
+            rows = extract(content)
+            got = None if rows is None else f1.practice_results(rows)
+            if got != expected:
+                print('{:<24} {:>8} results differ from soup'.format(name, label))
+                failed = True
+                continue
+            best = min(timeit.repeat(lambda: extract(content), number=options.number, repeat=3)) / options.number
+            baseline = baseline or best
+            print('{:<24} {:>8} {:>10.2f} {:>8.1f}x'.format(name, label, best * 1000, baseline / best))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the f1.py table renderers and the pyergast JSON-to-DataFrame conversions: time and peak memory per case.
+
+Inputs come from a synthetic corpus shaped like the API's responses, scaling from one race to every season from
+1950 to today, or from a fixture archive recorded with `pyergast.fixtures` (`--fixtures`). Results can be written
+with `--json` and compared with a previous run with `--baseline`, which fails when a case got slower than
+`--tolerance`.
+
+Run: python3 scripts/bench-render.py [--scale race|season|corpus] [--filter render] [--json out.json]
+     python3 scripts/bench-render.py --fixtures round.jsonl.gz --round 2021 10
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+import f1  # noqa: E402
+import pyergast  # noqa: E402
+from pyergast import laptime, records  # noqa: E402
+
+NATIONALITIES = ['British', 'Dutch', 'Spanish', 'Monegasque', 'Australian', 'German', 'Finnish', 'French']
+TEAMS = [('red_bull', 'Red Bull'), ('mercedes', 'Mercedes'), ('ferrari', 'Ferrari'), ('mclaren', 'McLaren'),
+         ('williams', 'Williams'), ('alpine', 'Alpine F1 Team'), ('aston_martin', 'Aston Martin'), ('haas', 'Haas F1 Team'),
+         ('sauber', 'Sauber'), ('rb', 'RB F1 Team'), ('lotus', 'Lotus'), ('brabham', 'Brabham'), ('tyrrell', 'Tyrrell'),
+         ('march', 'March'), ('ligier', 'Ligier'), ('minardi', 'Minardi'), ('arrows', 'Arrows')]
+
+
+def lap(millis):
+    return '{}:{:06.3f}'.format(millis // 60000, millis % 60000 / 1000)
+
+
+def synthetic_driver(i):
+    return {'driverId': 'driver_{}'.format(i), 'permanentNumber': str(i + 1), 'code': 'D{:02}'.format(i % 100),
+            'url': 'http://en.wikipedia.org/wiki/Driver_{}'.format(i), 'givenName': 'Given{}'.format(i),
+            'familyName': 'Family{}'.format(i), 'dateOfBirth': '1990-01-01',
+            'nationality': NATIONALITIES[i % len(NATIONALITIES)]}
+
+
+def synthetic_constructor(i):
+    constructor_id, name = TEAMS[i // 2 % len(TEAMS)]
+    return {'constructorId': constructor_id, 'url': 'http://en.wikipedia.org/wiki/' + name, 'name': name,
+            'nationality': 'British'}
+
+
+def synthetic_race(year, race, entrants):
+    """
+    Returns one RaceTable race with its Results and QualifyingResults, shaped like the API's
+    """
+    results, qualifying = [], []
+    for i in range(entrants):
+        driver = (i + race) % entrants
+        finished = i < entrants * 2 // 3
+        result = {'number': str(driver + 1), 'position': str(i + 1), 'positionText': str(i + 1) if finished else 'R',
+                  'points': str([25, 18, 15, 12, 10, 8, 6, 4, 2, 1][i] if i < 10 else 0),
+                  'Driver': synthetic_driver(driver), 'Constructor': synthetic_constructor(driver),
+                  'grid': str(i * 7 % entrants + 1), 'laps': '57' if finished else str(10 + i), 'status': 'Finished'
+                  if finished else 'Engine'}
+        if finished:
+            result['Time'] = {'millis': str(5400000 + i * 1234), 'time': '1:30:00.000' if i == 0 else '+{:.3f}'.format(i * 1.234)}
+        results.append(result)
+
+        session = {'number': str(driver + 1), 'position': str(i + 1), 'Driver': synthetic_driver(driver),
+                   'Constructor': synthetic_constructor(driver), 'Q1': lap(90000 + (i * 37 + race) % entrants * 97)}
+        # Same cut-offs as render_qualifying: the top 10 reach Q3, half of the rest is eliminated in Q1
+        if i < 10 + (entrants - 10) // 2:
+            session['Q2'] = lap(89500 + i * 83)
+        if i < 10:
+            session['Q3'] = lap(89000 + i * 71)
+        qualifying.append(session)
+    return {'season': str(year), 'round': str(race), 'raceName': 'Grand Prix {}'.format(race),
+            'Results': results, 'QualifyingResults': qualifying}
+
+
+def synthetic_standings(race, entrants):
+    drivers = [{'position': str(i + 1), 'positionText': str(i + 1), 'points': str((entrants - i) * race), 'wins': '0',
+                'Driver': synthetic_driver((i + race) % entrants),
+                'Constructors': [synthetic_constructor((i + race) % entrants)]} for i in range(entrants)]
+    constructors = [{'position': str(i + 1), 'positionText': str(i + 1), 'points': str((entrants - i) * race * 2),
+                     'wins': '0', 'Constructor': synthetic_constructor(2 * ((i + race) % (entrants // 2)))}
+                    for i in range(entrants // 2)]
+    return drivers, constructors
+
+
+def season_shape(year):
+    # Roughly how the calendar and the entry lists grew and shrank over the decades
+    rounds = 7 + (year - 1950) * 17 // 76
+    entrants = 34 if year < 1995 else 22 if year < 2010 else 20
+    return rounds, entrants
+
+
+def synthetic_corpus(scale):
+    """
+    Returns the races of the requested scale: a single race, the latest season, or every season since 1950
+    """
+    year = datetime.date.today().year
+    if scale == 'race':
+        return [synthetic_race(year, 1, 20)]
+    years = [year] if scale == 'season' else range(1950, year + 1)
+    races = []
+    for season in years:
+        rounds, entrants = season_shape(season)
+        races.extend(synthetic_race(season, race, entrants) for race in range(1, rounds + 1))
+    return races
+
+
+def measure(func, repeat=5, min_time=0.2):
+    """
+    Returns the best time per call in seconds and the peak traced memory in bytes of `func`
+    """
+    tracemalloc.start()
+    started = timeit.default_timer()
+    func()
+    elapsed = timeit.default_timer() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    number = max(1, int(min_time / max(elapsed, 1e-6)))
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    return best, peak
+
+
+def normalizer_cases(races, label):
+    results = [row for race in races for row in race['Results']]
+    qualifying = [row for race in races for row in race['QualifyingResults']]
+    cases = {
+        'normalize results ({})'.format(label):
+            lambda: pyergast.normalize(races, dict(round='round', **pyergast.RESULT_COLUMNS), record_path='Results',
+                                       meta=['round']),
+        'normalize qualifying ({})'.format(label):
+            lambda: pyergast.normalize(races, dict(round='round', **pyergast.QUALIFYING_COLUMNS),
+                                       record_path='QualifyingResults', meta=['round']),
+        'records.flatten results ({})'.format(label):
+            lambda: [records.flatten(row, pyergast.RESULT_COLUMNS) for row in results],
+        'laptime.to_millis Q1 ({})'.format(label):
+            lambda: laptime.to_millis(pd.Series([row['Q1'] for row in qualifying], dtype=object)),
+    }
+    return cases
+
+
+def round_tables(race, drivers, constructors, previous_drivers, previous_constructors):
+    """
+    Returns the DataFrames the renderers take, built the way the pyergast query functions build them
+    """
+    return {
+        'results': pyergast.normalize(race['Results'], pyergast.RESULT_COLUMNS),
+        'qualifying': pyergast.normalize(race['QualifyingResults'], pyergast.QUALIFYING_COLUMNS),
+        'driver_standings': pyergast.normalize(drivers, pyergast.DRIVER_STANDINGS_COLUMNS),
+        'constructor_standings': pyergast.normalize(constructors, pyergast.CONSTRUCTOR_STANDINGS_COLUMNS),
+        'previous_driver_standings': pyergast.normalize(previous_drivers, pyergast.DRIVER_STANDINGS_COLUMNS),
+        'previous_constructor_standings': pyergast.normalize(previous_constructors,
+                                                             pyergast.CONSTRUCTOR_STANDINGS_COLUMNS),
+        'drivers': pd.DataFrame([row['Driver'] for row in race['Results']]),
+    }
+
+
+def synthetic_practice(tables):
+    practice = {}
+    for session, offset in (('FP1', 0), ('FP2', 211), ('FP3', 419)):
+        practice[session] = {}
+        for i, (_, driver) in enumerate(tables['results'].iterrows()):
+            name = driver['driver']
+            time = lap(91000 + offset) if i == 0 else '{:.3f}s'.format(i * 0.173)
+            practice[session][name] = {'position': str(i + 1), 'time': time, 'number': driver['number'],
+                                       'team': driver['constructor']}
+    return practice
+
+
+def renderer_cases(tables, label):
+    practice = synthetic_practice(tables)
+    drivers = tables['drivers'].sort_values('permanentNumber', key=lambda n: n.astype(int))
+    return {
+        'render_race ({})'.format(label): lambda: f1.render_race(tables['results']),
+        'render_qualifying ({})'.format(label): lambda: f1.render_qualifying(tables['qualifying']),
+        'render_grid ({})'.format(label): lambda: f1.render_grid(tables['qualifying'].to_dict('records')),
+        'render_standings ({})'.format(label):
+            lambda: f1.render_standings(tables['driver_standings'], tables['constructor_standings'],
+                                        tables['previous_driver_standings'], tables['previous_constructor_standings']),
+        'render_practice ({})'.format(label):
+            lambda: f1.render_practice(drivers, tables['qualifying'], practice),
+        'position_deltas ({})'.format(label):
+            lambda: f1.position_deltas(tables['driver_standings'], tables['previous_driver_standings'], 'driverID'),
+    }
+
+
+def synthetic_cases(scale):
+    cases = {}
+    scales = ['race', 'season', 'corpus']
+    for name in scales[:scales.index(scale) + 1]:
+        cases.update(normalizer_cases(synthetic_corpus(name), name))
+    for entrants in (20, 34):
+        race = synthetic_race(datetime.date.today().year, 2, entrants)
+        tables = round_tables(race, *synthetic_standings(2, entrants), *synthetic_standings(1, entrants))
+        cases.update(renderer_cases(tables, '{} entrants'.format(entrants)))
+    return cases
+
+
+def fixture_cases(path, year, race):
+    """
+    Returns the cases driven by the responses of one round recorded in a fixture archive
+    """
+    from pyergast import fixtures
+    archive = fixtures.use(path).archive
+    label = '{} round {}'.format(year, race)
+
+    races = []
+    for entry in archive.entries.values():
+        if '/{}/{}/results.json'.format(year, race) in entry['url'] and 'text' in entry:
+            races.extend(json.loads(entry['text'])['MRData']['RaceTable']['Races'])
+    for entry in archive.entries.values():
+        if '/{}/{}/qualifying.json'.format(year, race) in entry['url'] and 'text' in entry:
+            for quali in json.loads(entry['text'])['MRData']['RaceTable']['Races']:
+                for recorded in races:
+                    recorded.setdefault('QualifyingResults', []).extend(quali['QualifyingResults'])
+    cases = normalizer_cases(races, label) if races and all('QualifyingResults' in r for r in races) else {}
+
+    tables = {
+        'results': pyergast.get_race_result(year, race),
+        'qualifying': pyergast.get_qualifying_result(year, race),
+        'driver_standings': pyergast.driver_standings(year, race),
+        'constructor_standings': pyergast.constructor_standings(year, race),
+        'previous_driver_standings': pyergast.driver_standings(year, race - 1) if race > 1 else None,
+        'previous_constructor_standings': pyergast.constructor_standings(year, race - 1) if race > 1 else None,
+    }
+    tables['drivers'] = pd.DataFrame([{'driverId': row['driverID'], 'permanentNumber': row['number'],
+                                       'givenName': row['driver'].split(' ', 1)[0],
+                                       'familyName': row['driver'].split(' ', 1)[-1],
+                                       'nationality': row['nationality']} for row in tables['results'].to_dict('records')])
+    cases.update(renderer_cases(tables, label))
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', choices=['race', 'season', 'corpus'], default='corpus',
+                        help='largest synthetic corpus for the normalizers')
+    parser.add_argument('--fixtures', help='fixture archive to take the inputs from instead of the synthetic corpus')
+    parser.add_argument('--round', nargs=2, type=int, metavar=('YEAR', 'ROUND'), help='round to use from --fixtures')
+    parser.add_argument('--filter', help='only run cases whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=5, help='timings per case, the best one is kept')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--baseline', help='compare against results previously written with --json')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='fail when a case is this fraction slower than the baseline')
+    options = parser.parse_args()
+
+    if options.fixtures:
+        if not options.round:
+            parser.error('--fixtures requires --round YEAR ROUND')
+        cases = fixture_cases(options.fixtures, *options.round)
+    else:
+        cases = synthetic_cases(options.scale)
+
+    baseline = {}
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+
+    print('{:<44} {:>11} {:>11} {:>9}'.format('case', 'ms/call', 'peak MiB', 'vs base'))
+    results, regressions = {}, []
+    for name, func in cases.items():
+        if options.filter and options.filter not in name:
+            continue
+        seconds, peak = measure(func, repeat=options.repeat)
+        results[name] = {'ms': seconds * 1000, 'peak_mib': peak / 2 ** 20}
+        change = ''
+        if name in baseline and baseline[name]['ms']:
+            ratio = results[name]['ms'] / baseline[name]['ms'] - 1
+            change = '{:+.0%}'.format(ratio)
+            if ratio > options.tolerance:
+                regressions.append(name)
+        print('{:<44} {:>11.3f} {:>11.2f} {:>9}'.format(name, results[name]['ms'], results[name]['peak_mib'], change))
+
+    if options.json:
+        with open(options.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    if regressions:
+        print('Slower than the baseline beyond {:.0%}: {}'.format(options.tolerance, ', '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
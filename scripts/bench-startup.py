@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the f1.py CLI: import cost of each subcommand, measured with `python -X importtime`.
+
+Every subcommand runs in a fresh interpreter, and the cumulative time of its top-level imports is summed.
+The commands really run, so warm the pyergast response cache first (or run twice) to keep network time out of the
+wall-clock column. Network time never counts towards the import column.
+
+Run: python3 scripts/bench-startup.py [--repeat 5] [--json out.json] [--baseline previous.json]
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+F1 = os.path.join(ROOT, 'f1.py')
+
+COMMANDS = {
+    'banner': [],
+    'race': ['race', '2021', '10'],
+    'sprint': ['sprint', '2021', '10'],
+    'quali': ['quali', '2021', '10'],
+    'grid': ['grid', '2021', '10'],
+    'standings': ['standings', '2021', '10'],
+}
+
+# Modules whose presence is reported per subcommand
+HEAVY = ['pandas', 'numpy', 'requests', 'bs4', 'asyncio']
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def measure(args):
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-X', 'importtime', F1] + args, cwd=ROOT, stdin=subprocess.DEVNULL,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=300)
+    wall = time.perf_counter() - started
+
+    imports = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        modules.add(name)
+        # Top-level imports carry a single space; nested ones are indented further and already counted
+        if indent == 1:
+            imports += cumulative
+    return {'imports_ms': imports / 1000, 'wall_ms': wall * 1000, 'heavy': [m for m in HEAVY if m in modules]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help='runs per subcommand, the fastest one is kept')
+    parser.add_argument('--commands', nargs='+', choices=sorted(COMMANDS), default=list(COMMANDS))
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--baseline', help='compare against results previously written with --json')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='fail when a subcommand imports this fraction slower than the baseline')
+    options = parser.parse_args()
+
+    results = {}
+    for name in options.commands:
+        runs = [measure(COMMANDS[name]) for _ in range(options.repeat)]
+        results[name] = min(runs, key=lambda run: run['imports_ms'])
+
+    baseline = {}
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+
+    print('{:<10} {:>11} {:>11} {:>9}  {}'.format('command', 'imports ms', 'wall ms', 'vs base', 'heavy modules'))
+    regressions = []
+    for name, result in results.items():
+        change = ''
+        if name in baseline and baseline[name]['imports_ms']:
+            ratio = result['imports_ms'] / baseline[name]['imports_ms'] - 1
+            change = '{:+.0%}'.format(ratio)
+            if ratio > options.tolerance:
+                regressions.append(name)
+        print('{:<10} {:>11.1f} {:>11.1f} {:>9}  {}'.format(name, result['imports_ms'], result['wall_ms'], change,
+                                                           ', '.join(result['heavy']) or '-'))
+
+    if options.json:
+        with open(options.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    if regressions:
+        print('Import time regressed beyond {:.0%}: {}'.format(options.tolerance, ', '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Syncs the local pyergast store (Parquet files per table and season, see pyergast/store.py) with the API.
+
+Only rounds that are not stored yet are fetched, so running it again after a Grand Prix costs a handful of requests.
+Queries then answer offline with `source='local'`, e.g. `pyergast.query_driver('alonso', source='local')`.
+
+Run: python3 scripts/sync-store.py [--seasons 1950-2026] [--tables results,qualifying] [--path DIR]
+"""
+import argparse
+import datetime
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pyergast import store  # noqa: E402
+
+
+def seasons(text):
+    """
+    Parses '2021', '2010-2020' or '1950-2026,2030' into a list of years
+    """
+    years = []
+    for part in text.split(','):
+        first, _, last = part.partition('-')
+        years.extend(range(int(first), int(last or first) + 1))
+    return years
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seasons', type=seasons, default=None,
+                        help='years to sync, e.g. 2021 or 1950-2026 (default: 1950 to this year)')
+    parser.add_argument('--tables', default=','.join(store.TABLES),
+                        help='comma-separated tables (default: {})'.format(','.join(store.TABLES)))
+    parser.add_argument('--path', help='store directory (default: $PYERGAST_STORE_DIR or ~/.local/share/pyergast/store)')
+    options = parser.parse_args()
+
+    tables = [table.strip() for table in options.tables.split(',') if table.strip()]
+    unknown = [table for table in tables if table not in store.TABLES]
+    if unknown:
+        parser.error('unknown tables: {}'.format(', '.join(unknown)))
+
+    local = store.Store(options.path)
+    started = time.perf_counter()
+    summary = local.sync(options.seasons or range(1950, datetime.date.today().year + 1), tables,
+                         progress=lambda year, rows: print('{}: {}'.format(
+                             year, ', '.join('{} {}'.format(count, table) for table, count in rows.items()))))
+    print('Synced {} seasons into {} in {:.1f}s'.format(len(summary), local.path, time.perf_counter() - started))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+Shared fixtures of the pyergast tests. The API is replaced by a `pyergast.fixtures` archive filled by each test, so
+nothing touches the network.
+
+Run: python -m pytest tests
+"""
+import json
+import os
+import sys
+
+import pytest
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pyergast  # noqa: E402
+from pyergast import fixtures  # noqa: E402
+
+API = 'http://api.jolpi.ca/ergast/f1/'
+
+NATIONALITIES = ['British', 'Dutch', 'Spanish', 'Monegasque']
+TEAMS = [('red_bull', 'Red Bull'), ('mercedes', 'Mercedes'), ('ferrari', 'Ferrari'), ('mclaren', 'McLaren')]
+
+
+def driver(i):
+    return {'driverId': 'driver{}'.format(i), 'givenName': 'Given{}'.format(i), 'familyName': 'Family{}'.format(i),
+            'nationality': NATIONALITIES[i % len(NATIONALITIES)]}
+
+
+def constructor(i):
+    constructor_id, name = TEAMS[i % len(TEAMS)]
+    return {'constructorId': constructor_id, 'name': name, 'nationality': 'British'}
+
+
+def race(season, race_round, **tables):
+    return dict({'season': str(season), 'round': str(race_round), 'raceName': 'Race {}'.format(race_round),
+                 'date': '{}-03-{:02d}'.format(season, race_round), 'time': '14:00:00Z',
+                 'Circuit': {'circuitId': 'circuit{}'.format(race_round), 'circuitName': 'Circuit {}'.format(race_round),
+                             'Location': {'lat': '1', 'long': '2', 'locality': 'Town', 'country': 'Land'}}},
+                **tables)
+
+
+def results(race_round, drivers=4):
+    points = ['25', '18', '15', '12']
+    return [{'number': str(i + 1), 'position': str(i + 1), 'positionText': str(i + 1), 'points': points[i % 4],
+             'grid': str(i + 1), 'laps': '50', 'status': 'Finished', 'Driver': driver((i + race_round) % drivers),
+             'Constructor': constructor((i + race_round) % drivers),
+             'Time': {'millis': str(5400000 + i * 1000), 'time': '+{}.000'.format(i)}} for i in range(drivers)]
+
+
+def qualifying(race_round, drivers=4):
+    return [{'number': str(i + 1), 'position': str(i + 1), 'Driver': driver((i + race_round) % drivers),
+             'Constructor': constructor((i + race_round) % drivers), 'Q1': '1:30.{:03d}'.format(i)}
+            for i in range(drivers)]
+
+
+def driver_standings(race_round, drivers=4):
+    return [{'position': str(i + 1), 'positionText': str(i + 1), 'points': str(100 - i * 10 + race_round),
+             'wins': '0', 'Driver': driver(i), 'Constructors': [constructor(i)]} for i in range(drivers)]
+
+
+def constructor_standings(race_round):
+    return [{'position': str(i + 1), 'positionText': str(i + 1), 'points': str(200 - i * 20 + race_round),
+             'wins': '0', 'Constructor': constructor(i)} for i in range(len(TEAMS))]
+
+
+def mrdata(table, key, rows, total=None, limit=100, offset=0):
+    return {'MRData': {'limit': str(limit), 'offset': str(offset), 'total': str(len(rows) if total is None else total),
+                       table: {key: rows}}}
+
+
+class FakeAPI(fixtures.FixtureAdapter):
+    """
+    A replaying `FixtureAdapter` whose responses are added by the tests. It records the URL of every request, and
+    answers conditional requests with 304 when the stored response has the same `ETag`.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.sent = []
+
+    def add(self, url, body, status=200, headers=None, limit=100, offset=0):
+        """
+        Serves `body` (a dict sent as JSON) for `url`, at the paging parameters pyergast requests
+        """
+        if '?' not in url:
+            url = '{}?limit={}&offset={}'.format(url, limit, offset)
+        self.archive.entries[fixtures.fixture_key('GET', url)] = {
+            'method': 'GET', 'url': url, 'status': status, 'reason': None, 'text': json.dumps(body),
+            'headers': dict({'Content-Type': 'application/json'}, **(headers or {}))}
+
+    def table(self, path, table, key, rows, **kwargs):
+        self.add(API + path, mrdata(table, key, rows), **kwargs)
+
+    def send(self, request, **kwargs):
+        self.sent.append(request.url)
+        response = super().send(request, **kwargs)
+        etag = response.headers.get('ETag')
+        if etag is not None and request.headers.get('If-None-Match') == etag:
+            not_modified = requests.Response()
+            not_modified.status_code = 304
+            not_modified.headers = response.headers
+            not_modified._content = b''
+            not_modified.url = request.url
+            not_modified.request = request
+            return not_modified
+        return response
+
+    def count(self, fragment=''):
+        return sum(fragment in url for url in self.sent)
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    """
+    Routes pyergast through a `FakeAPI`, with no response cache, no retries and an empty memo
+    """
+    adapter = FakeAPI(str(tmp_path / 'api.jsonl.gz'))
+    monkeypatch.setattr(fixtures, 'active', adapter)
+    monkeypatch.setattr(pyergast, 'client', pyergast.ErgastClient())
+    pyergast.clear_memo()
+    yield adapter
+    pyergast.clear_memo()
+
+
+def add_season(api, season, rounds):
+    """
+    Serves the schedule, results, qualifying and round-by-round standings of a season with `rounds` rounds
+    """
+    api.table('{}.json'.format(season), 'RaceTable', 'Races', [race(season, r) for r in range(1, rounds + 1)])
+    api.table('{}/results.json'.format(season), 'RaceTable', 'Races',
+              [race(season, r, Results=results(r)) for r in range(1, rounds + 1)])
+    api.table('{}/qualifying.json'.format(season), 'RaceTable', 'Races',
+              [race(season, r, QualifyingResults=qualifying(r)) for r in range(1, rounds + 1)])
+    for r in range(1, rounds + 1):
+        api.table('{}/{}/results.json'.format(season, r), 'RaceTable', 'Races', [race(season, r, Results=results(r))])
+        api.table('{}/{}/driverStandings.json'.format(season, r), 'StandingsTable', 'StandingsLists',
+                  [{'season': str(season), 'round': str(r), 'DriverStandings': driver_standings(r)}])
+        api.table('{}/{}/constructorStandings.json'.format(season, r), 'StandingsTable', 'StandingsLists',
+                  [{'season': str(season), 'round': str(r), 'ConstructorStandings': constructor_standings(r)}])
+    for table, key in (('driverStandings', 'DriverStandings'), ('constructorStandings', 'ConstructorStandings')):
+        last = driver_standings(rounds) if key == 'DriverStandings' else constructor_standings(rounds)
+        for limit in (1, 100):
+            api.table('{}/{}.json'.format(season, table), 'StandingsTable', 'StandingsLists',
+                      [{'season': str(season), 'round': str(rounds), key: last}], limit=limit)
@@ -0,0 +1,32 @@
+import pyergast
+from pyergast import aio
+from conftest import constructor_standings, driver_standings, qualifying, race, results
+
+
+def add_round(api, season=2020, race_round=3):
+    api.table('{}/{}/results.json'.format(season, race_round), 'RaceTable', 'Races',
+              [race(season, race_round, Results=results(race_round))])
+    api.table('{}/{}/qualifying.json'.format(season, race_round), 'RaceTable', 'Races',
+              [race(season, race_round, QualifyingResults=qualifying(race_round))])
+    api.table('{}/{}/driverStandings.json'.format(season, race_round), 'StandingsTable', 'StandingsLists',
+              [{'season': str(season), 'round': str(race_round), 'DriverStandings': driver_standings(race_round)}])
+    api.table('{}/{}/constructorStandings.json'.format(season, race_round), 'StandingsTable', 'StandingsLists',
+              [{'season': str(season), 'round': str(race_round),
+                'ConstructorStandings': constructor_standings(race_round)}])
+
+
+def test_run_matches_synchronous_queries(api):
+    add_round(api)
+    result, quali = aio.run(aio.get_race_result(2020, 3), aio.get_qualifying_result(2020, 3))
+    assert result.equals(pyergast.get_race_result(2020, 3))
+    assert quali.equals(pyergast.get_qualifying_result(2020, 3))
+    # The coroutines share the memo of the synchronous functions
+    assert api.count() == 2
+
+
+def test_get_round_returns_missing_tables_as_none(api):
+    add_round(api)
+    tables = aio.run(aio.get_round(2020, 3, sprint=True))[0]
+    assert tables['sprint'] is None
+    assert len(tables['results']) == 4
+    assert tables['constructor_standings'].loc[0, 'constructorID'] == 'red_bull'
@@ -0,0 +1,75 @@
+import datetime
+import json
+import time
+import zlib
+
+import pyergast
+from conftest import API, mrdata, race, results
+
+
+def test_finished_seasons_never_expire(tmp_path):
+    cache = pyergast.ResponseCache(str(tmp_path / 'responses.sqlite'))
+    assert cache.ttl(API + '2020/3/results.json?limit=100&offset=0') is None
+    assert cache.ttl(API + 'current/last/results.json?limit=100&offset=0') == cache.live_ttl
+    this_year = API + '{}/results.json'.format(datetime.date.today().year)
+    assert cache.ttl(this_year) == cache.season_ttl
+
+
+def test_empty_answers_for_the_running_season_expire_quickly(tmp_path):
+    cache = pyergast.ResponseCache(str(tmp_path / 'responses.sqlite'))
+    empty = json.dumps(mrdata('RaceTable', 'Races', [])).encode()
+    published = json.dumps(mrdata('RaceTable', 'Races', [race(2020, 3, Results=results(3))])).encode()
+    this_year = API + '{}/20/results.json?limit=100&offset=0'.format(datetime.date.today().year)
+    assert cache.ttl(this_year, empty) == cache.live_ttl
+    assert cache.ttl(this_year, published) == cache.season_ttl
+    assert cache.ttl(API + '1990/sprint.json?limit=100&offset=0', empty) is None
+
+
+def test_unpublished_round_is_fetched_again(api, tmp_path, monkeypatch):
+    year = datetime.date.today().year
+    api.table('{}/20/results.json'.format(year), 'RaceTable', 'Races', [])
+    cache = pyergast.ResponseCache(str(tmp_path / 'responses.sqlite'), live_ttl=-1)
+    monkeypatch.setattr(pyergast, 'client', pyergast.ErgastClient(cache=cache))
+    assert pyergast.get_race_result(year, 20).empty
+
+    api.table('{}/20/results.json'.format(year), 'RaceTable', 'Races', [race(year, 20, Results=results(20))])
+    pyergast.clear_memo()
+    assert len(pyergast.get_race_result(year, 20)) == 4
+    assert api.count() == 2
+
+
+def test_expired_entries_are_not_served(tmp_path):
+    cache = pyergast.ResponseCache(str(tmp_path / 'responses.sqlite'), live_ttl=0)
+    url = API + 'current/last/results.json'
+    cache.put(url, b'{}', etag='"v1"')
+    time.sleep(0.01)
+    assert cache.get(url) is None
+    body, fresh, etag, _ = cache.entry(url)
+    assert (body, fresh, etag) == (b'{}', False, '"v1"')
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    # Room for two of the responses
+    size = len(zlib.compress(b'a' * 1000))
+    cache = pyergast.ResponseCache(str(tmp_path / 'responses.sqlite'), max_bytes=2 * size)
+    for name in ('a', 'b', 'c'):
+        cache.put(API + '2020/{}.json'.format(name), name.encode() * 1000)
+        time.sleep(0.01)
+        if name == 'b':
+            cache.get(API + '2020/a.json')
+    assert cache.get(API + '2020/a.json') is not None
+    assert cache.get(API + '2020/b.json') is None
+    assert cache.get(API + '2020/c.json') is not None
+
+
+def test_cached_responses_survive_the_process(api, tmp_path, monkeypatch):
+    api.table('2020/3/results.json', 'RaceTable', 'Races', [race(2020, 3, Results=results(3))])
+    path = str(tmp_path / 'responses.sqlite')
+    monkeypatch.setattr(pyergast, 'client', pyergast.ErgastClient(cache=pyergast.ResponseCache(path)))
+    first = pyergast.get_race_result(2020, 3)
+
+    # A new process: empty memo, new client, same cache file
+    pyergast.clear_memo()
+    monkeypatch.setattr(pyergast, 'client', pyergast.ErgastClient(cache=pyergast.ResponseCache(path)))
+    assert pyergast.get_race_result(2020, 3).equals(first)
+    assert api.count() == 1
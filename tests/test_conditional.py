@@ -0,0 +1,63 @@
+import pytest
+
+import pyergast
+from conftest import API, mrdata, race, results
+
+LIVE = API + 'current/last/results.json'
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    calls = []
+    normalize = pyergast.normalize
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return normalize(*args, **kwargs)
+
+    monkeypatch.setattr(pyergast, 'normalize', counting)
+    return calls
+
+
+def add_live(api, race_round, etag=None):
+    api.add(LIVE, mrdata('RaceTable', 'Races', [race(2020, race_round, Results=results(race_round))]),
+            headers={'ETag': etag} if etag else None)
+
+
+def test_unchanged_live_result_is_not_parsed_again(api, parses):
+    add_live(api, 3, etag='"v1"')
+    first = pyergast.get_race_result()
+    second = pyergast.get_race_result()
+    assert second.equals(first)
+    # One download and one 304 Not Modified
+    assert api.count() == 2
+    assert len(parses) == 1
+
+
+def test_changed_live_result_is_rebuilt_from_one_download(api, parses):
+    add_live(api, 3, etag='"v1"')
+    pyergast.get_race_result()
+    add_live(api, 4, etag='"v2"')
+    # Round 4 starts with driver 0, round 3 with driver 3
+    assert pyergast.get_race_result().loc[0, 'driver'] == 'Given0 Family0'
+    assert api.count() == 2
+    assert len(parses) == 2
+
+
+def test_identical_body_without_validators_is_not_parsed_again(api, parses):
+    add_live(api, 3)
+    pyergast.get_race_result()
+    pyergast.get_race_result()
+    assert api.count() == 2
+    assert len(parses) == 1
+
+
+def test_expired_cache_entry_is_revalidated(api, tmp_path, monkeypatch):
+    add_live(api, 3, etag='"v1"')
+    cache = pyergast.ResponseCache(str(tmp_path / 'responses.sqlite'), live_ttl=-1)
+    monkeypatch.setattr(pyergast, 'client', pyergast.ErgastClient(cache=cache))
+    first = pyergast.get_race_result()
+    pyergast.clear_memo()
+    assert pyergast.get_race_result().equals(first)
+    assert api.count() == 2
+    assert cache.entry(LIVE + '?limit=100&offset=0')[2] == '"v1"'
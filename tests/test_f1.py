@@ -0,0 +1,22 @@
+import f1
+from conftest import API, add_season, constructor_standings, driver_standings, mrdata
+
+
+def test_grid_without_qualifying_rows(api, capsys):
+    api.add(API + '2026/20/qualifying.json', mrdata('RaceTable', 'Races', []))
+    assert f1.grid(2026, 20) is False
+    assert capsys.readouterr().out == 'No data available.\n'
+
+
+def test_watched_standings_match_the_standings_command(api, capsys):
+    add_season(api, 2026, 3)
+    for path, key, rows in (('driverStandings', 'DriverStandings', driver_standings(3)),
+                            ('constructorStandings', 'ConstructorStandings', constructor_standings(3))):
+        for limit in (1, 100):
+            api.table('current/{}.json'.format(path), 'StandingsTable', 'StandingsLists',
+                      [{'season': '2026', 'round': '3', key: rows}], limit=limit)
+    data = f1.fetch_table('standings')
+    assert all(frame is not None for frame in data)
+
+    f1.standings(2026, 3)
+    assert f1.render_table('standings', data) == capsys.readouterr().out
@@ -0,0 +1,43 @@
+import pyergast
+from conftest import qualifying, race, results
+
+
+def add_race(api, season=2020, race_round=3):
+    api.table('{}/{}/results.json'.format(season, race_round), 'RaceTable', 'Races',
+              [race(season, race_round, Results=results(race_round))])
+
+
+def test_one_request_per_dataset(api):
+    add_race(api)
+    first = pyergast.get_race_result(2020, 3)
+    second = pyergast.get_race_result(2020, 3)
+    assert api.count('results') == 1
+    assert first.equals(second)
+
+
+def test_clear_memo_fetches_again(api):
+    add_race(api)
+    pyergast.get_race_result(2020, 3)
+    pyergast.clear_memo()
+    pyergast.get_race_result(2020, 3)
+    assert api.count('results') == 2
+
+
+def test_mutating_a_result_does_not_leak(api):
+    add_race(api)
+    result = pyergast.get_race_result(2020, 3)
+    result.loc[0, 'driver'] = 'Changed'
+    result.loc[0, 'Time']['time'] = 'Changed'
+    again = pyergast.get_race_result(2020, 3)
+    assert again.loc[0, 'driver'] == 'Given3 Family3'
+    assert again.loc[0, 'Time']['time'] == '+0.000'
+
+
+def test_nested_query_is_memoized(api):
+    race_results = results(3)
+    race_results[0]['grid'] = None
+    api.table('2020/3/results.json', 'RaceTable', 'Races', [race(2020, 3, Results=race_results)])
+    api.table('2020/3/qualifying.json', 'RaceTable', 'Races', [race(2020, 3, QualifyingResults=qualifying(3))])
+    assert pyergast.get_race_result(2020, 3).loc[0, 'grid'] == '1'
+    pyergast.get_qualifying_result(2020, 3)
+    assert api.count('qualifying') == 1
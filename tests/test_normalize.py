@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+import pyergast
+from conftest import API, mrdata, race, results
+
+
+def without_grid(race_round):
+    rows = results(race_round)
+    rows[0]['grid'] = None
+    return rows
+
+
+def test_normalize_flattens_nested_fields():
+    frame = pyergast.normalize(results(1, drivers=2), pyergast.RESULT_COLUMNS)
+    assert list(frame.columns) == list(pyergast.RESULT_COLUMNS)
+    assert frame.loc[0, 'driver'] == 'Given1 Family1'
+    assert frame.loc[0, 'constructorID'] == 'mercedes'
+    assert frame.loc[0, 'Time'] == {'millis': '5400000', 'time': '+0.000'}
+
+
+def test_fill_grid_keeps_grid_without_qualifying(api):
+    api.table('2020/3/results.json', 'RaceTable', 'Races', [race(2020, 3, Results=without_grid(3))])
+    # No qualifying fixture: the request fails like it would offline
+    result = pyergast.get_race_result(2020, 3)
+    assert pd.isna(result.loc[0, 'grid'])
+
+
+def test_fill_grid_skips_seasons_without_qualifying(api):
+    api.table('1990/3/results.json', 'RaceTable', 'Races', [race(1990, 3, Results=without_grid(3))])
+    result = pyergast.get_race_result(1990, 3)
+    assert pd.isna(result.loc[0, 'grid'])
+    assert api.count('qualifying') == 0
+
+
+def test_fill_grid_skips_seasons_without_qualifying_in_bulk(api):
+    api.table('1990/results.json', 'RaceTable', 'Races', [race(1990, r, Results=without_grid(r)) for r in (1, 2)])
+    api.table('1990/sprint.json', 'RaceTable', 'Races', [])
+    result = pyergast.get_season_results(1990)
+    assert result['grid'].isna().sum() == 2
+    assert pyergast.get_season_sprints(1990).empty
+    assert api.count('qualifying') == 0
+
+
+def test_fill_grid_keeps_grid_when_qualifying_is_not_published(api):
+    api.add(API + 'current/last/results.json', mrdata('RaceTable', 'Races', [race(2026, 3, Results=without_grid(3))]))
+    api.add(API + 'current/last/qualifying.json', mrdata('RaceTable', 'Races', []))
+    result = pyergast.get_race_result()
+    assert pd.isna(result.loc[0, 'grid'])
+    assert pyergast.get_qualifying_result().empty
+
+
+def test_fill_grid_does_not_hide_bugs():
+    result = pd.DataFrame({'driverID': ['a'], 'grid': [None]})
+
+    def broken():
+        raise TypeError('bug')
+
+    with pytest.raises(TypeError):
+        pyergast.fill_grid(result, broken)
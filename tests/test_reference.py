@@ -0,0 +1,55 @@
+import datetime
+import json
+
+import pytest
+
+import pyergast
+from conftest import driver
+
+
+def stale_index(tmp_path):
+    path = tmp_path / 'drivers.json'
+    path.write_text(json.dumps({'refreshed': 0, 'records': [driver(1)]}))
+    return pyergast.ReferenceIndex('drivers', str(path))
+
+
+def test_refresh_appends_current_season(api, tmp_path):
+    api.table('{}/drivers.json'.format(datetime.date.today().year), 'DriverTable', 'Drivers', [driver(1), driver(2)])
+    index = stale_index(tmp_path).load()
+    assert [record['driverId'] for record in index.records] == ['driver1', 'driver2']
+    assert index.get('driver2')['familyName'] == 'Family2'
+
+
+def test_refresh_keeps_index_when_offline(api, tmp_path):
+    index = stale_index(tmp_path).load()
+    assert [record['driverId'] for record in index.records] == ['driver1']
+    assert index.refreshed == 0
+
+
+def test_refresh_does_not_hide_bugs(api, tmp_path, monkeypatch):
+    monkeypatch.setattr(pyergast.ReferenceIndex, 'fetch', lambda self, year=None: None)
+    with pytest.raises(AttributeError):
+        stale_index(tmp_path).load()
+
+
+def people(*names):
+    return [{'driverId': driver_id, 'givenName': given, 'familyName': family, 'nationality': 'British'}
+            for driver_id, given, family in names]
+
+
+def test_find_driverid_matches_ids(api, monkeypatch):
+    monkeypatch.setattr(pyergast, '_reference_indexes', {})
+    api.table('drivers.json', 'DriverTable', 'Drivers', people(
+        ('collins', 'Peter', 'Collins'), ('gethin', 'Peter', 'Gethin'), ('peterson', 'Ronnie', 'Peterson'),
+        ('peter_walker', 'Peter', 'Walker'), ('hamilton', 'Lewis', 'Hamilton')))
+    assert pyergast.find_driverid('peter', 'collins')['driverId'].tolist() == ['collins', 'peterson', 'peter_walker']
+    # Names still help with misspellings
+    assert pyergast.reference_index('drivers').similar('gethn', limit=1)['driverId'].tolist() == ['gethin']
+
+
+def test_find_constructorid_matches_ids(api, monkeypatch):
+    monkeypatch.setattr(pyergast, '_reference_indexes', {})
+    api.table('constructors.json', 'ConstructorTable', 'Constructors', [
+        {'constructorId': 'lotus_f1', 'name': 'Lotus F1'}, {'constructorId': 'team_lotus', 'name': 'Team Lotus'},
+        {'constructorId': 'caterham', 'name': 'Caterham (ex Lotus)'}])
+    assert pyergast.find_constructorid('Lotus')['constructorId'].tolist() == ['lotus_f1', 'team_lotus']
@@ -0,0 +1,94 @@
+import pytest
+import requests
+
+import pyergast
+from pyergast import retry
+from conftest import API
+
+
+def response(status, headers=None):
+    r = requests.Response()
+    r.status_code = status
+    r.headers.update(headers or {})
+    r.url = API + '2020/3/results.json'
+    return r
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waited = []
+    monkeypatch.setattr(retry.time, 'sleep', waited.append)
+    return waited
+
+
+def test_server_errors_are_retried_then_raised(api, sleeps, monkeypatch):
+    monkeypatch.setattr(pyergast, 'client', pyergast.ErgastClient(retry=retry.RetryPolicy(retries=2, seed=1)))
+    api.add(API + '2020/3/results.json', {}, status=503)
+    with pytest.raises(pyergast.ServerError):
+        pyergast.get_race_result(2020, 3)
+    assert api.count() == 3
+    assert len(sleeps) == 2
+
+
+def test_client_errors_are_not_retried(api, sleeps, monkeypatch):
+    monkeypatch.setattr(pyergast, 'client', pyergast.ErgastClient(retry=retry.RetryPolicy()))
+    api.add(API + '2020/30/results.json', {}, status=404)
+    with pytest.raises(pyergast.ClientError):
+        pyergast.get_race_result(2020, 30)
+    assert api.count() == 1
+
+
+def test_breaker_opens_after_threshold(sleeps):
+    policy = retry.RetryPolicy(retries=0, threshold=2, cooldown=60)
+    for _ in range(2):
+        assert policy.request(API, lambda: response(503)).status_code == 503
+    with pytest.raises(pyergast.CircuitOpen):
+        policy.request(API, lambda: response(200))
+
+
+def test_rate_limiting_does_not_open_breaker(sleeps):
+    policy = retry.RetryPolicy(retries=0, threshold=1)
+    policy.request(API, lambda: response(429))
+    assert policy.breaker(API).state == 'closed'
+
+
+def test_local_errors_do_not_open_breaker(sleeps):
+    policy = retry.RetryPolicy(retries=0, threshold=1)
+
+    def broken():
+        raise requests.exceptions.InvalidURL('bad')
+
+    for _ in range(3):
+        with pytest.raises(requests.exceptions.InvalidURL):
+            policy.request(API, broken)
+    assert policy.breaker(API).state == 'closed'
+    assert policy.request(API, lambda: response(200)).status_code == 200
+
+
+def test_local_error_during_trial_lets_next_request_through(sleeps):
+    policy = retry.RetryPolicy(retries=0, threshold=1, cooldown=0)
+    policy.request(API, lambda: response(503))
+
+    def broken():
+        raise TypeError('bug')
+
+    with pytest.raises(TypeError):
+        policy.request(API, broken)
+    assert policy.request(API, lambda: response(200)).status_code == 200
+    assert policy.breaker(API).state == 'closed'
+
+
+@pytest.mark.parametrize('value', ['0', 'Thu, 01 Jan 1970 00:00:00 GMT'])
+def test_expired_retry_after_backs_off(sleeps, value):
+    policy = retry.RetryPolicy(retries=1, backoff=1.0, seed=3)
+    expected = retry.RetryPolicy(backoff=1.0, seed=3).delay(0)
+    answers = iter([response(429, {'Retry-After': value}), response(200)])
+    assert policy.request(API, lambda: next(answers)).status_code == 200
+    assert sleeps == [expected] and expected > 0
+
+
+def test_retry_after_holds_the_host(sleeps):
+    policy = retry.RetryPolicy(retries=1)
+    answers = iter([response(429, {'Retry-After': '5'}), response(200)])
+    assert policy.request(API, lambda: next(answers)).status_code == 200
+    assert len(sleeps) == 1 and 4 < sleeps[0] <= 5
@@ -0,0 +1,48 @@
+import pyergast
+from conftest import API, driver_standings, mrdata, qualifying, race, results
+
+
+def test_season_results_serve_round_queries(api):
+    api.table('2020/results.json', 'RaceTable', 'Races', [race(2020, r, Results=results(r)) for r in (1, 2)])
+    season = pyergast.get_season_results(2020)
+    assert sorted(set(season.index)) == [1, 2]
+    round_two = pyergast.get_race_result(2020, 2)
+    assert round_two.equals(season.loc[[2]].reset_index(drop=True))
+    assert api.count() == 1
+
+
+def test_season_results_follow_pages(api):
+    races = [race(2020, r, Results=results(r)) for r in (1, 2)]
+    # The API caps the page size at 4 rows
+    api.add(API + '2020/results.json', mrdata('RaceTable', 'Races', races[:1], total=8, limit=4))
+    api.add(API + '2020/results.json', mrdata('RaceTable', 'Races', races[1:], total=8, limit=4, offset=4),
+            limit=4, offset=4)
+    assert len(pyergast.get_season_results(2020)) == 8
+    assert api.count() == 2
+
+
+def test_season_qualifying(api):
+    api.table('2020/qualifying.json', 'RaceTable', 'Races',
+              [race(2020, r, QualifyingResults=qualifying(r)) for r in (1, 2)])
+    assert pyergast.get_season_qualifying(2020).loc[1, 'Q1'].tolist()[0] == '1:30.000'
+
+
+def test_season_standings(api):
+    api.table('2020/driverStandings.json', 'StandingsTable', 'StandingsLists',
+              [{'season': '2020', 'round': '2', 'DriverStandings': driver_standings(2)}], limit=1)
+    for r in (1, 2):
+        api.table('2020/{}/driverStandings.json'.format(r), 'StandingsTable', 'StandingsLists',
+                  [{'season': '2020', 'round': str(r), 'DriverStandings': driver_standings(r)}])
+    standings = pyergast.get_season_standings(2020)
+    assert sorted(set(standings.index)) == [1, 2]
+    assert standings.loc[2, 'points'].tolist()[0] == '102'
+
+
+def test_season_standings_before_first_round(api):
+    api.table('2030/driverStandings.json', 'StandingsTable', 'StandingsLists', [], limit=1)
+    api.table('2030/constructorStandings.json', 'StandingsTable', 'StandingsLists', [], limit=1)
+    drivers = pyergast.get_season_standings(2030)
+    assert drivers.empty and list(drivers.columns) == list(pyergast.DRIVER_STANDINGS_COLUMNS)
+    constructors = pyergast.get_season_standings(2030, constructors=True)
+    assert constructors.empty and list(constructors.columns) == list(pyergast.CONSTRUCTOR_STANDINGS_COLUMNS)
+
@@ -0,0 +1,55 @@
+import sqlite3
+
+import pytest
+
+import pyergast
+from conftest import add_season
+
+pytest.importorskip('pyarrow')
+from pyergast import store  # noqa: E402
+
+
+@pytest.fixture
+def local(api, tmp_path, monkeypatch):
+    monkeypatch.setattr(store, 'local', store.Store(str(tmp_path / 'store')))
+    add_season(api, 2019, 2)
+    store.local.sync([2019])
+    return store.local
+
+
+def test_rows_match_the_query_functions(local):
+    rows = pyergast.sql('SELECT * FROM results WHERE season = ? AND round = ?', (2019, 2))
+    assert rows.drop(columns=['season', 'round']).equals(pyergast.get_race_result(2019, 2, source='local'))
+
+
+def test_numbers_compare_and_add_up(local):
+    podiums = pyergast.sql('SELECT constructor, COUNT(*) AS podiums, SUM(points) AS total FROM results '
+                           'WHERE season >= 2000 AND position <= 3 GROUP BY constructorID ORDER BY constructor')
+    assert podiums['constructor'].tolist() == ['Ferrari', 'McLaren', 'Mercedes', 'Red Bull']
+    assert podiums['podiums'].tolist() == [2, 2, 1, 1]
+    assert podiums['total'].tolist() == [43, 33, 25, 15]
+
+
+def test_typed_results(local):
+    rows = pyergast.sql('SELECT position, points, Time FROM results WHERE season = 2019', typed=True)
+    assert str(rows['position'].dtype) == 'Int16'
+    assert rows['Time.millis'].tolist()[0] == 5400000
+
+
+@pytest.mark.parametrize('column, index', [('driverID', 'results_driver'), ('constructorID', 'results_constructor')])
+def test_queries_use_the_indexes(local, column, index):
+    plan = pyergast.sql('EXPLAIN QUERY PLAN SELECT * FROM results WHERE {} = ?'.format(column), ('mercedes',))
+    assert index in ' '.join(plan['detail'])
+
+
+def test_tables_are_read_only(local):
+    with pytest.raises(sqlite3.OperationalError):
+        pyergast.sql('DELETE FROM results')
+    assert len(pyergast.sql('SELECT * FROM results')) == 8
+
+
+def test_copy_follows_the_store(local):
+    assert len(pyergast.sql('SELECT * FROM results WHERE season = 2019')) == 8
+    frame = local.read('results', {'season': 2019})
+    local.write('results', 2019, frame[frame['round'] == 1], replace=True)
+    assert len(pyergast.sql('SELECT * FROM results WHERE season = 2019')) == 4
@@ -0,0 +1,75 @@
+import pytest
+
+import pyergast
+from conftest import API, add_season, mrdata, qualifying, race, results
+
+pytest.importorskip('pyarrow')
+from pyergast import store  # noqa: E402
+
+
+@pytest.fixture
+def local(api, tmp_path, monkeypatch):
+    monkeypatch.setattr(store, 'local', store.Store(str(tmp_path / 'store')))
+    return store.local
+
+
+def test_sync_writes_every_table(api, local):
+    add_season(api, 2019, 2)
+    summary = local.sync([2019])
+    assert summary[2019] == {'schedule': 2, 'results': 8, 'qualifying': 8, 'driver_standings': 8,
+                             'constructor_standings': 8}
+    assert local.manifest['seasons']['2019']['complete']
+
+
+def test_finished_season_is_not_fetched_again(api, local):
+    add_season(api, 2019, 2)
+    local.sync([2019])
+    sent = api.count()
+    assert local.sync([2019]) == {}
+    assert store.Store(local.path).sync([2019]) == {}
+    assert api.count() == sent
+
+
+def test_resync_fetches_only_new_rounds(api, local):
+    add_season(api, 2019, 3)
+    # Round 3 has no results yet
+    api.table('2019/results.json', 'RaceTable', 'Races', [race(2019, r, Results=results(r)) for r in (1, 2)])
+    api.add(API + '2019/3/results.json', mrdata('RaceTable', 'Races', []))
+    local.sync([2019])
+    assert local.manifest['seasons']['2019']['rounds'] == [1, 2]
+
+    api.table('2019/3/results.json', 'RaceTable', 'Races', [race(2019, 3, Results=results(3))])
+    api.table('2019/3/qualifying.json', 'RaceTable', 'Races', [race(2019, 3, QualifyingResults=qualifying(3))])
+    pyergast.clear_memo()
+    sent = len(api.sent)
+    assert local.sync([2019])[2019]['results'] == 4
+    assert all('/2019.json' in url or '/2019/3/' in url for url in api.sent[sent:])
+    assert local.manifest['seasons']['2019']['complete']
+
+
+def test_added_table_is_backfilled(api, local):
+    add_season(api, 2019, 2)
+    local.sync([2019], tables=['schedule', 'results'])
+    assert local.sync([2019], tables=['qualifying']) == {2019: {'qualifying': 8}}
+
+
+@pytest.mark.parametrize('name, args', [
+    ('get_race_result', (2019, 2)),
+    ('get_season_results', (2019,)),
+    ('get_qualifying_result', (2019, 1)),
+    ('driver_standings', (2019, 2)),
+    ('constructor_standings', (2019,)),
+])
+def test_local_queries_match_the_api(api, local, name, args):
+    add_season(api, 2019, 2)
+    local.sync([2019])
+    query = getattr(pyergast, name)
+    expected = query(*args)
+    if name == 'get_season_results':
+        expected.index = expected.index.astype(int)
+    assert query(*args, source='local').equals(expected)
+
+
+def test_unsynced_season_raises(local):
+    with pytest.raises(store.NotSynced):
+        pyergast.get_race_result(2005, 1, source='local')